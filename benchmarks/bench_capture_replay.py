@@ -0,0 +1,115 @@
+"""
+The position pipeline, headless: PlayerScanner (unchanged) against a
+ReplayCaptureBackend fed with a synthetic recorded session, played back
+faster than real time.
+
+The session is a 1280x720 client area per frame: the deed panel from
+``assets/claim.png`` in the top-left corner, and the compass coordinates
+(rendered like bench_digit_reader) where the scanner looks for them, with
+the avatar walking part of the time. The digit atlas starts empty, as on a
+first run: positions come from the Tesseract fallback until its reads have
+taught the atlas. Reports positions seen vs recorded, frames the scanner
+captured, template vs OCR reads, and the cost of a replay grab; then runs
+one deed scan through HotkeyScannerListener.scan() on the same backend.
+Without Tesseract both OCR paths fail, which is reported.
+
+Run from the repository root:  python -m benchmarks.bench_capture_replay
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import Qt
+
+from benchmarks.bench_digit_reader import _render
+from src.app.signal_bus import SignalBus
+from src.scanner.capture import ClientRect, ReplayCaptureBackend
+from src.scanner.digit_reader import DigitReader
+from src.scanner.player_position_scanner import PlayerScanner, _build_compass_region
+from src.scanner.poll_scheduler import AdaptivePollScheduler
+from src.utils.hotkey_scanner_listener import HotkeyScannerListener
+
+CLIENT_W, CLIENT_H = 1280, 720
+COMPASS = (370, 430)
+FRAMES, FPS, SPEED = 300, 10.0, 10.0  # 30 s nagrania odtwarzane w 3 s
+WALKING = 0.3  # odsetek klatek z nową pozycją
+
+
+def _record(directory: str, rng: np.random.Generator) -> list:
+    template = cv2.imread("assets/coords_template.png", cv2.IMREAD_UNCHANGED)
+    panel = cv2.imread("assets/claim.png")
+    region = _build_compass_region(ClientRect(0, 0, CLIENT_W, CLIENT_H), *COMPASS)
+    x0, y0 = region["left"] + 55, region["top"] + 372
+    lon, lat, positions = 61_234, 80_512, []
+    for i in range(FRAMES):
+        if rng.random() < WALKING:
+            lon += int(rng.integers(1, 4))
+            lat -= int(rng.integers(0, 3))
+        frame = np.full((CLIENT_H, CLIENT_W, 3), 40, np.uint8)
+        frame[: panel.shape[0], : panel.shape[1]] = panel
+        frame[y0:y0 + 47, x0:x0 + 110] = _render(template, lon, lat, rng)
+        cv2.imwrite(os.path.join(directory, f"frame_{i:05}.png"), frame)
+        positions.append((lon, lat))
+    return positions
+
+
+def main() -> None:
+    rng = np.random.default_rng(24)
+    if shutil.which("tesseract") is None:
+        print("tesseract not installed - the OCR fallback cannot read any frame")
+    reader = DigitReader("assets/coords_template.png")  # pusty atlas
+
+    with tempfile.TemporaryDirectory() as directory:
+        positions = _record(directory, rng)
+        capture = ReplayCaptureBackend(directory, fps=FPS, speed=SPEED, loop=False)
+
+        bus = SignalBus()
+        seen = []
+        bus.player_position_parsed.connect(
+            lambda lon, lat: seen.append((lon, lat)),
+            Qt.ConnectionType.DirectConnection,
+        )
+        scanner = PlayerScanner(
+            bus,
+            compass_size=COMPASS,
+            digit_reader=reader,
+            ocr_fallback_interval=0.5 / SPEED,  # domyślne 0.5 s czasu nagrania
+            scheduler=AdaptivePollScheduler(0.01, 0.2, backoff=1.5),
+            capture=capture,
+        )
+        t0 = time.monotonic()
+        scanner.start()
+        while capture.client_rect() is not None:
+            time.sleep(0.05)
+        scanner.stop()
+        scanner._thread.join()
+        elapsed = time.monotonic() - t0
+
+        recorded = len(set(positions))
+        wrong = len(set(seen) - set(positions))
+        print(f"{FRAMES} frames at {FPS:g} fps replayed x{SPEED:g} in {elapsed:.1f} s")
+        print(f"positions: {recorded} recorded, {len(set(seen))} emitted, "
+              f"{wrong} not in the recording")
+        print(f"scanner: {scanner.stats}")
+        print(f"atlas learned from OCR: samples per digit {reader.counts.tolist()}, "
+              f"ready={reader.ready}")
+
+        probe = ReplayCaptureBackend(directory, fps=FPS, speed=SPEED)
+        region = _build_compass_region(probe.client_rect(), *COMPASS)
+        n, t0 = 2000, time.perf_counter()
+        for _ in range(n):
+            probe.grab(region)
+        print(f"replay grab: {(time.perf_counter() - t0) / n * 1e6:.1f} us")
+
+        listener = HotkeyScannerListener(bus, capture=probe)
+        t0 = time.perf_counter()
+        deed = listener.scan()
+        print(f"deed scan via replay: {deed and deed.resource} "
+              f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+FrameChangeDetector on a synthetic compass stream where the avatar stands
+still most of the time: frames skipped, changed positions missed, and the
+cost of the check vs a digit read.
+
+The background is re-rendered with fresh noise every frame (the game world
+moving behind the compass); only the digits decide whether a frame changed.
+
+Run from the repository root:  python -m benchmarks.bench_change_detector
+"""
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.bench_digit_reader import _render
+from src.scanner.change_detector import FrameChangeDetector
+from src.scanner.digit_reader import DigitReader
+
+FRAMES = 2000
+MOVING = 0.1  # odsetek klatek, w których zmienia się pozycja
+
+
+def main() -> None:
+    template = cv2.imread("assets/coords_template.png", cv2.IMREAD_UNCHANGED)
+    rng = np.random.default_rng(19)
+    reader = DigitReader("assets/coords_template.png")
+    for _ in range(40):
+        lon, lat = int(rng.integers(10_000, 99_999)), int(rng.integers(10_000, 99_999))
+        reader.learn(_render(template, lon, lat, rng), lon, lat)
+
+    lon, lat = 61_234, 80_512
+    frames, moved = [], []
+    for _ in range(FRAMES):
+        step = rng.random() < MOVING
+        if step:
+            lon += int(rng.integers(1, 4))
+        frames.append(_render(template, lon, lat, rng))
+        moved.append(step)
+
+    detector = FrameChangeDetector()
+    skipped = missed = reads = 0
+    check_sec = read_sec = 0.0
+    for frame, step in zip(frames, moved, strict=True):
+        t0 = time.perf_counter()
+        changed = detector.changed(frame)
+        check_sec += time.perf_counter() - t0
+        if not changed:
+            skipped += 1
+            missed += step
+            continue
+        t0 = time.perf_counter()
+        reading = reader.read(frame)
+        read_sec += time.perf_counter() - t0
+        reads += 1
+        if reading is not None:
+            detector.accept()
+
+    print(f"{FRAMES} frames, {sum(moved)} with a new position")
+    print(f"skipped {skipped} ({100 * skipped / FRAMES:.0f}%), read {reads}, "
+          f"missed position changes {missed}")
+    print(f"change check {check_sec / FRAMES * 1e6:.0f} us/frame, "
+          f"digit read {read_sec / max(reads, 1) * 1e6:.0f} us/read")
+    print(f"recognition time: {(check_sec + read_sec) * 1000:.0f} ms with the check vs "
+          f"{read_sec / max(reads, 1) * FRAMES * 1000:.0f} ms reading every frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Backward chat.log backfill over a large synthetic log: scan speed for a
+window covering the whole file and for a 2 h window at the end.
+
+Run from the repository root:  python -m benchmarks.bench_chat_backfill
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.chat_logger.backfill import iter_channel_lines_backward
+
+LOG_MB = 200
+SYSTEM_EVERY = 25
+SPAN = timedelta(days=30)
+
+
+def _write_log(path: str) -> "tuple[datetime, int]":
+    line_bytes = 92  # średnia długość linii poniżej
+    count = LOG_MB * 2**20 // line_bytes
+    start = datetime(2025, 1, 1)
+    step = SPAN / count
+    systems = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        batch = []
+        for i in range(count):
+            stamp = (start + step * i).strftime("%Y-%m-%d %H:%M:%S")
+            if i % SYSTEM_EVERY == 0:
+                batch.append(f"{stamp} [System] [] This resource is depleted\n")
+                systems += 1
+            else:
+                batch.append(
+                    f"{stamp} [Rookie] [Some Avatar] selling Lysterium Stone, "
+                    f"good price, pm me {i}\n"
+                )
+            if len(batch) == 50_000:
+                f.write("".join(batch))
+                batch.clear()
+        f.write("".join(batch))
+    return start + SPAN, systems
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "chat.log")
+        newest, systems = _write_log(path)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"synthetic chat.log: {size_mb:.0f} MB, {systems} [System] lines")
+        print(f"{'window':<16}{'lines':>10}{'scanned MB':>12}{'ms':>10}{'MB/s':>10}")
+
+        windows = (("whole file", SPAN * 2), ("last 2 h", timedelta(hours=2)))
+        for name, window in windows:
+            since = newest - window
+            t0 = time.perf_counter()
+            found = sum(1 for _ in iter_channel_lines_backward(path, since))
+            elapsed = time.perf_counter() - t0
+            scanned = min(size_mb, size_mb * window / SPAN)
+            print(
+                f"{name:<16}{found:>10}{scanned:>12.1f}"
+                f"{elapsed * 1000:>10.1f}{scanned / elapsed:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Chat log tailing: drain throughput of the old readline loop vs the block
+tailer, end-to-end lag at a steady write rate, and truncation/rotation.
+
+Run from the repository root:  python -m benchmarks.bench_chat_tailer
+"""
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal
+
+from src.app.signal_bus import SignalBus
+from src.chat_logger.log_listener import ChatLogListener
+
+DRAIN_LINES = 200_000
+RATE_LINES_PER_SEC = 5_000
+RATE_SECONDS = 2.0
+SYSTEM_EVERY = 10  # co dziesiąta linia to [System]
+
+
+def _line(i: int, stamp: float = 0.0) -> str:
+    channel = "System" if i % SYSTEM_EVERY == 0 else "Rookie"
+    return (
+        f"2025-01-01 12:00:00 [{channel}] [] line {i} t={stamp:.6f} "
+        f"You received Lysterium Stone x (12) Value: 0.12 PED\n"
+    )
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.lines = 0
+        self.batches = 0
+        self.lags: List[float] = []
+        self.last: List[str] = []
+
+    def __call__(self, lines: List[str], replayed: bool = False) -> None:
+        now = time.perf_counter()
+        self.batches += 1
+        self.lines += len(lines)
+        self.last = lines
+        for text in lines[:: max(1, len(lines) // 16)]:
+            stamp = float(text.split("t=")[1].split()[0])
+            if stamp:
+                self.lags.append(now - stamp)
+
+
+def _pump(seconds: float, until: Callable[[], bool] = lambda: False) -> None:
+    # sygnały z wątku listenera są kolejkowane do wątku GUI (jak w aplikacji)
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end and not until():
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+
+
+def _start(path: str) -> "tuple[ChatLogListener, _Counter]":
+    bus = SignalBus()
+    counter = _Counter()
+    bus.system_events.connect(counter)
+    listener = ChatLogListener(bus, path)
+    listener.start()
+    _pump(0.2)  # listener otwiera plik i ustawia się na końcu
+    return listener, counter
+
+
+class _LegacyBus(QObject):
+    system_event = pyqtSignal(str)
+
+
+def _legacy_reader(path: str, bus: _LegacyBus, expected: int) -> None:
+    # stara pętla: readline + regex + osobny emit między wątkami na każdą linię
+    regex = re.compile(
+        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \[(?P<channel>\S+)\] .+$"
+    )
+    seen = 0
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        while seen < expected:
+            line = f.readline()
+            if not line:
+                time.sleep(0.1)
+                continue
+            m = regex.search(line)
+            if m and m.group("channel").lower() == "system":
+                bus.system_event.emit(line.strip())
+                seen += 1
+
+
+def _legacy_drain(path: str, expected: int) -> float:
+    bus = _LegacyBus()
+    received = [0]
+    bus.system_event.connect(lambda _: received.__setitem__(0, received[0] + 1))
+    t0 = time.perf_counter()
+    reader = threading.Thread(target=_legacy_reader, args=(path, bus, expected))
+    reader.start()
+    _pump(120, lambda: received[0] >= expected)
+    reader.join()
+    return time.perf_counter() - t0
+
+
+def _write_steady(path: str, total: int) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        start = time.perf_counter()
+        for i in range(total):
+            target = start + i / RATE_LINES_PER_SEC
+            while time.perf_counter() < target:
+                time.sleep(0.0005)
+            f.write(_line(i, time.perf_counter()))
+            f.flush()
+
+
+def main() -> None:
+    app = QCoreApplication(sys.argv)  # noqa: F841 - event loop for queued signals
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "chat.log")
+        payload = "".join(_line(i) for i in range(DRAIN_LINES))
+        expected = len(range(0, DRAIN_LINES, SYSTEM_EVERY))
+        mb = len(payload.encode()) / 2**20
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        legacy = _legacy_drain(path, expected)
+
+        open(path, "w").close()
+        listener, counter = _start(path)
+        t0 = time.perf_counter()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(payload)
+        _pump(60, lambda: counter.lines >= expected)
+        tailer = time.perf_counter() - t0
+
+        print(f"drain {DRAIN_LINES} lines ({mb:.1f} MB), {expected} [System]")
+        print(f"{'reader':<22}{'lines/s':>14}{'MB/s':>9}{'signals':>10}")
+        print(f"{'readline loop (old)':<22}{DRAIN_LINES / legacy:>14.0f}"
+              f"{mb / legacy:>9.1f}{expected:>10}")
+        print(f"{'block tailer':<22}{DRAIN_LINES / tailer:>14.0f}"
+              f"{mb / tailer:>9.1f}{counter.batches:>10}")
+
+        # stałe tempo zapisu, opóźnienie od zapisu do sygnału
+        counter.lags.clear()
+        counter.lines = 0
+        total = int(RATE_LINES_PER_SEC * RATE_SECONDS)
+        writer = threading.Thread(target=_write_steady, args=(path, total))
+        writer.start()
+        _pump(RATE_SECONDS + 0.5, lambda: not writer.is_alive())
+        _pump(0.5)
+        lags = sorted(counter.lags)
+        print()
+        print(f"steady {RATE_LINES_PER_SEC} lines/s for {RATE_SECONDS:.0f} s: "
+              f"{counter.lines}/{total // SYSTEM_EVERY} [System] delivered, "
+              f"lag median {lags[len(lags) // 2] * 1000:.1f} ms, "
+              f"p99 {lags[int(len(lags) * 0.99)] * 1000:.1f} ms")
+
+        # obcięcie i rotacja
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_line(0))
+        _pump(0.3)
+        truncated_ok = counter.last and "line 0 " in counter.last[-1]
+        os.replace(path, path + ".1")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_line(10))
+        _pump(0.3)
+        rotated_ok = counter.last and "line 10 " in counter.last[-1]
+        print(f"truncation handled: {bool(truncated_ok)}, "
+              f"rotation handled: {bool(rotated_ok)}")
+        listener.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# python
+"""
+Coverage analytics on the largest planet with a long survey history:
+covered fraction (whole map / viewport), first gap search and the
+incremental update after one brush stroke. A frame at 60 Hz is 16.7 ms.
+
+Run from the repository root:  python -m benchmarks.bench_coverage_analytics
+"""
+import os
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.bench_coverage_layer import HISTORY_UPDATES, _walk
+from src.app.config_loader import load_config
+from src.map.coverage_analytics import CoverageAnalytics
+from src.map.coverage_store import CoverageStore
+from src.map.map_utils import PlanetGeometry
+
+REPEATS = 50
+
+
+def _ms(fn: Callable[[], object], repeats: int = REPEATS) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats * 1000
+
+
+def main() -> None:
+    config = load_config("config/default.yaml")
+    cov = config["coverage"]
+    planet, planet_config = max(
+        config["planets"].items(),
+        key=lambda p: p[1]["tile_count_x"] * p[1]["tile_count_y"],
+    )
+    geometry = PlanetGeometry.from_config(config, planet)
+    width, height = geometry.map_width, geometry.map_height
+    radius = cov["brush_radius_px"]
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        store = CoverageStore(
+            os.path.join(store_dir, f"{planet}.cov"),
+            width,
+            height,
+            cell_px=cov["cell_px"],
+        )
+        path = _walk(width, height, HISTORY_UPDATES)
+        for pos in path:
+            store.mark_disc(pos.x(), pos.y(), radius)
+        analytics = CoverageAnalytics(store, geometry, analysis_px=cov["analysis_px"])
+
+        t0 = time.perf_counter()
+        gaps = analytics.largest_gaps(cov["gap_count"], cov["gap_min_radius_px"])
+        first = (time.perf_counter() - t0) * 1000
+
+        def stroke() -> None:
+            store.mark_disc(path[-1].x() + 3, path[-1].y(), radius)
+            analytics.mark_dirty(path[-1].x() + 3, path[-1].y(), radius)
+            analytics.largest_gaps(cov["gap_count"], cov["gap_min_radius_px"])
+
+        cx, cy = width / 2, height / 2
+        print(f"{planet}: {width}x{height} px, {HISTORY_UPDATES} strokes of history")
+        print(f"{'operation':<36}{'ms':>10}")
+        for name, elapsed in (
+            (
+                "covered fraction, whole map",
+                _ms(lambda: analytics.covered_fraction_scene(0, 0, width, height)),
+            ),
+            (
+                "covered fraction, 800x600 view",
+                _ms(
+                    lambda: analytics.covered_fraction_scene(
+                        cx - 400, cy - 300, cx + 400, cy + 300
+                    )
+                ),
+            ),
+            ("first gap search (builds grid)", first),
+            ("stroke + incremental gap search", _ms(stroke)),
+        ):
+            print(f"{name:<36}{elapsed:>10.2f}")
+        print()
+        for gap in gaps:
+            print(
+                f"gap at {gap.lon:.0f}, {gap.lat:.0f}  "
+                f"r={gap.radius_coord:.0f} ({gap.radius_px:.0f} px)"
+            )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
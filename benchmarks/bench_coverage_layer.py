@@ -0,0 +1,136 @@
+# python
+"""
+Coverage overlay on the largest planet: updates/sec of one full-map image
+re-uploaded per update (old MapWindow path) vs the tiled CoverageLayer, and
+size/reload time of a CoverageStore holding a long survey history.
+
+Run from the repository root:  python -m benchmarks.bench_coverage_layer
+"""
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QGraphicsPixmapItem, QGraphicsScene
+
+from src.app.config_loader import load_config
+from src.map.coverage_layer import CoverageLayer
+from src.map.coverage_store import CoverageStore
+
+UPDATES = 200
+HISTORY_UPDATES = 100_000  # ~ kilka tygodni odczytów pozycji
+VIEWPORT = QRectF(0, 0, 800, 600)
+BRUSH_COLOR = QColor(32, 160, 255, 110)
+
+
+def _walk(width: int, height: int, steps: int) -> List[QPointF]:
+    # trasa gracza: krótkie kroki po mapie jak przy kolejnych odczytach kompasu
+    rng = random.Random(7)
+    x, y = width / 2, height / 2
+    path = []
+    for _ in range(steps):
+        angle = rng.uniform(0, 2 * math.pi)
+        x = min(width - 1, max(0, x + math.cos(angle) * 12))
+        y = min(height - 1, max(0, y + math.sin(angle) * 12))
+        path.append(QPointF(x, y))
+    return path
+
+
+def _full_image(width: int, height: int, path: List[QPointF], radius: int) -> float:
+    scene = QGraphicsScene()
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+    scene.addItem(item)
+
+    t0 = time.perf_counter()
+    for pos in path:
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(BRUSH_COLOR)
+        painter.drawEllipse(pos, radius, radius)
+        painter.end()
+        item.setPixmap(QPixmap.fromImage(image))
+    return time.perf_counter() - t0
+
+
+def _tiled(
+    store: CoverageStore, path: List[QPointF], radius: int, tile_size: int
+) -> float:
+    scene = QGraphicsScene()
+    width, height = store.cols * store.cell_px, store.rows * store.cell_px
+    layer = CoverageLayer(store, width, height, tile_size=tile_size)
+    layer.attach(scene)
+
+    t0 = time.perf_counter()
+    for pos in path:
+        layer.paint(pos, radius)
+    return time.perf_counter() - t0
+
+
+def _reload(
+    path: str, width: int, height: int, cell_px: int, tile_size: int
+) -> float:
+    # otwarcie zapisanej historii + narysowanie kafli w widoku
+    t0 = time.perf_counter()
+    store = CoverageStore(path, width, height, cell_px=cell_px)
+    layer = CoverageLayer(store, width, height, tile_size=tile_size)
+    layer.attach(QGraphicsScene())
+    layer.update_visible(VIEWPORT.translated(width / 2 - 400, height / 2 - 300))
+    elapsed = time.perf_counter() - t0
+    store.close()
+    return elapsed
+
+
+def main() -> None:
+    app = QApplication(sys.argv)  # noqa: F841 - QPixmap needs an application
+    config = load_config("config/default.yaml")
+    tile_size = config["map"]["tile_size"]
+    radius = config["coverage"]["brush_radius_px"]
+    cov_tile = config["coverage"]["tile_size"]
+    cell_px = config["coverage"]["cell_px"]
+
+    planet, planet_config = max(
+        config["planets"].items(),
+        key=lambda p: p[1]["tile_count_x"] * p[1]["tile_count_y"],
+    )
+    width = planet_config["tile_count_x"] * tile_size
+    height = planet_config["tile_count_y"] * tile_size
+    path = _walk(width, height, UPDATES)
+
+    print(f"{planet}: {width}x{height} px, brush {radius} px, {UPDATES} updates")
+    print(f"{'method':<28}{'updates/s':>12}{'ms/update':>12}")
+    with tempfile.TemporaryDirectory() as store_dir:
+        store_path = os.path.join(store_dir, f"{planet}.cov")
+        store = CoverageStore(store_path, width, height, cell_px=cell_px)
+        for name, elapsed in (
+            ("full-map pixmap", _full_image(width, height, path, radius)),
+            (f"tiled ({cov_tile} px)", _tiled(store, path, radius, cov_tile)),
+        ):
+            print(
+                f"{name:<28}{UPDATES / elapsed:>12.1f}"
+                f"{elapsed / UPDATES * 1000:>12.2f}"
+            )
+
+        for pos in _walk(width, height, HISTORY_UPDATES):
+            store.mark_disc(pos.x(), pos.y(), radius)
+        covered = int(store.cells(0, 0, store.cols, store.rows).sum())
+        store.close()
+
+        argb_mb = width * height * 4 / 2**20
+        disk_kb = os.path.getsize(store_path) / 1024
+        print()
+        print(f"history: {HISTORY_UPDATES} updates, {covered} cells covered")
+        print(f"ARGB image {argb_mb:.1f} MB vs store {disk_kb:.0f} KB on disk/mapped")
+        reload = _reload(store_path, width, height, cell_px, cov_tile)
+        print(f"reload + render viewport: {reload * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+DeedScanCache on variants of the deed panel in ``assets/claim.png``:
+
+- repeat:  the same panel with the "Time left" value ticking (must hit),
+- other:   another depth (one or more digits) and time left (must miss),
+
+each with a little capture noise. Both values are redrawn in every variant,
+so a changed depth differs from the cached one only by its digits.
+
+Reports hits/misses, wrong answers and the cost of a lookup; a miss costs a
+full OCR on top (see bench_deed_profiles / bench_ocr_engine for that part).
+
+Run from the repository root:  python -m benchmarks.bench_deed_cache
+"""
+import time
+
+import cv2
+import numpy as np
+
+from src.models.deed_model import DeedModel
+from src.scanner.deed_cache import DeedScanCache
+from src.scanner.ocr_core import DEFAULT_INNER
+
+TEXT = (
+    "Depth: 501 m\nSize: Large (12)\nResource: Alternative Rock\n"
+    "Time left: 08:06:29\nPosition: Rocktropia (132047,\n88148, 191)"
+)
+# Wartości w ROI: (wiersz bazowy tekstu, kolumna startowa) – zmierzone na claim.png
+TIME_AT, DEPTH_AT = (88, 353), (14, 367)
+BLANK_COLS = (200, 260)  # pusty fragment wiersza, którym zamazujemy starą wartość
+ROUNDS = 200
+
+
+def _put(roi: np.ndarray, at, text: str) -> None:
+    baseline, x = at
+    top = baseline - 13
+    width = roi.shape[1] - x - 2
+    patch = roi[top:baseline + 2, BLANK_COLS[0]:BLANK_COLS[1]]
+    roi[top:baseline + 2, x:x + width] = cv2.resize(patch, (width, patch.shape[0]))
+    cv2.putText(roi, text, (x, baseline), cv2.FONT_HERSHEY_SIMPLEX, 0.42,
+                (235, 235, 235), 1, cv2.LINE_AA)
+
+
+def _variant(base: np.ndarray, rng, seconds: int, depth: int = 501) -> np.ndarray:
+    roi = base.copy()
+    _put(roi, TIME_AT, f"08:{seconds // 60:02}:{seconds % 60:02}")
+    _put(roi, DEPTH_AT, f"{depth} m")
+    noise = rng.integers(-2, 3, roi.shape)
+    return np.clip(roi.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def main() -> None:
+    corner = cv2.imread("assets/claim.png")
+    x, y, w, h = (DEFAULT_INNER[k] for k in ("x", "y", "w", "h"))
+    base = corner[y:y + h, x:x + w]
+    rng = np.random.default_rng(23)
+
+    cache = DeedScanCache()
+    first = _variant(base, rng, 389)
+    cache.store(first, DeedModel(raw=TEXT, depth_m=501), TEXT)
+
+    wrong_hits = missed_repeats = 0
+    hit_sec = miss_sec = 0.0
+    for i in range(ROUNDS):
+        repeat = i % 2 == 0
+        seconds = 389 - int(rng.integers(1, 120))
+        depth = 501 if repeat else int(rng.choice([502, 500, 591, 511, 301]))
+        roi = _variant(base, rng, seconds, depth)
+        t0 = time.perf_counter()
+        deed = cache.lookup(roi)
+        elapsed = time.perf_counter() - t0
+        if deed is not None:
+            hit_sec += elapsed
+            wrong_hits += not repeat
+        else:
+            miss_sec += elapsed
+            missed_repeats += repeat
+
+    stats = cache.stats
+    print(f"{ROUNDS} scans, half repeats of the cached panel")
+    print(f"hits {stats['hits']}, misses {stats['misses']}; "
+          f"repeats missed {missed_repeats}, other deeds returned {wrong_hits}")
+    print(f"lookup: hit {hit_sec / max(stats['hits'], 1) * 1000:.2f} ms, "
+          f"miss {miss_sec / max(stats['misses'], 1) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# python
+"""
+CPU time per simulated minute with 500 live deeds: the old 1 s full sweep vs the
+heap-driven DeedMarkerService (label resolution 1 s and 60 s).
+
+Run from the repository root:  python -m benchmarks.bench_deed_expiry
+"""
+import sys
+import time
+from array import array
+from typing import List
+from unittest import mock
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.app.config_loader import load_config
+from src.app.signal_bus import SignalBus
+from src.models.deed_model import DeedModel, DeedTicks
+from src.services.map_deed_service import DeedMarkerService, MarkerData
+
+N_DEEDS = 500
+SECONDS = 60
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _deeds(clock: FakeClock) -> List[DeedModel]:
+    return [
+        DeedModel(
+            raw="",
+            x=122880 + (i % 50) * 300,
+            y=81920 + (i // 50) * 300,
+            expire_monotonic=clock.now + 3600 + i * 7.3,
+        )
+        for i in range(N_DEEDS)
+    ]
+
+
+def _legacy_minute(bus: SignalBus, clock: FakeClock) -> float:
+    markers = [MarkerData(str(i), None, 0.2, d) for i, d in enumerate(_deeds(clock))]
+    t0 = time.process_time()
+    for _ in range(SECONDS):
+        clock.now += 1.0
+        # dawne DeedMarkerService.tick_deeds
+        alive = []
+        for marker in markers:
+            if (marker.deed.ttl_sec or 0) <= 0:
+                bus.deed_marker_removed.emit(marker.marker_id)
+                continue
+            bus.deed_markers_ticked.emit(
+                DeedTicks([marker.marker_id], array("i", [marker.deed.ttl_sec]))
+            )
+            alive.append(marker)
+        markers = alive
+    return time.process_time() - t0
+
+
+def _heap_minute(bus: SignalBus, clock: FakeClock, resolution: int) -> float:
+    config = load_config("config/default.yaml")
+    config["map"]["planet"] = "Calypso"
+    config["deeds"]["label_resolution_sec"] = resolution
+    service = DeedMarkerService(bus, config)
+    for deed in _deeds(clock):
+        service._on_scan_result(deed)
+
+    t0 = time.process_time()
+    for _ in range(SECONDS * 10):
+        clock.now += 0.1
+        # to, co zrobiłyby timery single-shot w pętli zdarzeń
+        if (service._labels.next_deadline(service._is_live) or 1e18) <= clock.now:
+            service._on_labels_due()
+        if (service._expiry.next_deadline(service._is_live) or 1e18) <= clock.now:
+            service._on_expiry_due()
+    return time.process_time() - t0
+
+
+def main() -> None:
+    app = QCoreApplication(sys.argv)  # noqa: F841 - QTimer needs an application
+    bus = SignalBus()
+    ticks = [0]
+
+    def count(batch: DeedTicks) -> None:
+        ticks[0] += len(batch.marker_ids)
+
+    bus.deed_markers_ticked.connect(count)
+
+    clock = FakeClock()
+    with mock.patch("time.monotonic", clock):
+        for label, run in (
+            ("1 s sweep (old)", lambda: _legacy_minute(bus, clock)),
+            ("heap, labels 1 s", lambda: _heap_minute(bus, clock, 1)),
+            ("heap, labels 60 s", lambda: _heap_minute(bus, clock, 60)),
+        ):
+            ticks[0] = 0
+            cpu = run()
+            print(
+                f"{label:<20}{cpu * 1000:8.1f} ms CPU / min   "
+                f"{ticks[0]:6d} label signals / min"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Deed panel OCR latency on ``assets/claim.png``: the old order (both profiles
+one after the other, longest text wins) vs the profiles run concurrently and
+scored by filled ``DeedModel`` fields, returning on the first complete parse.
+
+Needs Tesseract (tesserocr or pytesseract + the tesseract binary); without it
+the run is reported and skipped.
+
+Run from the repository root:  python -m benchmarks.bench_deed_profiles
+"""
+import time
+from typing import List, Optional
+
+import cv2
+
+from src.scanner.ocr_core import (
+    DEFAULT_INNER,
+    PROFILE_BLOCK_ALT,
+    PROFILE_DEED,
+    ocr_text_block,
+    preprocess_deed,
+)
+from src.scanner.ocr_engine import configure_ocr
+from src.scanner.parser import DEED_FIELDS, deed_field_count, parse_deed_text
+
+ROUNDS = 10
+PROFILES = (PROFILE_DEED, PROFILE_BLOCK_ALT)
+
+
+def _score(text: str) -> int:
+    return deed_field_count(parse_deed_text(text))
+
+
+def _run(pool_size: int, target: Optional[int], score) -> List[float]:
+    configure_ocr(size=pool_size)
+    corner = cv2.imread("assets/claim.png")
+    x, y, w, h = (DEFAULT_INNER[k] for k in ("x", "y", "w", "h"))
+    gray = preprocess_deed(corner[y:y + h, x:x + w])
+    ocr_text_block(gray, PROFILES, score=score, target=target)  # rozgrzewka
+    times, fields = [], []
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        text = ocr_text_block(gray, PROFILES, score=score, target=target)
+        times.append(time.perf_counter() - t0)
+        fields.append(_score(text))
+        time.sleep(1.0)  # odczyt anulowanego profilu kończy się w tle
+    print(f"  fields filled: min {min(fields)}, max {max(fields)} "
+          f"of {len(DEED_FIELDS)}")
+    return times
+
+
+def main() -> None:
+    modes = [
+        ("sequential, longest text", 1, None, len),
+        ("concurrent, early exit", len(PROFILES), len(DEED_FIELDS), _score),
+    ]
+    results = []
+    for name, pool_size, target, score in modes:
+        print(name)
+        try:
+            times = _run(pool_size, target, score)
+        except Exception as e:  # brak tesseracta
+            print(f"  skipped: {type(e).__name__}: {e}")
+            continue
+        times.sort()
+        results.append((name, times))
+    for name, times in results:
+        print(f"{name:<26} median {times[len(times) // 2] * 1000:7.1f} ms  "
+              f"max {times[-1] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+DigitReader on synthetic compass crops: atlas training from known reads,
+then accuracy and latency of template reads. When Tesseract is installed the
+two-pass OCR path is timed on the same crops for comparison.
+
+The crops use the real "Lon:"/"Lat:" labels from assets/coords_template.png
+and digits drawn with an OpenCV font on a noisy dark background.
+
+Run from the repository root:  python -m benchmarks.bench_digit_reader
+"""
+import shutil
+import time
+
+import cv2
+import numpy as np
+
+from src.scanner.digit_reader import DigitReader
+
+TRAIN = 40
+READS = 1000
+ROI_W, ROI_H = 110, 47  # wycinek z PlayerScanner._worker
+
+
+def _render(
+    template: np.ndarray, lon: int, lat: int, rng: np.random.Generator
+) -> np.ndarray:
+    noise = rng.integers(10, 70, (ROI_H, ROI_W, 3), dtype=np.uint8)
+    roi = cv2.GaussianBlur(noise, (5, 5), 0)
+    h, w = template.shape[:2]
+    alpha = template[:, :, 3:4].astype(np.float32) / 255
+    blended = roi[:h, :w] * (1 - alpha) + template[:, :, :3] * alpha
+    roi[:h, :w] = blended.astype(np.uint8)
+    for text, baseline in ((str(lon), 17), (str(lat), 42)):
+        cv2.putText(
+            roi, text, (44, baseline), cv2.FONT_HERSHEY_SIMPLEX, 0.45,
+            (235, 235, 235), 1, cv2.LINE_AA,
+        )
+    return roi
+
+
+def _coords(rng: np.random.Generator) -> "tuple[int, int]":
+    return int(rng.integers(10_000, 999_999)), int(rng.integers(10_000, 999_999))
+
+
+def main() -> None:
+    template = cv2.imread("assets/coords_template.png", cv2.IMREAD_UNCHANGED)
+    rng = np.random.default_rng(18)
+    reader = DigitReader("assets/coords_template.png")
+
+    learned = 0
+    for _ in range(TRAIN):
+        lon, lat = _coords(rng)
+        learned += reader.learn(_render(template, lon, lat, rng), lon, lat)
+    print(f"atlas: {learned}/{TRAIN} training reads used, samples per digit "
+          f"{reader.counts.tolist()}, ready={reader.ready}")
+
+    samples = [_coords(rng) for _ in range(READS)]
+    crops = [_render(template, lon, lat, rng) for lon, lat in samples]
+    correct = wrong = unsure = 0
+    t0 = time.perf_counter()
+    readings = [reader.read(crop) for crop in crops]
+    elapsed = time.perf_counter() - t0
+    for (lon, lat), reading in zip(samples, readings, strict=True):
+        if reading is None:
+            unsure += 1
+        elif (reading.lon, reading.lat) == (lon, lat):
+            correct += 1
+        else:
+            wrong += 1
+    print(f"template reads: {elapsed / READS * 1000:.3f} ms/read, "
+          f"{correct} correct, {wrong} wrong, {unsure} left to the OCR fallback")
+
+    if shutil.which("tesseract") is None:
+        print("tesseract not installed - OCR comparison skipped")
+        return
+    import pytesseract
+
+    from src.scanner.ocr_core import CFG_BLOCK, CFG_BLOCK_ALT
+
+    count = 20
+    t0 = time.perf_counter()
+    for crop in crops[:count]:
+        big = cv2.resize(crop, None, fx=3, fy=3, interpolation=cv2.INTER_LINEAR)
+        pytesseract.image_to_string(big, config=CFG_BLOCK)
+        pytesseract.image_to_string(big, config=CFG_BLOCK_ALT)
+    per_read = (time.perf_counter() - t0) / count * 1000
+    print(f"tesseract (2 passes): {per_read:.1f} ms/read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+EventClassifier throughput with the default table and with 50+ registered
+patterns: prefix-trie dispatch vs trying each compiled pattern in turn (the
+shape of an if-chain). Both cut the log-line prefix off at its fixed offset
+and return the same SystemEvent, so they do the same work per matched line.
+
+Run from the repository root:  python -m benchmarks.bench_event_classifier
+"""
+import random
+import re
+import time
+
+from src.models.chat_event_model import SystemEvent
+from src.services.event_classifier import DEFAULT_PATTERNS, EventClassifier
+
+LINES = 300_000
+EXTRA = 45  # dodatkowe wzorce ponad domyślne
+
+
+def _extra_patterns():
+    return [
+        (
+            f"custom_{i}",
+            rf"Custom event {i:02d} for (?P<resource>.+?) x (?P<amount>\d+)",
+            False,
+        )
+        for i in range(EXTRA)
+    ]
+
+
+def _lines():
+    rng = random.Random(5)
+    prefix = "2025-01-01 12:00:00 [System] [] "
+    samples = [
+        "You have claimed a resource! (Lysterium Stone)",
+        "This resource is depleted",
+        "You received Lysterium Stone x (12) Value: 1.2000 PED",
+        "You received Shrapnel x (1234) Value: 0.1234 PED",
+        "You have gained 0.1234 experience in your Mining skill",
+        "You inflicted 34.5 points of damage",
+        "You took 12.1 points of damage",
+        "Custom event 44 for Belkar Stone x 3",
+        "The target evaded your attack",
+        "Item(s) repaired successfully",
+    ]
+    return [prefix + rng.choice(samples) for _ in range(LINES)]
+
+
+def _chain(patterns):
+    compiled = [
+        (event_type, re.compile(pattern, re.I if ignore_case else 0))
+        for event_type, pattern, ignore_case in patterns
+    ]
+    prefix = len("2025-01-01 12:00:00 [System] [] ")
+
+    def classify(text):
+        message = text[prefix:]
+        for event_type, regex in compiled:
+            m = regex.match(message)
+            if m:
+                fields = m.groupdict()
+                resource = fields.get("resource")
+                return SystemEvent(
+                    event_type,
+                    resource.strip() or None if resource else None,
+                    _number(fields.get("amount")),
+                    _number(fields.get("value")),
+                )
+        return None
+
+    return classify
+
+
+def _number(text):
+    try:
+        return float(text) if text else None
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    lines = _lines()
+    print(f"{'patterns':>8}  {'classifier':<24}{'lines/s':>12}{'matched':>10}")
+    for patterns in (DEFAULT_PATTERNS, DEFAULT_PATTERNS + _extra_patterns()):
+        classifier = EventClassifier()
+        for event_type, pattern, ignore_case in patterns:
+            classifier.register(event_type, pattern, ignore_case=ignore_case)
+        for name, classify in (
+            ("pattern by pattern", _chain(patterns)),
+            ("prefix-trie dispatch", classifier.classify),
+        ):
+            t0 = time.perf_counter()
+            matched = sum(1 for line in lines if classify(line) is not None)
+            elapsed = time.perf_counter() - t0
+            print(
+                f"{len(patterns):>8}  {name:<24}"
+                f"{LINES / elapsed:>12,.0f}{matched:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
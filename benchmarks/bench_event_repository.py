@@ -0,0 +1,86 @@
+"""
+EventRepository with a few million events: batched insert rate and the
+latency of typical aggregate queries.
+
+Run from the repository root:  python -m benchmarks.bench_event_repository
+"""
+import os
+import random
+import tempfile
+import time
+
+from src.models.chat_event_model import ChatEvent
+from src.repositories.event_repository import EventRepository
+
+EVENTS = 2_000_000
+BATCH = 5000
+SPAN_SEC = 90 * 24 * 3600
+RESOURCES = [
+    "Lysterium Stone", "Belkar Stone", "Caldorite Stone", "Alicenies Liquid",
+    "Oil", "Blausariam Stone", "Narcanisum", "Zinc Stone", "Iron Stone", "Erionite",
+]
+
+
+def _events(now: int):
+    rng = random.Random(3)
+    for i in range(EVENTS):
+        ts = now - SPAN_SEC + i * SPAN_SEC // EVENTS
+        roll = rng.random()
+        if roll < 0.2:
+            resource = rng.choice(RESOURCES)
+            yield ChatEvent(ts, "System", "resource_claimed", resource,
+                            f"You have claimed a resource! ({resource})")
+        elif roll < 0.4:
+            yield ChatEvent(ts, "System", "resource_depleted", None,
+                            "This resource is depleted")
+        else:
+            yield ChatEvent(ts, "System", "system", None,
+                            "You received Shrapnel x (12)")
+
+
+def main() -> None:
+    now = int(time.time())
+    with tempfile.TemporaryDirectory() as folder:
+        repo = EventRepository(os.path.join(folder, "events.sqlite3"))
+
+        t0 = time.perf_counter()
+        batch = []
+        for event in _events(now):
+            batch.append(event)
+            if len(batch) == BATCH:
+                repo.append(batch, "chat.log", "fp", len(batch))
+                batch = []
+        repo.append(batch, "chat.log", "fp", 0)
+        insert = time.perf_counter() - t0
+        print(f"insert {EVENTS} events in batches of {BATCH}: "
+              f"{insert:.1f} s ({EVENTS / insert:,.0f} events/s)")
+
+        week = now - 7 * 86_400
+        queries = (
+            ("Lysterium claims, last 10 h",
+             lambda: repo.count("resource_claimed", "Lysterium Stone",
+                                since=now - 36_000)),
+            ("Lysterium claims, all time",
+             lambda: repo.count("resource_claimed", "Lysterium Stone")),
+            ("depletions, last 24 h",
+             lambda: repo.count("resource_depleted", since=now - 86_400)),
+            ("claims per resource, last 7 days",
+             lambda: repo.counts_by_resource("resource_claimed", since=week)),
+            ("claims per hour, last 7 days",
+             lambda: repo.counts_by_bucket("resource_claimed", 3600, since=week)),
+            ("claims per resource, all time",
+             lambda: repo.counts_by_resource("resource_claimed")),
+            ("latest 50 events", lambda: repo.latest(50)),
+        )
+        print(f"{'query':<36}{'ms':>10}  result")
+        for name, query in queries:
+            t0 = time.perf_counter()
+            result = query()
+            elapsed = (time.perf_counter() - t0) * 1000
+            shown = result if isinstance(result, int) else f"{len(result)} rows"
+            print(f"{name:<36}{elapsed:>10.2f}  {shown}")
+        repo.close()
+
+
+if __name__ == "__main__":
+    main()
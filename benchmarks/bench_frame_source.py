@@ -0,0 +1,121 @@
+"""
+Screen grabs per second of scanning, before and after FrameSource.
+
+Consumers on a 1920x1080 client: the compass coordinates polled at 20 Hz,
+a radar region next to them polled at the same rate (a planned consumer,
+registered here only to show the sharing) and a deed scan every 2 s.
+
+- separate: each consumer grabs its own region, the compass the whole
+  370x430 compass crop it then slices the coordinates from (the old path),
+- shared:   one FrameSource; the compass registers only its coordinates and
+  the radar reuses the compass grab.
+
+Grabs are copied out of the frame the way mss copies them out of its
+buffer. The per-scan mss context setup of the old deed path is not part of
+this (no screen to grab here).
+
+Run from the repository root:  python -m benchmarks.bench_frame_source
+"""
+import time
+from typing import Dict
+
+import numpy as np
+
+from src.scanner.capture import CaptureBackend, ClientRect
+from src.scanner.frame_source import FrameSource
+from src.scanner.player_position_scanner import (
+    DEFAULT_COORDS_RECT,
+    _build_compass_region,
+)
+from src.scanner.screen_capture import build_capture_region
+
+CLIENT = ClientRect(0, 0, 1920, 1080)
+COMPASS = (370, 430)
+RADAR = (20, 20, 330, 330)  # wewnątrz wycinka kompasu
+SECONDS, POLL_HZ, DEED_EVERY = 10, 20, 2.0
+
+
+class _StillScreen(CaptureBackend):
+    """A static frame; ``grab`` copies like mss does."""
+
+    def __init__(self) -> None:
+        rng = np.random.default_rng(25)
+        self.frame = rng.integers(0, 255, (CLIENT.height, CLIENT.width, 3), np.uint8)
+        self.grabs = 0
+        self.pixels = 0
+
+    def client_rect(self) -> ClientRect:
+        return CLIENT
+
+    def grab(self, region: Dict[str, int]) -> np.ndarray:
+        self.grabs += 1
+        self.pixels += region["width"] * region["height"]
+        top, left = region["top"], region["left"]
+        return self.frame[
+            top:top + region["height"], left:left + region["width"]
+        ].copy()
+
+
+def _offset(base: Dict[str, int], rect) -> Dict[str, int]:
+    x, y, w, h = rect
+    return {"left": base["left"] + x, "top": base["top"] + y, "width": w, "height": h}
+
+
+def _schedule():
+    """(czas, konsument) w kolejności – ten sam scenariusz dla obu wariantów."""
+    events = []
+    for i in range(SECONDS * POLL_HZ):
+        events += [(i / POLL_HZ, "coords"), (i / POLL_HZ + 0.001, "radar")]
+    events += [(t, "deed") for t in np.arange(0, SECONDS, DEED_EVERY)]
+    return sorted(events)
+
+
+def _separate() -> _StillScreen:
+    screen = _StillScreen()
+    compass = _build_compass_region(CLIENT, *COMPASS)
+    for _, consumer in _schedule():
+        if consumer == "coords":
+            x, y, w, h = DEFAULT_COORDS_RECT
+            screen.grab(compass)[y:y + h, x:x + w]
+        elif consumer == "radar":
+            screen.grab(_offset(compass, RADAR))
+        else:
+            screen.grab(build_capture_region(CLIENT, 0, 0))
+    return screen
+
+
+def _compass(client: ClientRect) -> Dict[str, int]:
+    return _build_compass_region(client, *COMPASS)
+
+
+def _shared() -> _StillScreen:
+    screen = _StillScreen()
+    source = FrameSource(screen)
+    coords = source.register(
+        "compass coords", lambda c: _offset(_compass(c), DEFAULT_COORDS_RECT), 0.05
+    )
+    radar = source.register("radar", lambda c: _offset(_compass(c), RADAR), 0.05)
+    panel = source.register(
+        "deed panel", lambda c: build_capture_region(c, 0, 0), continuous=False
+    )
+    handles = {"coords": coords, "radar": radar, "deed": panel}
+    for _, consumer in _schedule():
+        handles[consumer].read()
+    print(f"  frame source: {source.stats}")
+    return screen
+
+
+def main() -> None:
+    print(f"{SECONDS} s: coords + radar at {POLL_HZ} Hz, deed scan every "
+          f"{DEED_EVERY:g} s")
+    for name, run in (("separate", _separate), ("shared", _shared)):
+        t0 = time.perf_counter()
+        screen = run()
+        elapsed = time.perf_counter() - t0
+        print(f"{name:<9} grabs {screen.grabs:>5}  "
+              f"pixels {screen.pixels / 1e6:7.1f} M  "
+              f"copy+serve {elapsed * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
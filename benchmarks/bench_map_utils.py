@@ -0,0 +1,92 @@
+# python
+"""
+lon/lat -> scene conversion: pre-PlanetGeometry functions vs PlanetGeometry.
+
+Run from the repository root:  python -m benchmarks.bench_map_utils
+"""
+import contextlib
+import io
+import timeit
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from src.app.config_loader import load_config
+from src.map.map_utils import get_planet_config, get_planet_geometry
+
+N = 100_000
+
+
+def _legacy_lonlat_to_scene(
+    lon: float, lat: float, config: Dict[str, Any]
+) -> Tuple[float, float]:
+    # wersja sprzed PlanetGeometry (łącznie z print)
+    planet_config = get_planet_config(config)
+    tile_size = config["map"]["tile_size"]
+    map_width = planet_config["tile_count_x"] * tile_size
+    map_height = planet_config["tile_count_y"] * tile_size
+    x = (
+        (lon - planet_config["min_lon"])
+        / (planet_config["max_lon"] - planet_config["min_lon"])
+    ) * map_width
+    y = (
+        map_height
+        - (
+            (lat - planet_config["min_lat"])
+            / (planet_config["max_lat"] - planet_config["min_lat"])
+        )
+        * map_height
+    )
+    print("lonlat_to_Scene output: ", x, y)
+    return x, y
+
+
+def main() -> None:
+    config = load_config("config/default.yaml")
+    config["map"]["planet"] = "Calypso"
+    geometry = get_planet_geometry(config)
+    rng = np.random.default_rng(0)
+    lon = rng.uniform(16384, 90112, N)
+    lat = rng.uniform(24576, 98304, N)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = np.array(
+            [
+                _legacy_lonlat_to_scene(a, b, config)
+                for a, b in zip(lon[:1000], lat[:1000], strict=True)
+            ]
+        )
+    xs, ys = geometry.lonlat_to_scene_array(lon[:1000], lat[:1000])
+    assert np.allclose(expected, np.column_stack([xs, ys]))
+
+    lon_list, lat_list = lon.tolist(), lat.tolist()
+
+    def legacy() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for a, b in zip(lon_list, lat_list, strict=True):
+                _legacy_lonlat_to_scene(a, b, config)
+
+    def scalar() -> None:
+        to_scene = geometry.lonlat_to_scene
+        for a, b in zip(lon_list, lat_list, strict=True):
+            to_scene(a, b)
+
+    def shared_lookup() -> None:
+        for a, b in zip(lon_list, lat_list, strict=True):
+            get_planet_geometry(config).lonlat_to_scene(a, b)
+
+    def batch() -> None:
+        geometry.lonlat_to_scene_array(lon, lat)
+
+    for name, fn in (
+        ("legacy function", legacy),
+        ("geometry scalar", scalar),
+        ("get_planet_geometry + scalar", shared_lookup),
+        ("geometry batch (numpy)", batch),
+    ):
+        best = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"{name:<30}{best / N * 1e9:10.1f} ns/point")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# python
+"""
+Repaint time of the map view at several zoom levels, with and without the tile
+pyramid.
+
+Run from the repository root:  python -m benchmarks.bench_map_zoom [planet]
+"""
+import sys
+import tempfile
+import time
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QApplication, QGraphicsScene
+
+from src.app.config_loader import load_config
+from src.map.map_view import MapView
+from src.map.tile_cache import TileCache
+from src.map.tile_loader import TileLoader
+
+SCALES = (1.0, 0.5, 0.25, 0.125, 0.06)
+REPAINTS = 20
+
+
+def _bench(config: dict, cache: TileCache, use_pyramid: bool) -> None:
+    planet = config["map"]["planet"]
+    planet_config = config["planets"][planet]
+    tile_size = config["map"]["tile_size"]
+
+    scene = QGraphicsScene()
+    scene.setSceneRect(
+        0,
+        0,
+        planet_config["tile_count_x"] * tile_size,
+        planet_config["tile_count_y"] * tile_size,
+    )
+    view = MapView(scene, config)
+    view.resize(*config["map"]["window_geometry"][2:])
+    loader = TileLoader(
+        scene, cache, planet, planet_config, tile_size, 1 << 30, use_pyramid=use_pyramid
+    )
+    view.viewport_changed.connect(loader.update_visible)
+    target = QImage(view.viewport().size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    label = "pyramid" if use_pyramid else "level 0"
+    for scale in SCALES:
+        view.resetTransform()
+        view.scale(scale, scale)
+        view.centerOn(scene.sceneRect().center())
+        loader.update_visible(view.visible_scene_rect(), view.current_scale())
+        # bloki dekodują się w tle – czekamy, aż wszystkie trafią do sceny
+        while loader.pending:
+            QApplication.processEvents()
+            time.sleep(0.001)
+
+        painter = QPainter(target)
+        view.render(painter)  # warm-up (pixmap upload)
+        t0 = time.perf_counter()
+        for _ in range(REPAINTS):
+            view.render(painter)
+        elapsed = (time.perf_counter() - t0) / REPAINTS
+        painter.end()
+        print(
+            f"{label:<9}scale {scale:<6} level {loader.level}  "
+            f"items {loader.shown:>3}  repaint {elapsed * 1000:7.2f} ms"
+        )
+    # przed usunięciem katalogu cache żaden dekoder nie może już pisać
+    loader.shutdown(wait=True)
+
+
+def main() -> None:
+    app = QApplication(sys.argv)  # noqa: F841 - widgets need an application
+    config = load_config("config/default.yaml")
+    config["map"]["planet"] = sys.argv[1] if len(sys.argv) > 1 else "Calypso"
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = TileCache(cache_dir)
+        for use_pyramid in (False, True):
+            _bench(config, cache, use_pyramid)
+
+
+if __name__ == "__main__":
+    main()
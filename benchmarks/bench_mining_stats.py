@@ -0,0 +1,68 @@
+"""
+MiningStatsService under a long synthetic session: per-event update cost as
+the session grows, snapshot cost and rows kept for the rolling window.
+
+Run from the repository root:  python -m benchmarks.bench_mining_stats
+"""
+import random
+import sys
+import time
+
+from PyQt6.QtCore import QCoreApplication
+
+from src.app.signal_bus import SignalBus
+from src.services.mining_stats_service import (
+    CLAIM,
+    DEED,
+    DEPLETED,
+    LOOT,
+    MiningStatsService,
+)
+
+EVENTS = 400_000
+CHUNK = 50_000
+SESSION_SEC = 40 * 3600  # jedno zdarzenie co ~0.36 s
+RESOURCES = ["Lysterium Stone", "Belkar Stone", "Caldorite Stone", "Oil", "Zinc Stone"]
+
+
+def main() -> None:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    service = MiningStatsService(SignalBus(), {"mining_stats": {"window_min": 60}})
+    service._timer.stop()  # snapshoty liczymy tu ręcznie
+    start = service.started
+    rng = random.Random(9)
+    kinds = [DEED, CLAIM, CLAIM, DEPLETED, LOOT, LOOT]
+    resources = [service._resource_id(name) for name in RESOURCES]
+
+    print(f"{'events':>8}{'us/event':>10}{'window rows':>13}{'snapshot ms':>13}")
+    for done in range(0, EVENTS, CHUNK):
+        batch = [
+            (rng.choice(kinds), rng.choice(resources), rng.randrange(0, 8),
+             rng.uniform(10, 400), rng.uniform(0.01, 5.0))
+            for _ in range(CHUNK)
+        ]
+        t0 = time.perf_counter()
+        for i, (kind, resource, depth_bin, size, value) in enumerate(batch):
+            now = start + (done + i) * SESSION_SEC / EVENTS
+            service.record(kind, resource, depth_bin, size, value, now=now)
+        per_event = (time.perf_counter() - t0) / CHUNK * 1e6
+
+        t0 = time.perf_counter()
+        snapshot = service.snapshot(now)
+        snap_ms = (time.perf_counter() - t0) * 1000
+        print(
+            f"{done + CHUNK:>8}{per_event:>10.2f}{len(service.columns):>13}"
+            f"{snap_ms:>13.3f}"
+        )
+
+    s, w = snapshot.session, snapshot.window
+    print(
+        f"session: {s.deeds} deeds, {s.claims} claims, {s.claims_per_drop:.2f} "
+        f"claims/drop, {s.deeds_per_hour:.0f} deeds/h; "
+        f"window: {w.deeds} deeds, {w.deeds_per_hour:.0f} deeds/h"
+    )
+    del app
+
+
+if __name__ == "__main__":
+    main()
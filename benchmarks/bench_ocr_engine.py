@@ -0,0 +1,87 @@
+"""
+OCR cost per call on the sample screenshots in ``assets/``: the old path
+(``pytesseract.image_to_string`` – temp file + tesseract process + model load
+on every call) vs ``OcrEnginePool`` with each backend that is installed.
+
+Every image goes through ``preprocess_deed`` and both block profiles, as in
+``ocr_text_block``. Backends that are not installed are reported and skipped.
+
+Run from the repository root:  python -m benchmarks.bench_ocr_engine
+"""
+import time
+from typing import Callable, Dict, List
+
+import cv2
+import numpy as np
+
+from src.scanner.ocr_core import (
+    CFG_BLOCK,
+    CFG_BLOCK_ALT,
+    PROFILE_BLOCK,
+    PROFILE_BLOCK_ALT,
+    preprocess_deed,
+)
+from src.scanner.ocr_engine import OcrEnginePool
+
+IMAGES = ["assets/big.png", "assets/smal.png", "assets/claim.png"]
+ROUNDS = 5
+
+
+def _subprocess_path() -> Callable[[np.ndarray, int], str]:
+    import pytesseract
+
+    configs = [CFG_BLOCK, CFG_BLOCK_ALT]
+    return lambda img, i: pytesseract.image_to_string(img, config=configs[i])
+
+
+def _pool_path(backend: str) -> Callable[[np.ndarray, int], str]:
+    pool = OcrEnginePool(size=1, backend=backend)
+    profiles = [PROFILE_BLOCK, PROFILE_BLOCK_ALT]
+    with pool.engine():  # silnik (i model) ładowany przed pomiarem
+        pass
+    return lambda img, i: pool.image_to_string(img, profiles[i])
+
+
+def _measure(ocr: Callable[[np.ndarray, int], str], images: List[np.ndarray]):
+    ocr(images[0], 0)  # rozgrzewka
+    times: List[float] = []
+    texts: List[str] = []
+    for _ in range(ROUNDS):
+        for img in images:
+            for profile in (0, 1):
+                t0 = time.perf_counter()
+                text = ocr(img, profile)
+                times.append(time.perf_counter() - t0)
+                texts.append(text.strip())
+    return times, texts
+
+
+def main() -> None:
+    images = [preprocess_deed(cv2.imread(path)) for path in IMAGES]
+    paths: Dict[str, Callable[[], Callable[[np.ndarray, int], str]]] = {
+        "pytesseract (per call)": _subprocess_path,
+        "pool: tesserocr": lambda: _pool_path("tesserocr"),
+        "pool: pytesseract": lambda: _pool_path("pytesseract"),
+    }
+    print(f"{len(images)} images x 2 profiles x {ROUNDS} rounds")
+    print(f"{'path':<24}{'mean ms':>10}{'p95 ms':>10}{'calls/s':>10}")
+    baseline = None
+    for name, build in paths.items():
+        try:
+            times, texts = _measure(build(), images)
+        except Exception as e:  # brak modułu / binarki tesseract
+            print(f"{name:<24} skipped: {type(e).__name__}: {e}")
+            continue
+        times.sort()
+        mean = sum(times) / len(times)
+        p95 = times[int(len(times) * 0.95) - 1]
+        print(f"{name:<24}{mean * 1000:>10.1f}{p95 * 1000:>10.1f}{1 / mean:>10.1f}")
+        if baseline is None:
+            baseline = texts
+        elif texts != baseline:
+            same = sum(a == b for a, b in zip(texts, baseline, strict=True))
+            print(f"{'':<24}text identical to baseline in {same}/{len(texts)} calls")
+
+
+if __name__ == "__main__":
+    main()
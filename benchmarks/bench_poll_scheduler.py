@@ -0,0 +1,69 @@
+"""
+AdaptivePollScheduler in real time over a scripted session (move / stand /
+move / stand): captures per phase vs a fixed interval at the floor, delay
+before a resumed movement is seen, wake-up latency and the interval
+histogram.
+
+Times are scaled down (floor 20 ms, ceiling 1 s) so the run takes ~14 s.
+
+Run from the repository root:  python -m benchmarks.bench_poll_scheduler
+"""
+import threading
+import time
+
+from src.scanner.poll_scheduler import AdaptivePollScheduler
+
+FLOOR, CEILING, BACKOFF = 0.02, 1.0, 1.5
+# (nazwa fazy, czas trwania [s], czy awatar się porusza)
+PHASES = [("moving", 2.0), ("standing", 5.0), ("moving", 2.0), ("standing", 5.0)]
+WAKE_AT = 4.5  # skan deedu w trakcie postoju
+
+
+def main() -> None:
+    scheduler = AdaptivePollScheduler(FLOOR, CEILING, backoff=BACKOFF)
+    bounds, t = [], 0.0
+    for name, length in PHASES:
+        bounds.append((t, t + length, name))
+        t += length
+    total = t
+
+    polls = [0] * len(PHASES)
+    first_poll = [None] * len(PHASES)  # opóźnienie pierwszego odpytania w fazie
+    woken_at: "list[float]" = []
+    wake_latency = None
+
+    def hotkey() -> None:
+        time.sleep(WAKE_AT)
+        woken_at.append(time.monotonic())
+        scheduler.wake()
+
+    threading.Thread(target=hotkey, daemon=True).start()
+    start = time.monotonic()
+    position = seen = 0
+    while (now := time.monotonic() - start) < total:
+        phase = next(i for i, (a, b, _) in enumerate(bounds) if a <= now < b)
+        polls[phase] += 1
+        if first_poll[phase] is None:
+            first_poll[phase] = now - bounds[phase][0]
+        if bounds[phase][2] == "moving":
+            position = int(now * 10)  # nowa pozycja co 100 ms
+        if woken_at and wake_latency is None:
+            wake_latency = time.monotonic() - woken_at[0]
+        scheduler.feedback(position != seen)
+        seen = position
+        scheduler.wait()
+
+    print(f"floor {FLOOR * 1000:.0f} ms, ceiling {CEILING * 1000:.0f} ms, "
+          f"backoff {BACKOFF}")
+    print(f"{'phase':<10}{'sec':>6}{'polls':>8}{'fixed floor':>13}")
+    for (a, b, name), n in zip(bounds, polls, strict=True):
+        print(f"{name:<10}{b - a:>6.1f}{n:>8}{(b - a) / FLOOR:>13.0f}")
+    print(f"total polls {sum(polls)} vs {total / FLOOR:.0f} at a fixed floor")
+    print(f"movement after standing seen after {first_poll[2] * 1000:.0f} ms")
+    if wake_latency is not None:
+        print(f"wake-up latency {wake_latency * 1000:.2f} ms")
+    print(f"histogram: {scheduler.format_histogram()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# python
+"""
+Deed dedupe + nearest-deed removal with 10k synthetic deeds: linear scans (as in
+DeedMarkerService/DeedRepository before GridIndex) vs GridIndex.
+
+Run from the repository root:  python -m benchmarks.bench_spatial_index
+"""
+import math
+import random
+import time
+from typing import List, Tuple
+
+from src.utils.spatial_index import GridIndex
+
+N_DEEDS = 10_000
+N_QUERIES = 2_000
+MAP_PX = 4608  # Calypso
+NEAR_PX = 10.0
+MAX_DIST_PX = 120.0
+
+
+Points = List[Tuple[float, float]]
+
+
+def _linear(points: Points, queries: Points) -> float:
+    t0 = time.perf_counter()
+    markers: List[Tuple[int, float, float]] = []
+    for i, (x, y) in enumerate(points):
+        if any(abs(mx - x) + abs(my - y) <= NEAR_PX for _, mx, my in markers):
+            continue
+        markers.append((i, x, y))
+    for qx, qy in queries:
+        if not markers:
+            break
+        nearest = min(markers, key=lambda m: math.hypot(m[1] - qx, m[2] - qy))
+        if math.hypot(nearest[1] - qx, nearest[2] - qy) <= MAX_DIST_PX:
+            markers.remove(nearest)
+    return time.perf_counter() - t0
+
+
+def _grid(points: Points, queries: Points) -> float:
+    t0 = time.perf_counter()
+    index: GridIndex[int] = GridIndex(32.0)
+    for i, (x, y) in enumerate(points):
+        if any(
+            abs(mx - x) + abs(my - y) <= NEAR_PX
+            for mx, my in map(index.position, index.query_radius(x, y, NEAR_PX))
+        ):
+            continue
+        index.insert(i, x, y)
+    for qx, qy in queries:
+        nearest = index.nearest(qx, qy, k=1, max_dist=MAX_DIST_PX)
+        if nearest:
+            index.remove(nearest[0][1])
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    rng = random.Random(0)
+    points = [(rng.uniform(0, MAP_PX), rng.uniform(0, MAP_PX)) for _ in range(N_DEEDS)]
+    queries = [
+        (rng.uniform(0, MAP_PX), rng.uniform(0, MAP_PX)) for _ in range(N_QUERIES)
+    ]
+
+    linear = _linear(points, queries)
+    grid = _grid(points, queries)
+    print(f"{N_DEEDS} deeds, {N_QUERIES} depletion queries")
+    print(f"linear scan   {linear * 1000:9.1f} ms")
+    print(f"GridIndex     {grid * 1000:9.1f} ms   ({linear / grid:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# python
+"""
+Cold vs warm tile loading per planet.
+
+Run from the repository root:  python -m benchmarks.bench_tile_cache
+"""
+import sys
+import tempfile
+import time
+
+from PyQt6.QtGui import QGuiApplication, QPixmap
+
+from src.app.config_loader import load_config
+from src.map.tile_cache import TileCache, find_tile_file
+
+
+def _load_planet(cache: TileCache, planet: str, planet_config: dict) -> int:
+    loaded = 0
+    count = planet_config["tile_count_x"] * planet_config["tile_count_y"]
+    for tile_index in range(count):
+        tile_path = find_tile_file(planet_config["tile_folder"], tile_index)
+        if tile_path is None:
+            continue
+        QPixmap.fromImage(cache.load(planet, tile_index, tile_path))
+        loaded += 1
+    return loaded
+
+
+def main() -> None:
+    app = QGuiApplication(sys.argv)  # noqa: F841 - QPixmap needs an application
+    config = load_config("config/default.yaml")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = TileCache(cache_dir)
+        print(
+            f"{'planet':<14}{'tiles':>6}{'cold [ms]':>12}"
+            f"{'warm [ms]':>12}{'speedup':>9}"
+        )
+        for planet, planet_config in config["planets"].items():
+            t0 = time.perf_counter()
+            tiles = _load_planet(cache, planet, planet_config)
+            cold = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            _load_planet(cache, planet, planet_config)
+            warm = time.perf_counter() - t0
+
+            speedup = f"{cold / warm:.1f}x" if tiles and warm > 0 else "-"
+            print(
+                f"{planet:<14}{tiles:>6}{cold * 1000:>12.1f}"
+                f"{warm * 1000:>12.1f}{speedup:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# python
+"""
+Serial vs pooled tile decoding (cold cache) for one planet.
+
+Run from the repository root:  python -m benchmarks.bench_tile_decode [planet] [workers]
+"""
+import sys
+import tempfile
+import time
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication, QGraphicsScene
+
+from src.app.config_loader import load_config
+from src.map.tile_cache import TileCache, find_tile_file
+from src.map.tile_loader import TileLoader
+
+
+def _serial(planet: str, planet_config: dict, cache: TileCache) -> int:
+    # dawna pętla z MapWindow.load_map_tiles
+    tiles = 0
+    count = planet_config["tile_count_x"] * planet_config["tile_count_y"]
+    for tile_index in range(count):
+        tile_path = find_tile_file(planet_config["tile_folder"], tile_index)
+        if tile_path is not None:
+            QPixmap.fromImage(cache.load(planet, tile_index, tile_path))
+            tiles += 1
+    return tiles
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    config = load_config("config/default.yaml")
+    planet = sys.argv[1] if len(sys.argv) > 1 else "Calypso"
+    workers = (
+        int(sys.argv[2]) if len(sys.argv) > 2 else config["map"]["tile_workers"]
+    )
+    planet_config = config["planets"][planet]
+    tile_size = config["map"]["tile_size"]
+    whole_map = QRectF(
+        0,
+        0,
+        planet_config["tile_count_x"] * tile_size,
+        planet_config["tile_count_y"] * tile_size,
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        t0 = time.perf_counter()
+        tiles = _serial(planet, planet_config, TileCache(cache_dir))
+        wall = time.perf_counter() - t0
+        print(
+            f"serial      {tiles} tiles  {wall * 1000:8.1f} ms  "
+            f"{tiles / wall:7.1f} tiles/s"
+        )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        loader = TileLoader(
+            QGraphicsScene(),
+            TileCache(cache_dir),
+            planet,
+            planet_config,
+            tile_size,
+            budget_bytes=1 << 30,
+            prefetch=0,
+            use_pyramid=False,
+            workers=workers,
+        )
+        t0 = time.perf_counter()
+        loader.update_visible(whole_map)
+        blocked = time.perf_counter() - t0
+        while loader.pending:
+            app.processEvents()
+        stats = loader.stats
+        print(
+            f"pool ({workers}w)  {stats.last_burst_tiles} tiles  "
+            f"{stats.last_burst_seconds * 1000:8.1f} ms  "
+            f"{stats.tiles_per_sec:7.1f} tiles/s  "
+            f"(GUI thread blocked {blocked * 1000:.1f} ms)"
+        )
+        loader.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,24 @@
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, cast
 
-from PyQt6.QtCore import QTimer
-
-from .config_loader import load_config
-from .signal_bus import SignalBus
 from ..chat_logger.log_listener import ChatLogListener
+from ..repositories.event_repository import EventRepository
+from ..scanner.capture import create_capture_backend
+from ..scanner.change_detector import FrameChangeDetector
+from ..scanner.deed_cache import DeedScanCache
+from ..scanner.digit_reader import DigitReader
+from ..scanner.frame_source import FrameSource
+from ..scanner.ocr_engine import OcrProfile, configure_ocr
 from ..scanner.player_position_scanner import PlayerScanner
+from ..scanner.poll_scheduler import AdaptivePollScheduler
 from ..services.map_deed_service import DeedMarkerService
+from ..services.mining_stats_service import MiningStatsService
+from ..services.planet_service import PlanetService
 from ..services.player_position_service import PlayerPositionService
 from ..services.system_event_manager import SystemEventManager
 from ..utils.hotkey_scanner_listener import HotkeyScannerListener
+from .config_loader import load_config
+from .signal_bus import SignalBus
 
 
 @dataclass
@@ -24,14 +32,16 @@ class AppContext:
     chat_listener: ChatLogListener
 
     #services
+    planet_service: PlanetService
     player_position_service: PlayerPositionService
     deed_marker_service: DeedMarkerService
     system_event_manager: SystemEventManager
+    mining_stats_service: MiningStatsService
 
-    #Controllers
+    #repositories
+    event_repository: EventRepository
 
-    #Timers
-    deed_timer: QTimer
+    #Controllers
 
     def start_all(self) -> None:
         """Start all scanners/listeners."""
@@ -51,6 +61,13 @@ def create_app_context(config_path: str = "../../config/default.yaml") -> AppCon
     # Create a central signal bus
     bus = SignalBus()
 
+    # Wspólna pula silników OCR (skaner deedów i fallback kompasu)
+    configure_ocr(size=config["ocr"]["pool_size"], backend=config["ocr"]["backend"])
+
+    # Okno gry na żywo albo nagranie; jedno źródło klatek dla wszystkich skanerów
+    capture = create_capture_backend(config["capture"], config["game_window"]["title"])
+    frames = FrameSource(capture)
+
     deed_scanner = HotkeyScannerListener(
         bus=bus,
         offset_x=0,
@@ -60,25 +77,60 @@ def create_app_context(config_path: str = "../../config/default.yaml") -> AppCon
         save_dir=None,
         hotkey=config["hotkey_scanner"]["hotkey"],
         cooldown_sec=0.5,
+        ocr_profiles=[
+            OcrProfile.from_cli(cli) for cli in config["ocr"]["deed_profiles"]
+        ],
+        scan_cache=DeedScanCache(
+            max_entries=config["ocr"]["scan_cache_size"],
+            max_distance=config["ocr"]["scan_cache_max_distance"],
+        ),
+        frames=frames,
     )
 
     player_scanner = PlayerScanner(
         bus=bus,
         title_substr=config["game_window"]["title"],
         compass_size=config["compass_ocr"]["compass_size"],
-        poll_interval=config["compass_ocr"]["poll_interval"]
+        poll_interval=config["compass_ocr"]["poll_interval"],
+        scheduler=AdaptivePollScheduler(
+            config["compass_ocr"]["poll_interval"],
+            config["compass_ocr"]["poll_interval_max"],
+            backoff=config["compass_ocr"]["poll_backoff"],
+        ),
+        digit_reader=DigitReader(
+            template_path=config["compass_ocr"]["coords_template"],
+            atlas_path=config["compass_ocr"]["digit_atlas_path"],
+            min_score=config["compass_ocr"]["digit_min_score"],
+            min_margin=config["compass_ocr"]["digit_min_margin"],
+            min_samples=config["compass_ocr"]["digit_min_samples"],
+            save_every=config["compass_ocr"]["digit_save_every"],
+        ),
+        ocr_fallback_interval=config["compass_ocr"]["ocr_fallback_interval"],
+        change_detector=FrameChangeDetector(
+            min_changed_px=config["compass_ocr"]["change_min_pixels"]
+        ),
+        frames=frames,
     )
 
+    # PlanetService first: it must see deed_found before DeedMarkerService
+    planet_service = PlanetService(bus, config)
     player_position_service = PlayerPositionService(bus, config)
     deed_marker_service = DeedMarkerService(bus, config)
     system_event_manager = SystemEventManager(bus)
-
-    # Timer to refresh deed markers
-    deed_timer = QTimer()
-    deed_timer.timeout.connect(deed_marker_service.tick_deeds)
-    deed_timer.start(1000)  # run every 1s
-
-    chat_listener = ChatLogListener(bus , r"X:\Dokumenty\Entropia Universe\chat.log")
+    mining_stats_service = MiningStatsService(bus, config)
+
+    event_repository = EventRepository(config["events"]["db_path"])
+    chat_listener = ChatLogListener(
+        bus,
+        config["chat_log"]["path"],
+        poll_interval=config["chat_log"]["poll_interval"],
+        poll_interval_max=config["chat_log"]["poll_interval_max"],
+        block_size=config["chat_log"]["read_block_kb"] * 1024,
+        backfill_minutes=config["chat_log"]["backfill_minutes"],
+        event_repository=event_repository,
+        classify=system_event_manager.classify,
+        ingest_batch=config["events"]["ingest_batch"],
+    )
 
     return AppContext(
         bus=bus,
@@ -86,8 +138,10 @@ def create_app_context(config_path: str = "../../config/default.yaml") -> AppCon
         deed_scanner=deed_scanner,
         player_scanner=player_scanner,
         chat_listener=chat_listener,
+        planet_service=planet_service,
         player_position_service=player_position_service,
         deed_marker_service=deed_marker_service,
         system_event_manager=system_event_manager,
-        deed_timer=deed_timer
+        mining_stats_service=mining_stats_service,
+        event_repository=event_repository,
     )
\ No newline at end of file
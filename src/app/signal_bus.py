@@ -3,19 +3,27 @@ from src.models.deed_model import DeedModel
 
 class SignalBus(QObject):
     # Chat / System
-    system_event = pyqtSignal(str)           # raw system line
+    system_events = pyqtSignal(object, bool)  # List[str] of one read, backfill replay
     # globals_event = pyqtSignal(str)  # whole message from [Globals]
     # other_event = pyqtSignal(str)    # other channels
     resource_depleted = pyqtSignal(str)      # filtered system event
     resource_claimed = pyqtSignal(str)       # filtered system event
+    system_events_classified = pyqtSignal(object, bool)  # List[SystemEvent], replay
 
     # Scanners / OCR
+    scan_requested = pyqtSignal()            # deed scan hotkey pressed (before OCR)
     deed_found = pyqtSignal(DeedModel)       # new deed extracted
     player_position_parsed = pyqtSignal(int, int)
     player_position_changed = pyqtSignal(QPointF, QRectF)
 
+    # Map
+    planet_changed = pyqtSignal(str)         # planet name (key of config["planets"])
+
     # Deed
     deed_marker_added = pyqtSignal(str, float, float, float, object)   # id, x, y, radius, deed
     deed_marker_updated = pyqtSignal(str, float, float, float, object) # id, x, y, radius, deed
     deed_marker_removed = pyqtSignal(str)                                   # id
-    deed_marker_tick    = pyqtSignal(str, int)    # id, ttl_sec
\ No newline at end of file
+    deed_markers_ticked = pyqtSignal(object)  # DeedTicks: label changes of one refresh
+
+    # Stats
+    mining_stats_updated = pyqtSignal(object)  # MiningStatsSnapshot
@@ -0,0 +1,59 @@
+import mmap
+import os
+from datetime import datetime
+from typing import Iterator, Optional
+
+# "YYYY-MM-DD HH:MM:SS" – porównanie bajtów jest chronologiczne
+_STAMP_LEN = 19
+_STAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _is_stamp(data: bytes) -> bool:
+    return len(data) == _STAMP_LEN and data[4:5] == b"-" and data[13:14] == b":"
+
+
+def iter_channel_lines_backward(
+    path: str,
+    since: datetime,
+    channel: str = "System",
+    end: Optional[int] = None,
+    chunk_size: int = 8 * 1024 * 1024,
+) -> Iterator[str]:
+    """
+    Yield ``channel`` lines of a chat log newest first, stopping at ``since``.
+
+    The file is memory-mapped and scanned backwards in ``chunk_size`` windows
+    with mmap.rfind, so only the matching lines are copied into Python strings.
+    Scanning stops at the first line older than ``since``; ``end`` limits the
+    scan to bytes before that offset (e.g. where live tailing starts).
+    """
+    cutoff = since.strftime(_STAMP_FORMAT).encode()
+    needle = f" [{channel}] ".encode()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size if end is None else end
+        if size <= 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = min(size, len(mm))
+            hi = size
+            while hi > 0:
+                # okno zaczyna się na początku linii, żeby żadnej nie przeciąć
+                lo = mm.rfind(b"\n", 0, max(0, hi - chunk_size)) + 1
+                stamp = mm[lo : lo + _STAMP_LEN]
+                window_done = _is_stamp(stamp) and stamp < cutoff
+
+                pos = mm.rfind(needle, lo, hi)
+                while pos != -1:
+                    newline = mm.rfind(b"\n", lo, pos)
+                    start = newline + 1 if newline != -1 else lo
+                    if pos == start + _STAMP_LEN:
+                        if mm[start:pos] < cutoff:
+                            return
+                        stop = mm.find(b"\n", pos, hi)
+                        line = mm[start : stop if stop != -1 else hi]
+                        yield line.decode("utf-8", errors="ignore").strip()
+                    pos = mm.rfind(needle, lo, start)
+
+                if window_done:
+                    return
+                hi = lo
@@ -0,0 +1,238 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from typing import BinaryIO, List, Optional, Tuple
+
+# inotify(7): nagłówek zdarzenia i maski, na które reagujemy
+_EVENT = struct.Struct("iIII")
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+
+
+class _InotifyWatcher:
+    """Sleeps until the tailed file's directory reports a change to that file."""
+
+    def __init__(self, path: str) -> None:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # katalog, nie plik – dzięki temu widać też rotację i ponowne utworzenie
+        folder = os.path.dirname(os.path.abspath(path))
+        if libc.inotify_add_watch(self._fd, os.fsencode(folder), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {folder}")
+        self._name = os.fsencode(os.path.basename(path))
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+
+    def wait(self, timeout: Optional[float]) -> None:
+        while True:
+            ready, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+            if not ready:
+                return
+            if self._wake_r in ready:
+                os.read(self._wake_r, 4096)
+                return
+            if self._drain_events():
+                return
+
+    def _drain_events(self) -> bool:
+        relevant = False
+        try:
+            while True:
+                data = os.read(self._fd, 64 * 1024)
+                offset = 0
+                while offset < len(data):
+                    _, _, _, name_len = _EVENT.unpack_from(data, offset)
+                    start = offset + _EVENT.size
+                    name = data[start : start + name_len].rstrip(b"\0")
+                    relevant = relevant or name == self._name
+                    offset = start + name_len
+        except BlockingIOError:
+            pass
+        return relevant
+
+    def feedback(self, got_data: bool) -> None:
+        pass
+
+    def wake(self) -> None:
+        if not self._closed:
+            os.write(self._wake_w, b"x")
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            os.close(fd)
+
+
+class _PollWatcher:
+    """Stat-polling fallback: interval doubles while idle, resets on new data."""
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = min_interval
+        self._wake_event = threading.Event()
+
+    def wait(self, timeout: Optional[float]) -> None:
+        interval = self.interval if timeout is None else min(timeout, self.interval)
+        self._wake_event.wait(interval)
+        self._wake_event.clear()
+
+    def feedback(self, got_data: bool) -> None:
+        if got_data:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+
+    def wake(self) -> None:
+        self._wake_event.set()
+
+    def close(self) -> None:
+        pass
+
+
+class FileTailer:
+    """
+    Follows a growing text file, like ``tail -F``.
+
+    Appended bytes are read in ``block_size`` blocks and returned as one string
+    of complete lines; a trailing partial line waits for its newline. When the
+    file is truncated reading restarts from the top, and when it is replaced
+    (rotation) the old handle is drained before the new file is opened.
+
+    Waiting uses inotify on Linux and adaptive stat polling elsewhere.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        block_size: int = 256 * 1024,
+        poll_min: float = 0.1,
+        poll_max: float = 2.0,
+        from_start: bool = False,
+    ) -> None:
+        self.path = path
+        self.block_size = block_size
+        self._from_start = from_start
+        self._file: Optional[BinaryIO] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._pos = 0
+        self._partial = b""
+        self.watcher = self._make_watcher(poll_min, poll_max)
+
+    def _make_watcher(
+        self, poll_min: float, poll_max: float
+    ) -> "_InotifyWatcher | _PollWatcher":
+        if sys.platform.startswith("linux"):
+            try:
+                return _InotifyWatcher(self.path)
+            except (OSError, AttributeError) as e:
+                print(f"[FileTailer] inotify unavailable, polling instead: {e}")
+        return _PollWatcher(poll_min, poll_max)
+
+    @property
+    def position(self) -> int:
+        """Byte offset of the next read in the current file."""
+        return self._pos
+
+    @property
+    def line_position(self) -> int:
+        """Byte offset just after the last complete line returned so far."""
+        return self._pos - len(self._partial)
+
+    @property
+    def identity(self) -> Optional[Tuple[int, int]]:
+        """(st_dev, st_ino) of the open file; changes after rotation."""
+        return self._identity
+
+    def read_available(self) -> str:
+        """Complete lines appended since the last call ("" if none)."""
+        try:
+            st: Optional[os.stat_result] = os.stat(self.path)
+        except OSError:
+            st = None  # na chwilę zniknął (rotacja) – dokończ stary uchwyt
+
+        chunks: List[bytes] = []
+        if self._file is not None and st is not None:
+            if (st.st_dev, st.st_ino) != self._identity:
+                # ostatnia niepełna linia starego pliku nie może skleić się z nowym
+                self._partial += self._read_blocks()
+                if self._partial and not self._partial.endswith(b"\n"):
+                    self._partial += b"\n"
+                self._close_file()
+            elif st.st_size < self._pos:
+                self._file.seek(0)
+                self._pos = 0
+                self._partial = b""
+
+        if self._file is None and st is not None:
+            self._open(seek_end=not self._from_start and self._identity is None)
+        if self._file is not None:
+            chunks.append(self._read_blocks())
+
+        data = self._partial + b"".join(chunks)
+        cut = data.rfind(b"\n") + 1
+        self._partial = data[cut:]
+        text = data[:cut].decode("utf-8", errors="ignore")
+        self.watcher.feedback(bool(text))
+        return text
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        self.watcher.wait(timeout)
+
+    def wake(self) -> None:
+        """Make a blocked ``wait`` return now (used to stop the worker)."""
+        self.watcher.wake()
+
+    def close(self) -> None:
+        self._close_file()
+        self.watcher.close()
+
+    def _open(self, seek_end: bool) -> None:
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            return
+        st = os.fstat(f.fileno())
+        self._file = f
+        self._identity = (st.st_dev, st.st_ino)
+        self._pos = f.seek(0, os.SEEK_END) if seek_end else 0
+
+    def _read_blocks(self) -> bytes:
+        assert self._file is not None
+        blocks = []
+        while True:
+            block = self._file.read(self.block_size)
+            if not block:
+                break
+            blocks.append(block)
+            self._pos += len(block)
+        return b"".join(blocks)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,57 +1,252 @@
+import functools
+import hashlib
 import re
 import threading
 import time
-from typing import Optional
-from PyQt6.QtCore import QObject, pyqtSignal
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject
 
 from src.app.signal_bus import SignalBus
+from src.chat_logger.backfill import iter_channel_lines_backward
+from src.chat_logger.file_tailer import FileTailer
+from src.models.chat_event_model import ChatEvent, SystemEvent
+from src.repositories.event_repository import EventRepository
+
+Classifier = Callable[[str], Optional[SystemEvent]]
+_UNCLASSIFIED = SystemEvent("system")
+
+
+@functools.lru_cache(maxsize=4096)
+def _log_time(stamp: str) -> int:
+    # kolejne linie mają zwykle ten sam znacznik – cache oszczędza strptime
+    return int(time.mktime(time.strptime(stamp, "%Y-%m-%d %H:%M:%S")))
+
+
+def log_fingerprint(path: str) -> str:
+    """Hash of the log's first line; tells a resumed file from a new one."""
+    try:
+        with open(path, "rb") as f:
+            head = f.readline(4096)
+    except OSError:
+        return ""
+    return hashlib.sha1(head).hexdigest() if head.endswith(b"\n") else ""
 
 
 class ChatLogListener(QObject):
 
     _channel_regex = re.compile(
-        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \[(?P<channel>\S+)\] .+$"
+        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \[(?P<channel>\S+)\] ."
     )
 
-    def __init__(self, bus: SignalBus, chat_log_path: str, poll_interval: float = 0.1) -> None:
+    def __init__(
+        self,
+        bus: SignalBus,
+        chat_log_path: str,
+        poll_interval: float = 0.1,
+        poll_interval_max: float = 2.0,
+        block_size: int = 256 * 1024,
+        backfill_minutes: float = 0.0,
+        backfill_batch: int = 500,
+        event_repository: Optional[EventRepository] = None,
+        classify: Classifier = lambda _: None,
+        ingest_batch: int = 5000,
+    ) -> None:
         super().__init__()
         self.bus = bus
         self.chat_log_path = chat_log_path
         self.poll_interval = poll_interval
+        self.poll_interval_max = poll_interval_max
+        self.block_size = block_size
+        self.backfill_minutes = backfill_minutes
+        self.backfill_batch = backfill_batch
+        self.event_repository = event_repository
+        self.classify = classify
+        self.ingest_batch = ingest_batch
+        self._fingerprint = ""
+        self._fingerprint_of: Optional[Tuple[int, int]] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._tailer: Optional[FileTailer] = None
+        # zdarzenia na żywo czekające, aż catch-up dojdzie do miejsca startu,
+        # i checkpoint po ostatnim z nich; None = catch-up nie trwa
+        self._deferred: Optional[List[ChatEvent]] = None
+        self._deferred_at: Optional[Tuple[str, int]] = None
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._worker, name="ChatLogListener", daemon=True)
+        self._tailer = FileTailer(
+            self.chat_log_path,
+            block_size=self.block_size,
+            poll_min=self.poll_interval,
+            poll_max=self.poll_interval_max,
+        )
+        self._thread = threading.Thread(
+            target=self._worker,
+            args=(self._tailer,),
+            name="ChatLogListener",
+            daemon=True,
+        )
         self._thread.start()
 
     def stop(self) -> None:
         self._stop_event.set()
+        if self._tailer is not None:
+            self._tailer.wake()
 
-    def _emit_by_channel(self, channel: str, line: str) -> None:
-        """Emit signal depending on channel."""
+    def _emit_by_channel(
+        self, channel: str, lines: List[str], replayed: bool = False
+    ) -> None:
+        """Emit one batch signal per channel; ``replayed`` marks backfilled lines."""
         if channel.lower() == "system":
-            self.bus.system_event.emit(line)
+            self.bus.system_events.emit(lines, replayed)
         # elif channel.lower() == "globals":
-        #     self.globals_event.emit(line)
+        #     self.globals_event.emit(lines)
         # else:
-        #     self.other_event.emit(line)
+        #     self.other_event.emit(lines)
+
+    def _split_channels(self, text: str) -> Dict[str, List[str]]:
+        # cały blok dzielony na linie jednym splitlines()
+        by_channel: Dict[str, List[str]] = {}
+        for m in map(self._channel_regex.match, text.splitlines()):
+            if m:
+                by_channel.setdefault(m.group("channel"), []).append(m.string.strip())
+        return by_channel
+
+    def _dispatch(self, text: str, tailer: FileTailer) -> None:
+        by_channel = self._split_channels(text)
+        for channel, lines in by_channel.items():
+            self._emit_by_channel(channel, lines)
+        if self.event_repository is not None:
+            if tailer.identity != self._fingerprint_of:  # nowy plik po rotacji
+                self._fingerprint = log_fingerprint(self.chat_log_path)
+                self._fingerprint_of = tailer.identity
+            events = self._to_events(by_channel.get("System", []))
+            if self._deferred is not None:
+                # checkpoint nie może wyprzedzić niezapisanej części logu
+                self._deferred.extend(events)
+                self._deferred_at = (self._fingerprint, tailer.line_position)
+            else:
+                self.event_repository.append(
+                    events, self.chat_log_path, self._fingerprint, tailer.line_position
+                )
 
-    def _worker(self) -> None:
+    def _to_events(
+        self, lines: List[str], channel: str = "System"
+    ) -> List[ChatEvent]:
+        events = []
+        for line in lines:
+            event = self.classify(line) or _UNCLASSIFIED
+            events.append(
+                ChatEvent(
+                    _log_time(line[:19]), channel, event.event_type, event.resource,
+                    line, event.amount, event.value,
+                )
+            )
+        return events
+
+    def _catch_up(self, end: int) -> Iterator[None]:
+        """
+        Store system events written while we were not running, up to ``end``.
+
+        Yields after every block read, so the worker can serve live lines in
+        between; live events are held back (``_deferred``) and stored once the
+        catch-up reaches ``end``, which keeps the checkpoint a complete prefix.
+        """
+        assert self.event_repository is not None
+        fingerprint = log_fingerprint(self.chat_log_path)
+        saved = self.event_repository.checkpoint(self.chat_log_path)
+        start = 0
+        if saved is not None and saved[0] == fingerprint and saved[1] <= end:
+            start = saved[1]  # ten sam plik – wznów dokładnie od checkpointu
+        if start >= end:
+            return
+
+        t0 = time.perf_counter()
+        stored = 0
+        events: List[ChatEvent] = []
+        offset, partial = start, b""
+        with open(self.chat_log_path, "rb") as f:
+            f.seek(start)
+            while offset < end and not self._stop_event.is_set():
+                block = f.read(min(self.block_size, end - offset))
+                if not block:
+                    break
+                offset += len(block)
+                data = partial + block
+                cut = data.rfind(b"\n") + 1
+                partial = data[cut:]
+                text = data[:cut].decode("utf-8", errors="ignore")
+                lines = self._split_channels(text).get("System", [])
+                events.extend(self._to_events(lines))
+                if len(events) >= self.ingest_batch:
+                    # checkpoint = koniec ostatniej pełnej linii w tej partii
+                    self.event_repository.append(
+                        events, self.chat_log_path, fingerprint, offset - len(partial)
+                    )
+                    stored += len(events)
+                    events = []
+                yield
+        self.event_repository.append(
+            events, self.chat_log_path, fingerprint, offset - len(partial)
+        )
+        stored += len(events)
+        print(
+            f"[ChatLogListener] Stored {stored} system events from "
+            f"{(end - start) / 2**20:.1f} MB of log in {time.perf_counter() - t0:.2f}s"
+        )
+
+    def _backfill(self, end: int) -> None:
+        """Replay system lines of the last ``backfill_minutes`` before ``end``."""
+        t0 = time.perf_counter()
+        since = datetime.now() - timedelta(minutes=self.backfill_minutes)
+        lines = list(iter_channel_lines_backward(self.chat_log_path, since, end=end))
+        lines.reverse()  # skan idzie od końca, zdarzenia odtwarzamy chronologicznie
+        for i in range(0, len(lines), self.backfill_batch):
+            if self._stop_event.is_set():
+                return
+            self._emit_by_channel(
+                "System", lines[i : i + self.backfill_batch], replayed=True
+            )
+        print(
+            f"[ChatLogListener] Backfilled {len(lines)} system lines "
+            f"({end / 2**20:.1f} MB log) in {time.perf_counter() - t0:.2f}s"
+        )
+
+    def _worker(self, tailer: FileTailer) -> None:
         try:
-            with open(self.chat_log_path, "r", encoding="utf-8", errors="ignore") as f:
-                f.seek(0, 2)  # jump to end of file
-                while not self._stop_event.is_set():
-                    line = f.readline()
-                    if not line:
-                        time.sleep(self.poll_interval)
-                        continue
-
-                    m = self._channel_regex.search(line)
-                    if m:
-                        self._emit_by_channel(m.group("channel"), line.strip())
+            # otwiera plik na końcu – wszystko przed tą pozycją należy do backfillu
+            text = tailer.read_available()
+            catch_up: Optional[Iterator[None]] = None
+            if self.event_repository is not None and tailer.position > 0:
+                # zaległości zapisujemy w tle pracy na żywo, porcja po porcji
+                catch_up = self._catch_up(tailer.position)
+                self._deferred, self._deferred_at = [], None
+            if self.backfill_minutes > 0 and tailer.position > 0:
+                self._backfill(tailer.position)
+            if text:
+                self._dispatch(text, tailer)
+            while not self._stop_event.is_set():
+                text = tailer.read_available()
+                if text:
+                    self._dispatch(text, tailer)
+                if catch_up is None:
+                    tailer.wait()
+                elif next(catch_up, StopIteration) is StopIteration:
+                    catch_up = None
+                    self._store_deferred()
         except Exception as e:
             print(f"[ChatLogListener] Error: {e}")
+        finally:
+            self._deferred = None
+            tailer.close()
+
+    def _store_deferred(self) -> None:
+        assert self.event_repository is not None
+        events, at = self._deferred or [], self._deferred_at
+        self._deferred = self._deferred_at = None
+        if at is not None:
+            self.event_repository.append(events, self.chat_log_path, *at)
@@ -0,0 +1,171 @@
+# python
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from src.map.coverage_store import CoverageStore
+from src.map.map_utils import PlanetGeometry
+
+# liczba ustawionych bitów dla każdej wartości bajtu
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class CoverageGap(NamedTuple):
+    """Largest circle with no coverage inside; a suggested next probe spot."""
+
+    x: float
+    y: float
+    radius_px: float
+    lon: float
+    lat: float
+    radius_coord: float
+
+
+class CoverageAnalytics:
+    """
+    Surveyed-area statistics over a CoverageStore.
+
+    Covered fractions are counted straight from the packed bits. Gap finding
+    runs a Euclidean distance transform on a coarse grid (one cell per
+    ``analysis_px`` scene pixels, covered if any stored bit inside is set),
+    which is kept up to date from ``mark_dirty`` instead of being rebuilt.
+    """
+
+    def __init__(
+        self, store: CoverageStore, geometry: PlanetGeometry, analysis_px: int = 8
+    ) -> None:
+        if analysis_px % store.cell_px:
+            raise ValueError("analysis_px must be a multiple of the store cell size")
+        self.store = store
+        self.geometry = geometry
+        self.analysis_px = analysis_px
+        self._factor = analysis_px // store.cell_px
+        self._coarse: Optional["np.ndarray[Any, np.dtype[np.bool_]]"] = None
+        self._border: Optional["np.ndarray[Any, np.dtype[np.float32]]"] = None
+        self._gaps: Optional[List[CoverageGap]] = None
+        self._gap_key: Optional[Tuple[int, float]] = None  # (count, min_radius_px)
+
+    def covered_fraction(
+        self, lon0: float, lat0: float, lon1: float, lat1: float
+    ) -> float:
+        """Surveyed fraction (0..1) of the lon/lat rectangle, clipped to the map."""
+        x0, y0 = self.geometry.lonlat_to_scene(lon0, lat0)
+        x1, y1 = self.geometry.lonlat_to_scene(lon1, lat1)
+        return self.covered_fraction_scene(x0, y0, x1, y1)
+
+    def covered_fraction_scene(
+        self, x0: float, y0: float, x1: float, y1: float
+    ) -> float:
+        """Surveyed fraction (0..1) of a scene rectangle, clipped to the map."""
+        cell = self.store.cell_px
+        c0 = max(0, int(min(x0, x1) // cell))
+        c1 = min(self.store.cols, int(-(-max(x0, x1) // cell)))
+        r0 = max(0, int(min(y0, y1) // cell))
+        r1 = min(self.store.rows, int(-(-max(y0, y1) // cell)))
+        if c0 >= c1 or r0 >= r1:
+            return 0.0
+
+        # pełne bajty przez tablicę popcount, resztki na brzegach rozpakowane
+        b0, b1 = -(-c0 // 8), c1 // 8
+        if b0 >= b1:
+            covered = int(np.count_nonzero(self.store.cells(c0, r0, c1, r1)))
+        else:
+            packed = self.store.bits[r0:r1, b0:b1]
+            covered = int(_POPCOUNT[packed].sum(dtype=np.int64))
+            covered += int(np.count_nonzero(self.store.cells(c0, r0, b0 * 8, r1)))
+            covered += int(np.count_nonzero(self.store.cells(b1 * 8, r0, c1, r1)))
+        return covered / ((c1 - c0) * (r1 - r0))
+
+    def mark_dirty(self, x: float, y: float, radius: float) -> None:
+        """Refresh the coarse grid under a brush stroke at scene (x, y)."""
+        if self._coarse is None:
+            return  # siatka powstanie w całości przy pierwszym użyciu
+        span = self.analysis_px
+        self._update_coarse(
+            max(0, int((y - radius) // span)),
+            max(0, int((x - radius) // span)),
+            int((y + radius) // span) + 1,
+            int((x + radius) // span) + 1,
+        )
+        self._gaps = None
+
+    def largest_gaps(
+        self, count: int = 5, min_radius_px: float = 0.0
+    ) -> List[CoverageGap]:
+        """Up to ``count`` non-overlapping uncovered circles, largest first."""
+        key = (count, min_radius_px)
+        if self._gaps is not None and self._gap_key == key:
+            return self._gaps
+
+        coarse = self._coarse_grid()
+        gaps: List[CoverageGap] = []
+        if coarse.any():
+            free = (~coarse).view(np.uint8)
+            # maska 5x5: błąd rzędu 1-2%, kilka razy szybciej niż DIST_MASK_PRECISE
+            dist = cv2.distanceTransform(free, cv2.DIST_L2, 5)
+            # okrąg musi się zmieścić w mapie
+            np.minimum(dist, self._border_distance(), out=dist)
+
+            rows, cols = dist.shape
+            for _ in range(count):
+                row, col = np.unravel_index(int(np.argmax(dist)), dist.shape)
+                radius = float(dist[row, col])
+                if radius <= 0 or radius * self.analysis_px < min_radius_px:
+                    break
+                gaps.append(self._gap(col + 0.5, row + 0.5, radius))
+                # kolejne okręgi nie mogą nachodzić na wybrany; wpływ sięga
+                # najwyżej 2 * radius, bo radius jest maksimum całej siatki
+                reach = int(2 * radius) + 1
+                r0, r1 = max(0, row - reach), min(rows, row + reach + 1)
+                c0, c1 = max(0, col - reach), min(cols, col + reach + 1)
+                ys = np.arange(r0 - row, r1 - row, dtype=np.float32)[:, None]
+                xs = np.arange(c0 - col, c1 - col, dtype=np.float32)[None, :]
+                away = np.maximum(np.hypot(xs, ys) - radius, 0)
+                window = dist[r0:r1, c0:c1]
+                np.minimum(window, away, out=window)
+
+        self._gaps = gaps
+        self._gap_key = key
+        return gaps
+
+    def _gap(self, col: float, row: float, radius: float) -> CoverageGap:
+        x, y = col * self.analysis_px, row * self.analysis_px
+        lon, lat = self.geometry.scene_to_lonlat(x, y)
+        radius_px = radius * self.analysis_px
+        return CoverageGap(
+            x, y, radius_px, lon, lat, radius_px / self.geometry.lon_scale
+        )
+
+    def _border_distance(self) -> "np.ndarray[Any, np.dtype[np.float32]]":
+        if self._border is None:
+            rows, cols = self._coarse_grid().shape
+            ys = np.arange(rows, dtype=np.float32)[:, None] + 0.5
+            xs = np.arange(cols, dtype=np.float32)[None, :] + 0.5
+            self._border = np.minimum(
+                np.minimum(xs, cols - xs), np.minimum(ys, rows - ys)
+            )
+        return self._border
+
+    def _coarse_grid(self) -> "np.ndarray[Any, np.dtype[np.bool_]]":
+        if self._coarse is None:
+            f = self._factor
+            self._coarse = np.zeros(
+                (-(-self.store.rows // f), -(-self.store.cols // f)), dtype=bool
+            )
+            self._update_coarse(0, 0, *self._coarse.shape)
+        return self._coarse
+
+    def _update_coarse(self, r0: int, c0: int, r1: int, c1: int) -> None:
+        assert self._coarse is not None
+        r1, c1 = min(r1, self._coarse.shape[0]), min(c1, self._coarse.shape[1])
+        if r0 >= r1 or c0 >= c1:
+            return
+        f = self._factor
+        fine = self.store.cells(c0 * f, r0 * f, c1 * f, r1 * f)
+        # ostatni wiersz/kolumna mogą być przycięte do mapy – dopełnij zerami
+        padded = np.zeros(((r1 - r0) * f, (c1 - c0) * f), dtype=bool)
+        padded[: fine.shape[0], : fine.shape[1]] = fine
+        self._coarse[r0:r1, c0:c1] = padded.reshape(r1 - r0, f, c1 - c0, f).any(
+            axis=(1, 3)
+        )
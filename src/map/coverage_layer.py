@@ -0,0 +1,142 @@
+# python
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtGui import QColor, QImage, QPixmap
+from PyQt6.QtWidgets import QGraphicsPixmapItem, QGraphicsScene
+
+from src.map.coverage_store import CoverageStore
+
+# (tx, ty) – indeks kafla warstwy pokrycia
+CoverageKey = Tuple[int, int]
+
+
+class CoverageLayer:
+    """
+    Explored-area overlay drawn from a CoverageStore, split into square tiles.
+
+    A brush stroke marks cells in the store and re-renders only the tiles its
+    bounding box touches, so the cost of one update depends on the brush size,
+    not on the map size. Tiles holding history from earlier sessions are
+    rendered lazily, when they first intersect the visible rect.
+    """
+
+    def __init__(
+        self,
+        store: CoverageStore,
+        map_width: int,
+        map_height: int,
+        tile_size: int = 256,
+        color: QColor | None = None,
+        opacity: float = 0.35,
+        z_value: float = 10_000,
+    ) -> None:
+        if tile_size % store.cell_px:
+            raise ValueError("tile_size must be a multiple of the store cell size")
+        self.store = store
+        self.map_width = map_width
+        self.map_height = map_height
+        self.tile_size = tile_size
+        self.opacity = opacity
+        self.z_value = z_value
+        self.scene: QGraphicsScene | None = None
+        self._items: Dict[CoverageKey, QGraphicsPixmapItem] = {}
+        self._empty: Set[CoverageKey] = set()  # sprawdzone i bez pokrycia
+        if color is None:
+            color = QColor(32, 160, 255, 110)  # niebieski półprzezr.
+        # ARGB32 premultiplied jako uint32 (little endian: B, G, R, A w pamięci)
+        a = color.alpha()
+        self._pixel = np.uint32(
+            (a << 24)
+            | (color.red() * a // 255) << 16
+            | (color.green() * a // 255) << 8
+            | color.blue() * a // 255
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def attach(self, scene: QGraphicsScene) -> None:
+        """Add rendered tile items to ``scene`` (painting before attach is allowed)."""
+        if self.scene is scene:
+            return
+        self.detach()
+        self.scene = scene
+        for item in self._items.values():
+            scene.addItem(item)
+
+    def detach(self) -> None:
+        """Remove tile items from the scene; the store keeps the coverage."""
+        if self.scene is None:
+            return
+        for item in self._items.values():
+            self.scene.removeItem(item)
+        self.scene = None
+
+    def update_visible(self, rect: QRectF) -> None:
+        """Render stored coverage for tiles in ``rect`` that are not drawn yet."""
+        for key in self._tiles_in_rect(rect):
+            if key in self._items or key in self._empty:
+                continue
+            if self.store.any_in(*self._cell_block(key)):
+                self._render(key)
+            else:
+                self._empty.add(key)
+
+    def paint(self, pos: QPointF, radius: float) -> List[CoverageKey]:
+        """Mark a filled circle at ``pos``; returns the tiles that were redrawn."""
+        x, y = pos.x(), pos.y()
+        if not (0 <= x < self.map_width and 0 <= y < self.map_height):
+            return []
+        if not self.store.mark_disc(x, y, radius):
+            return []  # wszystko już było zbadane
+
+        dirty = self._tiles_in_rect(
+            QRectF(x - radius, y - radius, radius * 2, radius * 2)
+        )
+        for key in dirty:
+            self._empty.discard(key)
+            self._render(key)
+        return dirty
+
+    def _tiles_in_rect(self, rect: QRectF) -> List[CoverageKey]:
+        size = self.tile_size
+        x0 = max(0, int(rect.left() // size))
+        y0 = max(0, int(rect.top() // size))
+        x1 = min((self.map_width - 1) // size, int(rect.right() // size))
+        y1 = min((self.map_height - 1) // size, int(rect.bottom() // size))
+        return [(tx, ty) for ty in range(y0, y1 + 1) for tx in range(x0, x1 + 1)]
+
+    def _cell_block(self, key: CoverageKey) -> Tuple[int, int, int, int]:
+        span = self.tile_size // self.store.cell_px
+        return key[0] * span, key[1] * span, (key[0] + 1) * span, (key[1] + 1) * span
+
+    def _render(self, key: CoverageKey) -> None:
+        cell = self.store.cell_px
+        covered = self.store.cells(*self._cell_block(key))
+        # komórka -> cell x cell pikseli; kafle na krawędzi przycięte do mapy
+        width = min(self.tile_size, self.map_width - key[0] * self.tile_size)
+        height = min(self.tile_size, self.map_height - key[1] * self.tile_size)
+        mask = covered.repeat(cell, axis=0).repeat(cell, axis=1)[:height, :width]
+        # QImage ma własny bufor – QPixmap.fromImage może go współdzielić
+        image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        bits = image.bits()
+        bits.setsize(image.sizeInBytes())
+        pixels = np.frombuffer(bits, dtype=np.uint32).reshape(
+            height, image.bytesPerLine() // 4
+        )
+        pixels[:, :width] = np.where(mask, self._pixel, np.uint32(0))
+        pixmap = QPixmap.fromImage(image)
+
+        item = self._items.get(key)
+        if item is not None:
+            item.setPixmap(pixmap)
+            return
+        item = QGraphicsPixmapItem(pixmap)
+        item.setPos(key[0] * self.tile_size, key[1] * self.tile_size)
+        item.setZValue(self.z_value)  # nad markerami i mapą
+        item.setOpacity(self.opacity)
+        self._items[key] = item
+        if self.scene is not None:
+            self.scene.addItem(item)
@@ -0,0 +1,157 @@
+# python
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Optional
+
+import numpy as np
+
+# Nagłówek pliku: magic, kolumny, wiersze, rozmiar komórki w px; dalej bity wierszami
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"COV1"
+
+
+class CoverageStore:
+    """
+    Surveyed-area bitmap for one planet, one bit per ``cell_px`` x ``cell_px``
+    block of scene pixels, memory-mapped from ``path``.
+
+    Rows are bit-packed (MSB first), so Calypso at 2 px cells takes ~650 KB
+    instead of an 85 MB ARGB image. Opening maps the file without reading it.
+    Writes go straight into the mapping; a background thread msyncs it every
+    ``flush_interval`` seconds while there are unsaved changes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        map_width: int,
+        map_height: int,
+        cell_px: int = 2,
+        flush_interval: float = 5.0,
+    ) -> None:
+        if cell_px <= 0:
+            raise ValueError("cell_px must be positive")
+        self.path = path
+        self.cell_px = cell_px
+        self.cols = -(-map_width // cell_px)
+        self.rows = -(-map_height // cell_px)
+        self.stride = -(-self.cols // 8)
+        self.flush_interval = flush_interval
+
+        size = _HEADER.size + self.rows * self.stride
+        self._file = self._open_file(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        self.bits: "np.ndarray[Any, np.dtype[np.uint8]]" = np.ndarray(
+            (self.rows, self.stride),
+            dtype=np.uint8,
+            buffer=self._mm,
+            offset=_HEADER.size,
+        )
+
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def _open_file(self, size: int) -> Any:
+        expected = _HEADER.pack(_MAGIC, self.cols, self.rows, self.cell_px)
+        if os.path.exists(self.path):
+            f = open(self.path, "r+b")
+            header = f.read(_HEADER.size)
+            if header == expected and os.fstat(f.fileno()).st_size == size:
+                return f
+            f.close()
+            # inna rozdzielczość/rozmiar mapy – starej historii nie da się nałożyć
+            print(f"[CoverageStore] {self.path} does not match the map, starting over")
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        f = open(self.path, "w+b")
+        f.write(expected)
+        f.truncate(size)  # zera = nic nie zbadane
+        f.flush()
+        return f
+
+    def mark_disc(self, x: float, y: float, radius: float) -> int:
+        """Set all cells whose centre lies within ``radius`` of scene (x, y).
+
+        Returns the number of cells that were not covered before.
+        """
+        cell = self.cell_px
+        c0 = max(0, int((x - radius) // cell))
+        c1 = min(self.cols - 1, int((x + radius) // cell))
+        r0 = max(0, int((y - radius) // cell))
+        r1 = min(self.rows - 1, int((y + radius) // cell))
+        if c0 > c1 or r0 > r1:
+            return 0
+
+        cx = (np.arange(c0, c1 + 1) + 0.5) * cell - x
+        cy = (np.arange(r0, r1 + 1) + 0.5) * cell - y
+        disc = cx[None, :] ** 2 + cy[:, None] ** 2 <= radius * radius
+
+        b0, b1 = c0 // 8, c1 // 8 + 1
+        region = self.bits[r0 : r1 + 1, b0:b1]
+        old = np.unpackbits(region, axis=1)
+        lo = c0 - b0 * 8
+        window = old[:, lo : lo + disc.shape[1]]
+        added = int(np.count_nonzero(disc & (window == 0)))
+        if added:
+            window |= disc
+            region[:] = np.packbits(old, axis=1)
+            with self._lock:
+                self._dirty = True
+            self._ensure_flusher()
+        return added
+
+    def cells(
+        self, c0: int, r0: int, c1: int, r1: int
+    ) -> "np.ndarray[Any, np.dtype[np.bool_]]":
+        """Covered flags for the cell block [r0, r1) x [c0, c1), clipped to the map."""
+        c0, r0 = max(0, c0), max(0, r0)
+        c1, r1 = min(self.cols, c1), min(self.rows, r1)
+        if c0 >= c1 or r0 >= r1:
+            return np.zeros((max(0, r1 - r0), max(0, c1 - c0)), dtype=bool)
+        b0 = c0 // 8
+        unpacked = np.unpackbits(self.bits[r0:r1, b0 : -(-c1 // 8)], axis=1)
+        lo = c0 - b0 * 8
+        return unpacked[:, lo : lo + c1 - c0].astype(bool)
+
+    def any_in(self, c0: int, r0: int, c1: int, r1: int) -> bool:
+        """Cheap emptiness check on whole bytes covering the cell block."""
+        return bool(
+            self.bits[max(0, r0) : r1, max(0, c0) // 8 : -(-c1 // 8)].any()
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+        # msync zapisuje tylko zmienione strony
+        self._mm.flush()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        del self.bits  # numpy trzyma bufor mmap – bez tego close() się nie uda
+        self._mm.close()
+        self._file.close()
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None or self._stop_event.is_set():
+            return
+        self._thread = threading.Thread(
+            target=self._flush_worker, name="CoverageFlush", daemon=True
+        )
+        self._thread.start()
+
+    def _flush_worker(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except (OSError, ValueError) as e:
+                print(f"[CoverageStore] Flush failed: {e}")
@@ -1,4 +1,7 @@
-from typing import Tuple, Dict, Any, cast
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple, cast
+
+import numpy as np
 
 
 def get_planet_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -6,35 +9,99 @@ def get_planet_config(config: Dict[str, Any]) -> Dict[str, Any]:
     return cast(Dict[str, Any], config["planets"][current_planet])
 
 
+@dataclass(frozen=True, slots=True)
+class PlanetGeometry:
+    """
+    Lon/lat <-> scene pixel transform for one planet, built once per planet.
+
+    Both directions are plain affine maps (scale + offset per axis); the scene
+    y axis points down, so lat has a negative scale.
+    """
+
+    name: str
+    map_width: int
+    map_height: int
+    lon_scale: float
+    lon_offset: float
+    lat_scale: float
+    lat_offset: float
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], planet: str) -> "PlanetGeometry":
+        planet_config = config["planets"][planet]
+        tile_size = config["map"]["tile_size"]
+        map_width = planet_config["tile_count_x"] * tile_size
+        map_height = planet_config["tile_count_y"] * tile_size
+        lon_range = planet_config["max_lon"] - planet_config["min_lon"]
+        lat_range = planet_config["max_lat"] - planet_config["min_lat"]
+        if lon_range == 0 or lat_range == 0:
+            raise ValueError(f"Planet {planet} has an empty lon/lat range")
+
+        # x = lon * lon_scale + lon_offset ; y = lat * lat_scale + lat_offset
+        lon_scale = map_width / lon_range
+        lat_scale = -map_height / lat_range
+        return cls(
+            name=planet,
+            map_width=map_width,
+            map_height=map_height,
+            lon_scale=lon_scale,
+            lon_offset=-planet_config["min_lon"] * lon_scale,
+            lat_scale=lat_scale,
+            lat_offset=map_height - planet_config["min_lat"] * lat_scale,
+        )
+
+    def lonlat_to_scene(self, lon: float, lat: float) -> Tuple[float, float]:
+        return (
+            lon * self.lon_scale + self.lon_offset,
+            lat * self.lat_scale + self.lat_offset,
+        )
+
+    def scene_to_lonlat(self, x: float, y: float) -> Tuple[float, float]:
+        return (
+            (x - self.lon_offset) / self.lon_scale,
+            (y - self.lat_offset) / self.lat_scale,
+        )
+
+    def lonlat_to_scene_array(
+        self, lon: "np.ndarray[Any, Any]", lat: "np.ndarray[Any, Any]"
+    ) -> Tuple["np.ndarray[Any, Any]", "np.ndarray[Any, Any]"]:
+        """Vectorized lonlat_to_scene for arrays of equal shape."""
+        x = np.asarray(lon, dtype=np.float64) * self.lon_scale + self.lon_offset
+        y = np.asarray(lat, dtype=np.float64) * self.lat_scale + self.lat_offset
+        return x, y
+
+    def scene_to_lonlat_array(
+        self, x: "np.ndarray[Any, Any]", y: "np.ndarray[Any, Any]"
+    ) -> Tuple["np.ndarray[Any, Any]", "np.ndarray[Any, Any]"]:
+        """Vectorized scene_to_lonlat for arrays of equal shape."""
+        lon = (np.asarray(x, dtype=np.float64) - self.lon_offset) / self.lon_scale
+        lat = (np.asarray(y, dtype=np.float64) - self.lat_offset) / self.lat_scale
+        return lon, lat
+
+    def coord_to_pixel_radius(self, radius_coord: float) -> int:
+        return int(radius_coord * self.lon_scale)
+
+
+_GEOMETRY_CACHE: Dict[Tuple[str, int], PlanetGeometry] = {}
+
+
+def get_planet_geometry(config: Dict[str, Any]) -> PlanetGeometry:
+    """Shared PlanetGeometry for the current planet (config["map"]["planet"])."""
+    key = (config["map"]["planet"], config["map"]["tile_size"])
+    geometry = _GEOMETRY_CACHE.get(key)
+    if geometry is None:
+        geometry = PlanetGeometry.from_config(config, key[0])
+        _GEOMETRY_CACHE[key] = geometry
+    return geometry
+
+
 def coord_to_pixel_radius(config: Dict[str, Any]) -> int:
-    planet_config = get_planet_config(config)
-    tile_size = config["map"]["tile_size"]
-    radius_coord = config["player"]["radius_coord"]
-    map_width = planet_config["tile_count_x"] * tile_size
-    lon_range = planet_config["max_lon"] - planet_config["min_lon"]
-    if lon_range == 0:
-        print("Error: Longitude range is zero.")
-        return 0
-    print("coord_to_pixel_radius output: ", int((radius_coord / lon_range) * map_width))
-    return int((radius_coord / lon_range) * map_width)
-
-
-def lonlat_to_scene(lon: float, lat: float, config: Dict[str, Any]) -> Tuple[int, int]:
-    planet_config = get_planet_config(config)
-    tile_size = config["map"]["tile_size"]
-    map_width = planet_config["tile_count_x"] * tile_size
-    map_height = planet_config["tile_count_y"] * tile_size
-    x = (
-                (lon - planet_config["min_lon"])
-                / (planet_config["max_lon"] - planet_config["min_lon"])
-        ) * map_width
-    y = (
-            map_height
-            - (
-                    (lat - planet_config["min_lat"])
-                    / (planet_config["max_lat"] - planet_config["min_lat"])
-            )
-            * map_height
+    return get_planet_geometry(config).coord_to_pixel_radius(
+        config["player"]["radius_coord"]
     )
-    print("lonlat_to_Scene output: ", x, y)
-    return x, y
+
+
+def lonlat_to_scene(
+    lon: float, lat: float, config: Dict[str, Any]
+) -> Tuple[float, float]:
+    return get_planet_geometry(config).lonlat_to_scene(lon, lat)
@@ -1,17 +1,19 @@
 # python
 from typing import Any, Dict
 
-from PyQt6.QtGui import QMouseEvent, QWheelEvent
+from PyQt6.QtCore import QRectF, pyqtSignal
+from PyQt6.QtGui import QMouseEvent, QResizeEvent, QWheelEvent
 from PyQt6.QtWidgets import QGraphicsView, QLabel
 
-from src.map.map_utils import get_planet_config
+from src.map.map_utils import PlanetGeometry, get_planet_geometry
 
 
 class MapView(QGraphicsView):
+    viewport_changed = pyqtSignal(QRectF, float)  # visible scene rect, view scale
+
     def __init__(self, scene: Any, config: Dict[str, Any]) -> None:
         super().__init__(scene)
-        self.planet_config = get_planet_config(config)
-        self.tile_size = config["map"]["tile_size"]
+        self.planet_geometry = get_planet_geometry(config)
         self.setMouseTracking(True)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
@@ -24,6 +26,9 @@ class MapView(QGraphicsView):
         self.coordinates_label.setGeometry(10, 10, 100, 50)
         self.coordinates_label.setText("Koordynaty: ")
 
+    def set_planet_geometry(self, planet_geometry: PlanetGeometry) -> None:
+        self.planet_geometry = planet_geometry
+
     def wheelEvent(self, event: QWheelEvent | None) -> None:
         if event is not None:
             if event.angleDelta().y() > 0:
@@ -31,19 +36,32 @@ class MapView(QGraphicsView):
             elif event.angleDelta().y() < 0:
                 self.scale(1 / self.zoom_factor, 1 / self.zoom_factor)
             event.accept()
+            self._emit_viewport_changed()
+
+    def visible_scene_rect(self) -> QRectF:
+        return self.mapToScene(self.viewport().rect()).boundingRect()
+
+    def current_scale(self) -> float:
+        return self.transform().m11()
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        super().scrollContentsBy(dx, dy)
+        self._emit_viewport_changed()
+
+    def resizeEvent(self, event: QResizeEvent | None) -> None:
+        super().resizeEvent(event)
+        self._emit_viewport_changed()
+
+    def _emit_viewport_changed(self) -> None:
+        # podczas zamykania scena może już nie istnieć
+        if self.scene() is not None:
+            self.viewport_changed.emit(self.visible_scene_rect(), self.current_scale())
 
     def mouseMoveEvent(self, event: QMouseEvent | None) -> None:
         if event is not None:
             cursor_pos = self.mapToScene(event.pos())
-
-            map_width = self.planet_config["tile_count_x"] * self.tile_size
-            map_height = self.planet_config["tile_count_y"] * self.tile_size
-
-            lon = self.planet_config["min_lon"] + (cursor_pos.x() / map_width) * (
-                self.planet_config["max_lon"] - self.planet_config["min_lon"]
-            )
-            lat = self.planet_config["min_lat"] + ((map_height - cursor_pos.y()) / map_height) * (
-                self.planet_config["max_lat"] - self.planet_config["min_lat"]
+            lon, lat = self.planet_geometry.scene_to_lonlat(
+                cursor_pos.x(), cursor_pos.y()
             )
 
             self.coordinates_label.setText(
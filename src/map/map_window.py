@@ -1,23 +1,34 @@
 # python
-import glob
 import os
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Dict, List
 
-from PIL import Image
 from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF, QRect
-from PyQt6.QtGui import QBrush, QColor, QImage, QPainter, QPen, QPixmap, QFont
+from PyQt6.QtGui import (
+    QBrush,
+    QCloseEvent,
+    QColor,
+    QFont,
+    QPainter,
+    QPen,
+)
 from PyQt6.QtWidgets import (
     QGraphicsEllipseItem,
-    QGraphicsPixmapItem,
     QGraphicsScene,
     QGraphicsView,
     QMainWindow, QGraphicsTextItem,
 )
 
 from src.app.app_context import AppContext
-from src.map.map_utils import get_planet_config
+from src.map.coverage_analytics import CoverageAnalytics
+from src.map.coverage_layer import CoverageLayer
+from src.map.coverage_store import CoverageStore
+from src.map.map_utils import get_planet_config, get_planet_geometry
 from src.map.map_view import MapView
-from src.models.deed_model import DeedModel
+from src.map.stats_panel import MiningStatsPanel
+from src.map.tile_cache import TileCache
+from src.map.tile_loader import TileLoader
+from src.models.deed_model import DeedModel, DeedTicks
 
 
 class MapWindow(QMainWindow):
@@ -47,7 +58,32 @@ class MapWindow(QMainWindow):
         # Background color
         self.scene.setBackgroundBrush(QColor("#1a2f44"))
 
-        # Load map tiles
+        # Coverage (explored area), zapisywane per planeta i wczytywane z mapą;
+        # „pędzel” to promień w pikselach sceny
+        self.coverage_config = self.config.get("coverage", {})
+        self.coverage: CoverageLayer | None = None
+        self._coverage_layers: Dict[str, CoverageLayer] = {}  # planet -> warstwa
+        self._brush_radius_px = int(self.coverage_config.get("brush_radius_px", 14))
+
+        # Analityka pokrycia: % zbadanego widoku + największe luki jako okręgi
+        self.coverage_analytics: CoverageAnalytics | None = None
+        self._coverage_analytics: Dict[str, CoverageAnalytics] = {}
+        self._gap_items: List[QGraphicsEllipseItem] = []
+        self._analytics_timer = QTimer(self)
+        self._analytics_timer.setSingleShot(True)
+        self._analytics_timer.setInterval(
+            int(self.coverage_config.get("analytics_interval_ms", 250))
+        )
+        self._analytics_timer.timeout.connect(self._refresh_coverage_overlay)
+
+        # Load map tiles (decoded RGBA is cached on disk between launches)
+        self.tile_cache = TileCache(self.config["map"]["tile_cache_dir"])
+        self.tile_loader: TileLoader | None = None
+        # ostatnio opuszczone planety z ciepłymi pixmapami – powrót bez dekodowania;
+        # każdy loader ma własny budżet, więc ich liczba jest ograniczona
+        self._warm_loaders: "OrderedDict[str, TileLoader]" = OrderedDict()
+        self._warm_planets = int(self.config["map"]["tile_warm_planets"])
+        self.view.viewport_changed.connect(self._on_viewport_changed)
         self.load_map_tiles(self.planet_config["tile_folder"])
 
         # Player position
@@ -74,52 +110,47 @@ class MapWindow(QMainWindow):
         self.bus.deed_marker_added.connect(self._on_deed_marker_added)
         self.bus.deed_marker_updated.connect(self._on_deed_marker_updated)
         self.bus.deed_marker_removed.connect(self._on_deed_marker_removed)
-        self.bus.deed_marker_tick.connect(self._on_deed_marker_tick)
+        self.bus.deed_markers_ticked.connect(self._on_deed_markers_ticked)
+        # etykiety poza widokiem: marker_id -> TTL do pokazania po przewinięciu
+        self._stale_labels: Dict[str, int] = {}
 
         #Resource Claimed
         self.bus.resource_claimed.connect(self._on_resource_claimed)
 
+        # Statystyki biegu wydobycia (sesja + okno kroczące), panel dokowany
+        stats_config = self.config.get("mining_stats", {})
+        self.stats_panel = MiningStatsPanel(
+            self, top_resources=int(stats_config.get("top_resources", 5))
+        )
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.stats_panel)
+        self.bus.mining_stats_updated.connect(self.stats_panel.show_snapshot)
+
+        # Planet switch
+        self.bus.planet_changed.connect(self.switch_planet)
+
     def load_map_tiles(self, tile_folder: Any) -> None:
+        """Set up the scene for the planet; tiles are loaded on demand by the view."""
+        planet = self.config["map"]["planet"]
         total_w = self.planet_config["tile_count_x"] * self.tile_size
         total_h = self.planet_config["tile_count_y"] * self.tile_size
-        added = 0
-
-        for y in range(self.planet_config["tile_count_y"]):
-            for x in range(self.planet_config["tile_count_x"]):
-                tile_index = y * self.planet_config["tile_count_x"] + x
-                tile_pattern = os.path.join(tile_folder, f"map_*_{tile_index}.dds")
-                tile_files = glob.glob(tile_pattern)
-
-                if not tile_files:
-                    print(f"File does not exist: {tile_pattern}")
-                    continue
-
-                tile_path = tile_files[0]
-                try:
-                    img = Image.open(tile_path).convert("RGBA")
-                    data = img.tobytes("raw", "RGBA")
-                    bytes_per_line = img.width * 4
-
-                    qt_image = QImage(
-                        data,
-                        img.width,
-                        img.height,
-                        bytes_per_line,
-                        QImage.Format.Format_RGBA8888,
-                    ).copy()
-
-                    tile_x = x * self.tile_size
-                    tile_y = y * self.tile_size
-
-                    tile_item = QGraphicsPixmapItem(QPixmap.fromImage(qt_image))
-                    tile_item.setPos(tile_x, tile_y)
-                    tile_item.setTransformationMode(
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    self.scene.addItem(tile_item)
-                    added += 1
-                except Exception as e:
-                    print(f"Failed to load file {tile_path}: {e}")
+
+        self.tile_loader = self._warm_loaders.pop(planet, None)
+        if self.tile_loader is None:
+            self.tile_loader = TileLoader(
+                self.scene,
+                self.tile_cache,
+                planet,
+                {**self.planet_config, "tile_folder": tile_folder},
+                self.tile_size,
+                budget_bytes=self.config["map"]["tile_budget_mb"] * 1024 * 1024,
+                prefetch=self.config["map"]["tile_prefetch"],
+                use_pyramid=self.config["map"]["tile_pyramid"],
+                workers=self.config["map"]["tile_workers"],
+            )
+        # dopiero teraz – planeta, na którą wracamy, nie może wypaść z LRU
+        while len(self._warm_loaders) > self._warm_planets:
+            _, evicted = self._warm_loaders.popitem(last=False)
+            evicted.shutdown()  # powrót na tę planetę czyta kafle z cache na dysku
 
         # Scene rect
         self.scene.setSceneRect(0, 0, total_w, total_h)
@@ -128,46 +159,87 @@ class MapWindow(QMainWindow):
         self.map_width = int(total_w)
         self.map_height = int(total_h)
 
-        if added == 0:
-            print(
-                "Uwaga: nie dodano żadnych kafli. Sprawdź ścieżkę tile_folder oraz obsługę DDS."
-            )
+        self._open_coverage_layer(planet)
+        self._on_viewport_changed(
+            self.view.visible_scene_rect(), self.view.current_scale()
+        )
+
+    def switch_planet(self, planet: str) -> None:
+        """Swap tiles, scene rect, coordinate transform and coverage to ``planet``."""
+        if planet == getattr(self.tile_loader, "planet", None):
+            return
+        self.config["map"]["planet"] = planet
+
+        # bez odświeżania widoku w trakcie – żadna klatka nie pokaże stanu pośredniego
+        self.view.setUpdatesEnabled(False)
+        try:
+            self._park_tile_loader(self.tile_loader)
+            self.tile_loader = None
+            if self.coverage is not None:
+                self.coverage.detach()
+            for item in self._gap_items:
+                item.setVisible(False)
+
+            self.planet_config = get_planet_config(self.config)
+            self.view.set_planet_geometry(get_planet_geometry(self.config))
+            self.player_rect.setRect(QRectF())
+            self.load_map_tiles(self.planet_config["tile_folder"])
+        finally:
+            self.view.setUpdatesEnabled(True)
+
+    def _park_tile_loader(self, loader: TileLoader) -> None:
+        """Keep the loader of the planet being left warm (trimmed on the next load)."""
+        loader.detach()  # pixmapy zostają w LRU loadera
+        self._warm_loaders[loader.planet] = loader
+
+    def _on_viewport_changed(self, rect: QRectF, scale: float) -> None:
+        if getattr(self, "tile_loader", None) is not None:
+            self.tile_loader.update_visible(rect, scale)
+        if getattr(self, "coverage", None) is not None:
+            self.coverage.update_visible(rect)
+            self._schedule_coverage_overlay()
+        if getattr(self, "_stale_labels", None):
+            self._refresh_stale_labels(rect)
 
     def _on_player_position_changed(self, position: QPointF, rect: QRectF) -> None:
         self.player_pos = position
         self.player_rect.setRect(rect)
+        self.tile_loader.set_focus(position)
         self.center_map_on_player(position)
 
         # ⬇️ coverage
-        self._ensure_coverage_layer()
-        if getattr(self, "_cov_img", None) is None:
+        if self.coverage is None:
             return
 
-        x, y = position.x(), position.y()
-
         # promień pędzla: weź z configu, a jak brak – z rozmiaru 'rect' gracza
-        r = getattr(self, "_brush_radius_px", 5)
+        r = self._brush_radius_px
         if r <= 0:
             r = int(max(rect.width(), rect.height()) * 0.5) or 10
 
-        # clipping (nie rysuj poza obraz)
-        if not (0 <= x < self._cov_img.width() and 0 <= y < self._cov_img.height()):
-            return
-
-        # Rysowanie do bufora (szybko + bez tworzenia nowych itemów)
-        p = QPainter(self._cov_img)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(self._brush_color)
-        p.drawEllipse(position, 4, 4)  # QPointF w scenie == piksele obrazu maski
-        p.end()
-
-        # Zaktualizuj pikselmapę (możesz też zoptymalizować podając brudny rect)
-        self._cov_item.setPixmap(QPixmap.fromImage(self._cov_img))
+        # odświeżane są tylko kafle warstwy, których dotknął pędzel
+        if self.coverage.paint(position, r) and self.coverage_analytics is not None:
+            self.coverage_analytics.mark_dirty(position.x(), position.y(), r)
+            self._schedule_coverage_overlay()
 
     def center_map_on_player(self, position: QPointF) -> None:
         self.view.centerOn(position)
 
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        if self.tile_loader is not None:
+            self.tile_loader.shutdown(wait=True)
+        for loader in self._warm_loaders.values():
+            loader.shutdown(wait=True)
+        self._warm_loaders.clear()
+        # analityka czyta bity magazynów – najpierw ona, potem zamykanie plików
+        self._analytics_timer.stop()
+        self.coverage_analytics = None
+        self._coverage_analytics.clear()
+        for layer in self._coverage_layers.values():
+            layer.store.close()
+        self._coverage_layers.clear()
+        self.coverage = None
+        super().closeEvent(event)
+
     def _on_deed_marker_added(self, marker_id: str, x: float, y: float, radius_px: float, deed: DeedModel):
         dot = QGraphicsEllipseItem(
             x - radius_px, y - radius_px, radius_px * 2, radius_px * 2
@@ -193,7 +265,8 @@ class MapWindow(QMainWindow):
         # Zapisujemy w lokalnej mapie, żeby potem móc odwołać się po marker_id
         self.ui_markers[marker_id] = {
             "dot": dot,
-            "text": text_item
+            "text": text_item,
+            "pos": QPointF(x, y),
         }
 
     def _on_deed_marker_updated(self, marker_id: str, x: float, y: float, radius_px: float, deed: DeedModel):
@@ -203,41 +276,111 @@ class MapWindow(QMainWindow):
                 caption = f"{deed.resource} | {caption}"
             self.ui_markers[marker_id]["text"].setPlainText(caption)
             self.ui_markers[marker_id]["text"].setPos(x + 8, y - 18)
+            self._stale_labels.pop(marker_id, None)
 
     def _on_deed_marker_removed(self, marker_id: str):
         if marker_id in self.ui_markers:
             self.scene.removeItem(self.ui_markers[marker_id]["dot"])
             self.scene.removeItem(self.ui_markers[marker_id]["text"])
             del self.ui_markers[marker_id]
-
-    def _on_deed_marker_tick(self, marker_id: str, ttl_sec: int):
-        if marker_id in self.ui_markers:
-            self.ui_markers[marker_id]["text"].setPlainText(f"{ttl_sec // 60}:{ttl_sec % 60:02}")
+            self._stale_labels.pop(marker_id, None)
+
+    def _on_deed_markers_ticked(self, ticks: DeedTicks) -> None:
+        # setPlainText przelicza layout tekstu – tylko dla etykiet w widoku
+        visible = self.view.visible_scene_rect()
+        for marker_id, ttl_sec in zip(ticks.marker_ids, ticks.ttl_sec, strict=True):
+            ui = self.ui_markers.get(marker_id)
+            if ui is None:
+                continue
+            if visible.contains(ui["pos"]):
+                ui["text"].setPlainText(self._format_ttl(ttl_sec))
+                self._stale_labels.pop(marker_id, None)
+            else:
+                self._stale_labels[marker_id] = ttl_sec
+
+    def _refresh_stale_labels(self, visible: QRectF) -> None:
+        for marker_id, ttl_sec in list(self._stale_labels.items()):
+            ui = self.ui_markers.get(marker_id)
+            if ui is not None and visible.contains(ui["pos"]):
+                ui["text"].setPlainText(self._format_ttl(ttl_sec))
+                del self._stale_labels[marker_id]
+
+    @staticmethod
+    def _format_ttl(ttl_sec: int) -> str:
+        return f"{ttl_sec // 60}:{ttl_sec % 60:02}"
 
     def _on_resource_claimed(self):
         print()
 
-    def _ensure_coverage_layer(self):
-        if getattr(self, "_cov_img", None) is not None:
+    def _open_coverage_layer(self, planet: str) -> None:
+        layer = self._coverage_layers.get(planet)
+        if layer is None:
+            # mapowanie pliku bez czytania – kafle rysują się dopiero w widoku
+            cfg = self.coverage_config
+            store = CoverageStore(
+                os.path.join(cfg.get("store_dir", "data/coverage"), f"{planet}.cov"),
+                self.map_width,
+                self.map_height,
+                cell_px=int(cfg.get("cell_px", 2)),
+                flush_interval=float(cfg.get("flush_interval_sec", 5.0)),
+            )
+            layer = CoverageLayer(
+                store,
+                self.map_width,
+                self.map_height,
+                tile_size=int(cfg.get("tile_size", 256)),
+            )
+            self._coverage_layers[planet] = layer
+            self._coverage_analytics[planet] = CoverageAnalytics(
+                layer.store,
+                get_planet_geometry(self.config),
+                analysis_px=int(cfg.get("analysis_px", 8)),
+            )
+        self.coverage = layer
+        self.coverage.attach(self.scene)
+        self.coverage_analytics = self._coverage_analytics[planet]
+
+    def _schedule_coverage_overlay(self) -> None:
+        # najwyżej jedno przeliczenie na analytics_interval_ms
+        if not self._analytics_timer.isActive():
+            self._analytics_timer.start()
+
+    def _refresh_coverage_overlay(self) -> None:
+        analytics = self.coverage_analytics
+        if analytics is None:
             return
+        cfg = self.coverage_config
+        gaps = analytics.largest_gaps(
+            int(cfg.get("gap_count", 5)), float(cfg.get("gap_min_radius_px", 32))
+        )
+
+        while len(self._gap_items) < len(gaps):
+            item = QGraphicsEllipseItem()
+            pen = QPen(QColor("#ffd54f"), 2, Qt.PenStyle.DashLine)
+            pen.setCosmetic(True)  # ta sama grubość przy każdym zoomie
+            item.setPen(pen)
+            item.setBrush(QBrush(Qt.BrushStyle.NoBrush))
+            item.setZValue(10_001)  # nad warstwą pokrycia
+            self.scene.addItem(item)
+            self._gap_items.append(item)
+        for item, gap in zip(self._gap_items, gaps, strict=False):
+            item.setRect(
+                gap.x - gap.radius_px, gap.y - gap.radius_px,
+                gap.radius_px * 2, gap.radius_px * 2,
+            )
+            item.setVisible(True)
+        for item in self._gap_items[len(gaps):]:
+            item.setVisible(False)
 
-        # upewnij się, że znamy rozmiar mapy
-        w = getattr(self, "map_width", int(self.scene.sceneRect().width()))
-        h = getattr(self, "map_height", int(self.scene.sceneRect().height()))
-        if w <= 0 or h <= 0:
-            return  # jeszcze za wcześnie (brak kafli)
-
-        # półprzezroczysta maska RGBA (pusta)
-        self._cov_img = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
-        self._cov_img.fill(Qt.GlobalColor.transparent)
-
-        # Item pokazujący maskę (na szczycie)
-        self._cov_item = QGraphicsPixmapItem(QPixmap.fromImage(self._cov_img))
-        self._cov_item.setPos(0, 0)
-        self._cov_item.setZValue(10_000)  # nad markerami i mapą
-        self._cov_item.setOpacity(0.35)  # ogólna przezroczystość
-        self.scene.addItem(self._cov_item)
-
-        # „pędzel” – promień w pikselach sceny
-        self._brush_radius_px = int(self.config.get("coverage", {}).get("brush_radius_px", 14))
-        self._brush_color = QColor(32, 160, 255, 110)  # niebieski półprzezr.
\ No newline at end of file
+        visible = self.view.visible_scene_rect()
+        surveyed = analytics.covered_fraction_scene(
+            visible.left(), visible.top(), visible.right(), visible.bottom()
+        )
+        message = f"Surveyed {surveyed:.1%} of view"
+        if gaps:
+            best = gaps[0]
+            message += (
+                f" | largest gap r={best.radius_coord:.0f}"
+                f" at {best.lon:.0f}, {best.lat:.0f}"
+            )
+        self.statusBar().showMessage(message)
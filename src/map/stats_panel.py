@@ -0,0 +1,64 @@
+from typing import List
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QDockWidget, QLabel, QWidget
+
+from src.models.mining_stats_model import MiningStatsSnapshot, RunStats
+
+
+class MiningStatsPanel(QDockWidget):
+    """Small dock with the session and rolling-window mining statistics."""
+
+    def __init__(self, parent: QWidget | None = None, top_resources: int = 5) -> None:
+        super().__init__("Mining run", parent)
+        self.top_resources = top_resources
+        self.setObjectName("MiningStatsPanel")
+        self.setFeatures(
+            QDockWidget.DockWidgetFeature.DockWidgetClosable
+            | QDockWidget.DockWidgetFeature.DockWidgetMovable
+            | QDockWidget.DockWidgetFeature.DockWidgetFloatable
+        )
+        self.label = QLabel("No mining events yet")
+        self.label.setFont(QFont("Consolas", 9))
+        self.label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.label.setContentsMargins(6, 4, 6, 4)
+        self.setWidget(self.label)
+
+    def show_snapshot(self, snapshot: MiningStatsSnapshot) -> None:
+        if not self.isVisible():
+            return  # zamknięty panel nie formatuje tekstu co sekundę
+        window_min = int(snapshot.window_sec // 60)
+        s, w = snapshot.session, snapshot.window
+        lines = [
+            f"{'':<16}{'session':>10}{f'last {window_min}m':>10}",
+            f"{'deeds':<16}{s.deeds:>10}{w.deeds:>10}",
+            f"{'claims':<16}{s.claims:>10}{w.claims:>10}",
+            f"{'depleted':<16}{s.depleted:>10}{w.depleted:>10}",
+            f"{'claims / drop':<16}"
+            f"{s.claims_per_drop:>10.2f}{w.claims_per_drop:>10.2f}",
+            f"{'deeds / hour':<16}{s.deeds_per_hour:>10.1f}{w.deeds_per_hour:>10.1f}",
+            f"{'loot PED':<16}{s.loot_ped:>10.2f}{w.loot_ped:>10.2f}",
+        ]
+        lines += self._mix_lines(s)
+        lines += self._depth_lines(s)
+        self.label.setText("\n".join(lines))
+
+    def _mix_lines(self, stats: RunStats) -> List[str]:
+        if not stats.resource_mix:
+            return []
+        total = max(stats.claims, 1)
+        lines = ["", "resource mix (session)"]
+        for name, n in stats.resource_mix[: self.top_resources]:
+            lines.append(f"  {name[:22]:<22}{n:>6}{100.0 * n / total:>6.0f}%")
+        return lines
+
+    @staticmethod
+    def _depth_lines(stats: RunStats) -> List[str]:
+        if not stats.size_by_depth:
+            return []
+        lines = ["", "avg claim size by depth (session)"]
+        for depth_from, avg_size, n in stats.size_by_depth:
+            lines.append(f"  {f'{depth_from} m+':<12}{avg_size:>10.1f}{n:>6} deeds")
+        return lines
@@ -0,0 +1,130 @@
+# python
+import glob
+import mmap
+import os
+import struct
+import threading
+from typing import Callable, Optional, Tuple
+
+from PIL import Image
+from PyQt6.QtGui import QImage
+
+# Nagłówek pliku cache: magic, szerokość, wysokość; dalej surowe piksele RGBA
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"RGBA"
+
+
+def find_tile_file(tile_folder: str, tile_index: int) -> Optional[str]:
+    """Return the DDS file for a tile index (map_<planet>_<index>.dds) or None."""
+    tile_files = glob.glob(os.path.join(tile_folder, f"map_*_{tile_index}.dds"))
+    return tile_files[0] if tile_files else None
+
+
+def decode_tile(tile_path: str) -> Tuple[int, int, bytes]:
+    """Decode a DDS tile with PIL into raw RGBA bytes."""
+    img = Image.open(tile_path).convert("RGBA")
+    return img.width, img.height, img.tobytes("raw", "RGBA")
+
+
+class TileCache:
+    """
+    On-disk cache of decoded map tiles and pyramid levels as raw RGBA.
+
+    Entries live in <cache_dir>/<planet>/<key>_<signature>.rgba. For source tiles
+    the signature is the DDS file's mtime/size, so editing a tile changes its key
+    and the stale entry is replaced on next load. Warm loads memory-map the entry
+    and wrap it in a QImage without touching PIL.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def source_signature(src_path: str) -> str:
+        st = os.stat(src_path)
+        return f"{st.st_mtime_ns}_{st.st_size}"
+
+    def load(self, planet: str, tile_index: int, src_path: str) -> QImage:
+        """Return the tile as a QImage, decoding and caching it on a miss."""
+
+        def decode() -> QImage:
+            width, height, data = decode_tile(src_path)
+            return QImage(
+                data, width, height, width * 4, QImage.Format.Format_RGBA8888
+            ).copy()
+
+        return self._load_entry(
+            planet, str(tile_index), self.source_signature(src_path), decode
+        )
+
+    def load_level(
+        self,
+        planet: str,
+        level: int,
+        bx: int,
+        by: int,
+        signature: str,
+        build: Callable[[], QImage],
+    ) -> QImage:
+        """Return pyramid block (bx, by) of ``level``; ``build`` makes it on a miss."""
+        return self._load_entry(planet, f"L{level}_{bx}_{by}", signature, build)
+
+    def _load_entry(
+        self, planet: str, key: str, signature: str, build: Callable[[], QImage]
+    ) -> QImage:
+        entry = os.path.join(self.cache_dir, planet, f"{key}_{signature}.rgba")
+        if os.path.exists(entry):
+            try:
+                return self._read_entry(entry)
+            except (OSError, ValueError) as e:
+                print(f"[TileCache] Broken cache entry {entry}: {e}")
+
+        image = build().convertToFormat(QImage.Format.Format_RGBA8888)
+        self._write_entry(entry, key, image)
+        return image
+
+    def clear(self, planet: Optional[str] = None) -> None:
+        """Drop cached entries for one planet (or all planets)."""
+        pattern = os.path.join(self.cache_dir, planet or "*", "*.rgba")
+        for path in glob.glob(pattern):
+            os.remove(path)
+
+    @staticmethod
+    def _read_entry(entry: str) -> QImage:
+        with open(entry, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            magic, width, height = _HEADER.unpack_from(mm, 0)
+            if magic != _MAGIC or len(mm) != _HEADER.size + width * height * 4:
+                raise ValueError("unexpected header or size")
+            view = memoryview(mm)[_HEADER.size:]
+            try:
+                mapped = QImage(
+                    view, width, height, width * 4, QImage.Format.Format_RGBA8888
+                )
+                # detach from the mapping before it is closed
+                image = mapped.copy()
+                del mapped
+            finally:
+                view.release()
+        return image
+
+    @staticmethod
+    def _write_entry(entry: str, key: str, image: QImage) -> None:
+        folder = os.path.dirname(entry)
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        try:
+            os.makedirs(folder, exist_ok=True)
+            for stale in glob.glob(os.path.join(folder, f"{key}_*.rgba")):
+                if stale != entry:
+                    os.remove(stale)
+            # unikalny plik tymczasowy – ten sam blok mogą budować dwa wątki naraz
+            tmp = f"{entry}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, image.width(), image.height()))
+                f.write(bits.asstring())
+            os.replace(tmp, entry)
+        except OSError as e:
+            # cache is best-effort; the decoded tile is still returned
+            print(f"[TileCache] Failed to write {entry}: {e}")
@@ -0,0 +1,338 @@
+# python
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsPixmapItem, QGraphicsScene
+
+from src.map.tile_cache import TileCache, find_tile_file
+
+# (level, bx, by) – blok 2^level x 2^level kafli zapisany jako jeden obraz tile_size
+BlockKey = Tuple[int, int, int]
+
+
+@dataclass
+class TileLoaderStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    decoded: int = 0
+    # ostatnia seria dekodowania: od pierwszego zlecenia do opróżnienia kolejki
+    last_burst_tiles: int = 0
+    last_burst_seconds: float = 0.0
+
+    @property
+    def tiles_per_sec(self) -> float:
+        if self.last_burst_seconds <= 0:
+            return 0.0
+        return self.last_burst_tiles / self.last_burst_seconds
+
+
+class TileLoader(QObject):
+    """
+    Keeps only the tiles around the visible scene rect in the scene.
+
+    Tiles come from a mipmap pyramid: level 0 are the source tiles, level L packs
+    2^L x 2^L source tiles into one ``tile_size`` image drawn at scale 2^L. The
+    level is picked from the view scale so zoomed-out repaints touch a few small
+    pixmaps. Pixmaps are held in an LRU bounded by ``budget_bytes``; blocks that
+    leave the visible rect (plus ``prefetch`` blocks of margin) are removed from
+    the scene and become eviction candidates.
+
+    Missing blocks are decoded on a thread pool, nearest to ``focus`` first, and
+    added to the scene on the GUI thread as each one finishes.
+    """
+
+    _block_ready = pyqtSignal(object, object)  # BlockKey, Optional[QImage]
+
+    def __init__(
+        self,
+        scene: QGraphicsScene,
+        tile_cache: TileCache,
+        planet: str,
+        planet_config: Dict[str, Any],
+        tile_size: int,
+        budget_bytes: int,
+        prefetch: int = 1,
+        use_pyramid: bool = True,
+        workers: int = 4,
+    ) -> None:
+        super().__init__()
+        self.scene = scene
+        self.tile_cache = tile_cache
+        self.planet = planet
+        self.planet_config = planet_config
+        self.tile_size = tile_size
+        self.budget_bytes = budget_bytes
+        self.prefetch = prefetch
+        self.stats = TileLoaderStats()
+
+        longest = max(planet_config["tile_count_x"], planet_config["tile_count_y"])
+        self.max_level = math.ceil(math.log2(longest)) if use_pyramid else 0
+        self.level = 0
+        # punkt, od którego dekodowanie idzie spiralnie (domyślnie środek mapy)
+        self.focus = QPointF(
+            planet_config["tile_count_x"] * tile_size / 2,
+            planet_config["tile_count_y"] * tile_size / 2,
+        )
+
+        self._pixmaps: "OrderedDict[BlockKey, QPixmap]" = OrderedDict()
+        self._pixmap_bytes = 0
+        self._items: Dict[BlockKey, QGraphicsPixmapItem] = {}
+        self._paths: Dict[int, Optional[str]] = {}
+        self._wanted: Set[BlockKey] = set()
+        self._empty: Set[BlockKey] = set()  # bloki bez żadnego kafla (np. ocean)
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="TileDecode"
+        )
+        self._pending: Dict[BlockKey, "Future[Optional[QImage]]"] = {}
+        self._burst_started = 0.0
+        self._burst_tiles = 0
+        self._closed = False
+        self._block_ready.connect(self._on_block_ready)
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._pixmap_bytes
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def shown(self) -> int:
+        """Number of blocks currently in the scene."""
+        return len(self._items)
+
+    def set_focus(self, pos: QPointF) -> None:
+        self.focus = pos
+
+    def level_for_scale(self, scale: float) -> int:
+        """Pyramid level whose texel density best matches the view scale."""
+        if scale <= 0:
+            return self.max_level
+        return max(0, min(self.max_level, int(math.floor(math.log2(1.0 / scale)))))
+
+    def update_visible(self, rect: QRectF, scale: float = 1.0) -> None:
+        """Show blocks intersecting ``rect`` (plus margin) at the ``scale`` level."""
+        self.level = self.level_for_scale(scale)
+        wanted = self._blocks_in_rect(rect, self.level)
+        self._wanted = wanted
+
+        for key in [k for k in self._items if k not in wanted]:
+            self.scene.removeItem(self._items.pop(key))
+        for key in [k for k in self._pending if k not in wanted]:
+            if self._pending[key].cancel():
+                del self._pending[key]
+
+        missing = [
+            k
+            for k in wanted
+            if k not in self._items and k not in self._pending and k not in self._empty
+        ]
+        for key in sorted(missing, key=self._spiral_order):
+            pixmap = self._pixmaps.get(key)
+            if pixmap is not None:
+                self.stats.hits += 1
+                self._pixmaps.move_to_end(key)
+                self._add_item(key, pixmap)
+            else:
+                self._submit(key)
+
+    def detach(self) -> None:
+        """Remove all tile items from the scene but keep cached pixmaps warm."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        for item in self._items.values():
+            self.scene.removeItem(item)
+        self._items.clear()
+        self._wanted = set()
+
+    def clear(self) -> None:
+        """Remove all tile items from the scene and drop cached pixmaps."""
+        self.detach()
+        self._pixmaps.clear()
+        self._pixmap_bytes = 0
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop the decode pool, dropping queued blocks. Blocks still decoding are
+        discarded when they finish; ``wait`` blocks until they have.
+        """
+        self._closed = True
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _blocks_in_rect(self, rect: QRectF, level: int) -> Set[BlockKey]:
+        span = self.tile_size << level
+        count_x = -(-self.planet_config["tile_count_x"] // (1 << level))
+        count_y = -(-self.planet_config["tile_count_y"] // (1 << level))
+        x0 = max(0, int(rect.left() // span) - self.prefetch)
+        y0 = max(0, int(rect.top() // span) - self.prefetch)
+        x1 = min(count_x - 1, int(rect.right() // span) + self.prefetch)
+        y1 = min(count_y - 1, int(rect.bottom() // span) + self.prefetch)
+        return {
+            (level, x, y) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)
+        }
+
+    def _spiral_order(self, key: BlockKey) -> Tuple[int, float]:
+        # najpierw pierścień (odległość Czebyszewa od bloku z fokusem), potem kąt
+        level, bx, by = key
+        span = self.tile_size << level
+        fx, fy = self.focus.x() / span, self.focus.y() / span
+        dx, dy = bx + 0.5 - fx, by + 0.5 - fy
+        return round(max(abs(dx), abs(dy))), math.atan2(dy, dx)
+
+    def _submit(self, key: BlockKey) -> None:
+        if not self._pending:
+            self._burst_started = time.perf_counter()
+            self._burst_tiles = 0
+        try:
+            future = self._pool.submit(self._decode, key)
+        except RuntimeError:
+            return  # pool already shut down
+        self._pending[key] = future
+        future.add_done_callback(lambda f, key=key: self._on_future_done(key, f))
+
+    def _on_future_done(
+        self, key: BlockKey, future: "Future[Optional[QImage]]"
+    ) -> None:
+        # wątek puli: po shutdown() obiekt Qt mógł już zostać usunięty
+        if self._closed or future.cancelled():
+            return
+        try:
+            self._block_ready.emit(key, future.result())
+        except RuntimeError:
+            pass  # wrapped C/C++ object has been deleted
+
+    def _decode(self, key: BlockKey) -> Optional[QImage]:
+        # wątek puli: tylko QImage, QPixmap powstaje w wątku GUI
+        try:
+            return self._block_image(*key)
+        except Exception as e:
+            print(f"[TileLoader] Failed to decode block {key}: {e}")
+            return None
+
+    def _on_block_ready(self, key: BlockKey, image: Optional[QImage]) -> None:
+        if self._pending.pop(key, None) is None:
+            return  # wynik po clear()
+
+        if image is None:
+            self._empty.add(key)
+        else:
+            self.stats.misses += 1
+            self.stats.decoded += 1
+            self._burst_tiles += 1
+            pixmap = QPixmap.fromImage(image)
+            self._pixmaps[key] = pixmap
+            self._pixmap_bytes += self._size_of(pixmap)
+            if key in self._wanted and key not in self._items:
+                self._add_item(key, pixmap)
+            self._evict(self._wanted)
+
+        if not self._pending:
+            self.stats.last_burst_tiles = self._burst_tiles
+            self.stats.last_burst_seconds = time.perf_counter() - self._burst_started
+
+    def _add_item(self, key: BlockKey, pixmap: QPixmap) -> None:
+        level, bx, by = key
+        span = self.tile_size << level
+        item = QGraphicsPixmapItem(pixmap)
+        item.setPos(bx * span, by * span)
+        item.setScale(float(1 << level))
+        item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.scene.addItem(item)
+        self._items[key] = item
+
+    def _block_image(self, level: int, bx: int, by: int) -> Optional[QImage]:
+        if level == 0:
+            count_x = self.planet_config["tile_count_x"]
+            if bx >= count_x or by >= self.planet_config["tile_count_y"]:
+                return None
+            tile_index = by * count_x + bx
+            tile_path = self._tile_path(tile_index)
+            if tile_path is None:
+                return None
+            try:
+                return self.tile_cache.load(self.planet, tile_index, tile_path)
+            except Exception as e:
+                print(f"Failed to load file {tile_path}: {e}")
+                self._paths[tile_index] = None
+                return None
+
+        sources = self._block_sources(level, bx, by)
+        if not sources:
+            return None
+        digest = hashlib.sha1()
+        for tile_index, tile_path in sources:
+            signature = TileCache.source_signature(tile_path)
+            digest.update(f"{tile_index}:{signature};".encode())
+        return self.tile_cache.load_level(
+            self.planet,
+            level,
+            bx,
+            by,
+            digest.hexdigest()[:16],
+            lambda: self._build_block(level, bx, by),
+        )
+
+    def _build_block(self, level: int, bx: int, by: int) -> QImage:
+        # 4 dzieci z poziomu niżej, każde pomniejszone o połowę do swojej ćwiartki
+        half = self.tile_size // 2
+        image = QImage(self.tile_size, self.tile_size, QImage.Format.Format_RGBA8888)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        for dy in (0, 1):
+            for dx in (0, 1):
+                child = self._block_image(level - 1, bx * 2 + dx, by * 2 + dy)
+                if child is None:
+                    continue
+                small = child.scaled(
+                    half,
+                    half,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+                painter.drawImage(dx * half, dy * half, small)
+        painter.end()
+        return image
+
+    def _block_sources(self, level: int, bx: int, by: int) -> List[Tuple[int, str]]:
+        count_x = self.planet_config["tile_count_x"]
+        count_y = self.planet_config["tile_count_y"]
+        span = 1 << level
+        sources: List[Tuple[int, str]] = []
+        for y in range(by * span, min(count_y, (by + 1) * span)):
+            for x in range(bx * span, min(count_x, (bx + 1) * span)):
+                tile_path = self._tile_path(y * count_x + x)
+                if tile_path is not None:
+                    sources.append((y * count_x + x, tile_path))
+        return sources
+
+    def _tile_path(self, tile_index: int) -> Optional[str]:
+        if tile_index not in self._paths:
+            self._paths[tile_index] = find_tile_file(
+                self.planet_config["tile_folder"], tile_index
+            )
+        return self._paths[tile_index]
+
+    def _evict(self, pinned: Set[BlockKey]) -> None:
+        # najstarsze najpierw; bloków potrzebnych w tej chwili nie ruszamy
+        for key in list(self._pixmaps):
+            if self._pixmap_bytes <= self.budget_bytes:
+                break
+            if key in pinned:
+                continue
+            self._pixmap_bytes -= self._size_of(self._pixmaps.pop(key))
+            self.stats.evictions += 1
+
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
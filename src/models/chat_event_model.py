@@ -0,0 +1,20 @@
+from typing import NamedTuple, Optional
+
+
+class SystemEvent(NamedTuple):
+    """Structured fields of one classified system line."""
+    event_type: str                # "resource_claimed", "loot", "skill_gain", ...
+    resource: Optional[str] = None  # resource / item / skill named by the line
+    amount: Optional[float] = None  # item count, skill points, damage, ...
+    value: Optional[float] = None   # PED value when the line states one
+
+
+class ChatEvent(NamedTuple):
+    """One normalized chat log event as stored in the EventRepository."""
+    ts: int                  # unix seconds, from the log line's local timestamp
+    channel: str             # "System", ...
+    event_type: str          # "resource_depleted", "resource_claimed", "system", ...
+    resource: Optional[str]  # resource name when the event names one
+    text: str                # raw line
+    amount: Optional[float] = None
+    value: Optional[float] = None  # PED
@@ -1,7 +1,14 @@
-from typing import Optional
+from array import array
+from typing import List, NamedTuple, Optional
 from pydantic import BaseModel
 import time
 
+
+class DeedTicks(NamedTuple):
+    """One label refresh batch: marker_ids[i] now shows ttl_sec[i] seconds."""
+    marker_ids: List[str]
+    ttl_sec: "array[int]"  # array("i")
+
 class DeedModel(BaseModel):
     depth_m: Optional[int] = None
     size_label: Optional[str] = None
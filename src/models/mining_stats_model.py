@@ -0,0 +1,21 @@
+from typing import List, NamedTuple, Tuple
+
+
+class RunStats(NamedTuple):
+    """Aggregates of a mining run over one time span (whole session or window)."""
+    span_sec: float
+    deeds: int                # nowe deedy (drop zakończony znaleziskiem)
+    claims: int
+    depleted: int
+    loot_ped: float
+    claims_per_drop: float
+    deeds_per_hour: float
+    resource_mix: List[Tuple[str, int]]               # (resource, claims), malejąco
+    size_by_depth: List[Tuple[int, float, int]]       # (depth from m, avg size, deeds)
+
+
+class MiningStatsSnapshot(NamedTuple):
+    session: RunStats
+    window: RunStats
+    window_sec: float
+    events: int  # wszystkie zdarzenia od startu sesji
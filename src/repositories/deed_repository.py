@@ -1,54 +1,87 @@
 from __future__ import annotations
-from typing import List, Optional, Tuple, Callable
-import math
+
+from typing import Callable, Dict, List, Optional, Tuple
+
 from src.models.deed_model import DeedModel
+from src.utils.spatial_index import GridIndex
+
+DeedKey = Tuple[Optional[int], Optional[int], Optional[str]]
+ToScene = Callable[[float, float], Tuple[float, float]]
+
+_CELL_SIZE_PX = 32.0
+
 
 class DeedRepository:
     """In-memory store for active deeds."""
 
-    def __init__(self) -> None:
-        self._items: List[DeedModel] = []
+    def __init__(self, to_scene: Optional[ToScene] = None) -> None:
+        # Dedupe key (x, y, resource) -> deed; dict keeps insertion order
+        self._items: Dict[DeedKey, DeedModel] = {}
+        # Deed positions in scene pixels for nearest-deed queries
+        self._default_to_scene = to_scene
+        self._to_scene: Optional[ToScene] = None
+        self._scene_key: object = None  # transformacja, z którą zbudowano indeks
+        self._index: GridIndex[DeedKey] = GridIndex(_CELL_SIZE_PX)
 
     def all(self) -> List[DeedModel]:
-        return list(self._items)
+        return list(self._items.values())
 
     def add_or_update(self, deed: DeedModel) -> None:
         # Simple dedupe by (x, y, resource)
-        for i, d in enumerate(self._items):
-            if d.x == deed.x and d.y == deed.y and d.resource == deed.resource:
-                if (d.ttl_sec or 0) < (deed.ttl_sec or 0):
-                    self._items[i] = deed
-                return
-        self._items.append(deed)
+        key = (deed.x, deed.y, deed.resource)
+        current = self._items.get(key)
+        if current is not None:
+            if (current.ttl_sec or 0) < (deed.ttl_sec or 0):
+                self._items[key] = deed
+            return
+        self._items[key] = deed
+        if self._to_scene is not None:
+            self._index_deed(key, deed)
 
     def remove_nearest(
         self,
         player_scene_pos: Tuple[float, float],
-        to_scene: Callable[[float, float], Tuple[float, float]],
+        to_scene: Optional[ToScene] = None,
         max_dist_px: float = 120.0,
     ) -> Optional[DeedModel]:
-        # Remove nearest deed within max_dist_px
-        nearest_i = -1
-        nearest_d = float("inf")
-        for i, d in enumerate(self._items):
-            if d.x is None or d.y is None:
-                continue
-            mx, my = to_scene(float(d.x), float(d.y))
-            dist = math.hypot(mx - player_scene_pos[0], my - player_scene_pos[1])
-            if dist < nearest_d:
-                nearest_d, nearest_i = dist, i
-        if nearest_i >= 0 and nearest_d <= max_dist_px:
-            return self._items.pop(nearest_i)
-        return None
+        """
+        Remove the nearest deed within ``max_dist_px`` scene pixels.
+
+        ``to_scene`` defaults to the one given to the constructor. The index is
+        rebuilt only when the transform changes: a bound method counts as the
+        object it is bound to (e.g. the planet's PlanetGeometry), so a fresh
+        ``geometry.lonlat_to_scene`` per call reuses it, a fresh lambda does not.
+        """
+        to_scene = to_scene or self._default_to_scene
+        if to_scene is None:
+            raise ValueError("remove_nearest needs a to_scene transform")
+        key = getattr(to_scene, "__self__", to_scene)
+        if key is not self._scene_key:
+            self._reindex(to_scene, key)
+        nearest = self._index.nearest(
+            player_scene_pos[0], player_scene_pos[1], k=1, max_dist=max_dist_px
+        )
+        if not nearest:
+            return None
+        key = nearest[0][1]
+        self._index.remove(key)
+        return self._items.pop(key)
 
     def gc_expired(self) -> int:
         # Remove expired deeds and return removed count
-        alive: List[DeedModel] = []
-        removed = 0
-        for d in self._items:
-            if (d.ttl_sec or 0) <= 0:
-                removed += 1
-            else:
-                alive.append(d)
-        self._items = alive
-        return removed
+        expired = [k for k, d in self._items.items() if (d.ttl_sec or 0) <= 0]
+        for key in expired:
+            del self._items[key]
+            self._index.remove(key)
+        return len(expired)
+
+    def _reindex(self, to_scene: ToScene, key: object) -> None:
+        # np. inna planeta – pozycje w scenie liczymy od nowa
+        self._to_scene, self._scene_key = to_scene, key
+        self._index.clear()
+        for key, deed in self._items.items():
+            self._index_deed(key, deed)
+
+    def _index_deed(self, key: DeedKey, deed: DeedModel) -> None:
+        if deed.x is not None and deed.y is not None:
+            self._index.insert(key, *self._to_scene(float(deed.x), float(deed.y)))
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.models.chat_event_model import ChatEvent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id         INTEGER PRIMARY KEY,
+    ts         INTEGER NOT NULL,
+    channel    TEXT    NOT NULL,
+    event_type TEXT    NOT NULL,
+    resource   TEXT,
+    text       TEXT    NOT NULL,
+    amount     REAL,
+    value      REAL
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (event_type, ts, resource);
+CREATE INDEX IF NOT EXISTS idx_events_type_resource_ts
+    ON events (event_type, resource, ts);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    log_path    TEXT PRIMARY KEY,
+    fingerprint TEXT    NOT NULL,
+    offset      INTEGER NOT NULL
+);
+"""
+# kolumny dodane później – starsze bazy dostają je przez ALTER TABLE
+_ADDED_COLUMNS = (("amount", "REAL"), ("value", "REAL"))
+_COLUMNS = "ts, channel, event_type, resource, text, amount, value"
+
+
+class EventRepository:
+    """
+    SQLite store of normalized chat events plus a per-log byte-offset checkpoint.
+
+    ``append`` writes a batch of events and moves the checkpoint in the same
+    transaction, so after a crash ingestion resumes exactly after the last
+    committed batch. The database runs in WAL mode; queries use their own
+    connection and do not wait for the writer.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._writer = self._connect()
+        self._writer.executescript(_SCHEMA)
+        self._migrate()
+        self._reader = self._connect() if db_path != ":memory:" else self._writer
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _migrate(self) -> None:
+        present = {row[1] for row in self._writer.execute("PRAGMA table_info(events)")}
+        with self._writer:
+            for name, kind in _ADDED_COLUMNS:
+                if name not in present:
+                    self._writer.execute(f"ALTER TABLE events ADD COLUMN {name} {kind}")
+
+    def close(self) -> None:
+        with self._write_lock, self._read_lock:
+            if self._reader is not self._writer:
+                self._reader.close()
+            self._writer.close()
+
+    # --- ingestion -------------------------------------------------------
+
+    def checkpoint(self, log_path: str) -> Optional[Tuple[str, int]]:
+        """(fingerprint, offset) saved for ``log_path``, or None."""
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT fingerprint, offset FROM checkpoints WHERE log_path = ?",
+                (log_path,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def append(
+        self,
+        events: Sequence[ChatEvent],
+        log_path: Optional[str] = None,
+        fingerprint: str = "",
+        offset: int = 0,
+    ) -> None:
+        """Insert ``events`` and (optionally) move the log checkpoint atomically."""
+        with self._write_lock, self._writer:
+            if events:
+                self._writer.executemany(
+                    f"INSERT INTO events ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    events,
+                )
+            if log_path is not None:
+                self._writer.execute(
+                    "INSERT INTO checkpoints (log_path, fingerprint, offset)"
+                    " VALUES (?, ?, ?) ON CONFLICT(log_path) DO UPDATE SET"
+                    " fingerprint = excluded.fingerprint, offset = excluded.offset",
+                    (log_path, fingerprint, offset),
+                )
+
+    # --- queries ---------------------------------------------------------
+
+    def count(
+        self,
+        event_type: str,
+        resource: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+    ) -> int:
+        """Number of ``event_type`` events, optionally for one resource/time range."""
+        where, params = self._where(event_type, resource, since, until)
+        with self._read_lock:
+            row = self._reader.execute(
+                f"SELECT COUNT(*) FROM events WHERE {where}", params
+            ).fetchone()
+        return int(row[0])
+
+    def counts_by_resource(
+        self,
+        event_type: str,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Event counts per resource, most frequent first."""
+        where, params = self._where(event_type, None, since, until)
+        # z zakresem czasu "+resource" kieruje planner na (event_type, ts, …),
+        # bez niego pokrywający (event_type, resource, ts) jest szybszy
+        ranged = since is not None or until is not None
+        column = "+resource" if ranged else "resource"
+        with self._read_lock:
+            rows = self._reader.execute(
+                f"SELECT resource, COUNT(*) AS n FROM events WHERE {where}"
+                f" AND {column} IS NOT NULL GROUP BY {column} ORDER BY n DESC",
+                params,
+            ).fetchall()
+        return dict(rows)
+
+    def counts_by_bucket(
+        self,
+        event_type: str,
+        bucket_sec: int = 3600,
+        resource: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """(bucket start ts, count) pairs, e.g. claims per hour."""
+        where, params = self._where(event_type, resource, since, until)
+        with self._read_lock:
+            rows = self._reader.execute(
+                f"SELECT ts - ts % ? AS bucket, COUNT(*) FROM events WHERE {where}"
+                " GROUP BY bucket ORDER BY bucket",
+                [bucket_sec, *params],
+            ).fetchall()
+        return [(int(bucket), int(n)) for bucket, n in rows]
+
+    def latest(
+        self, limit: int = 50, event_type: Optional[str] = None
+    ) -> List[ChatEvent]:
+        sql = f"SELECT {_COLUMNS} FROM events"
+        params: List[object] = []
+        if event_type is not None:
+            sql += " WHERE event_type = ?"
+            params.append(event_type)
+        sql += " ORDER BY ts DESC, id DESC LIMIT ?"
+        params.append(limit)
+        with self._read_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return [ChatEvent(*row) for row in rows]
+
+    @staticmethod
+    def _where(
+        event_type: str,
+        resource: Optional[str],
+        since: Optional[int],
+        until: Optional[int],
+    ) -> Tuple[str, List[object]]:
+        clauses: List[str] = ["event_type = ?"]
+        params: List[object] = [event_type]
+        if resource is not None:
+            clauses.append("resource = ?")
+            params.append(resource)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        return " AND ".join(clauses), params
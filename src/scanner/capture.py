@@ -0,0 +1,261 @@
+import abc
+import glob
+import os
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+_IMAGE_EXT = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class ClientRect(NamedTuple):
+    """Game client area in screen coordinates."""
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+class CaptureBackend(abc.ABC):
+    """
+    Source of game frames: where the client area is and pixels inside it.
+
+    Regions passed to ``grab`` are mss-style dicts (left/top/width/height) in
+    the same screen coordinates as ``client_rect``. Both may be called from
+    several scanner threads.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    def client_rect(self) -> Optional[ClientRect]:
+        """Current client area; None while there is no game window."""
+
+    @abc.abstractmethod
+    def grab(self, region: Dict[str, int]) -> np.ndarray:
+        """BGR pixels of ``region``."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook, nothing to free here
+        pass
+
+
+class WindowCaptureBackend(CaptureBackend):
+    """
+    Live game window through win32gui + mss (Windows only, imported on use).
+
+    The window handle is looked up once (EnumWindows) and kept until the
+    window closes or is hidden; the client rect is recomputed only when the
+    window rect changes (moved / resized). Each thread gets its own mss
+    instance – mss handles are not shared between threads on Windows.
+    """
+
+    name = "window"
+
+    def __init__(self, title_substr: str) -> None:
+        import mss
+        import win32gui
+
+        self._mss = mss
+        self._win32gui = win32gui
+        self.title_substr = title_substr
+        self.window_lookups = 0  # ile razy trzeba było przeszukać okna
+        self._hwnd: Optional[int] = None
+        self._window_rect: Optional[tuple] = None
+        self._client: Optional[ClientRect] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._grabbers: List[Any] = []
+
+    def client_rect(self) -> Optional[ClientRect]:
+        with self._lock:
+            if self._hwnd is not None and not self._refresh(self._hwnd):
+                self._hwnd = self._client = None
+            if self._hwnd is None:
+                self.window_lookups += 1
+                hwnd = self._find_window()
+                if hwnd is None or not self._refresh(hwnd):
+                    return None
+                self._hwnd = hwnd
+            return self._client
+
+    def grab(self, region: Dict[str, int]) -> np.ndarray:
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._local.sct = self._mss.mss()
+            with self._lock:
+                self._grabbers.append(sct)
+        # BGRA -> BGR
+        return np.array(sct.grab(region))[:, :, :3]
+
+    def close(self) -> None:
+        with self._lock:
+            grabbers, self._grabbers = self._grabbers, []
+        for sct in grabbers:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+    def _refresh(self, hwnd: int) -> bool:
+        """Update the cached geometry of ``hwnd``; False if the window is gone."""
+        win32gui = self._win32gui
+        try:
+            if not (win32gui.IsWindow(hwnd) and win32gui.IsWindowVisible(hwnd)):
+                return False
+            window_rect = win32gui.GetWindowRect(hwnd)
+            if window_rect != self._window_rect or self._client is None:
+                left, top, right, bottom = win32gui.GetClientRect(hwnd)
+                screen_x, screen_y = win32gui.ClientToScreen(hwnd, (0, 0))
+                self._client = ClientRect(
+                    screen_x, screen_y, right - left, bottom - top
+                )
+                self._window_rect = window_rect
+        except Exception:
+            return False
+        return True
+
+    def _find_window(self) -> Optional[int]:
+        hwnd = None
+        needle = self.title_substr.lower()
+
+        def enum_cb(h: Any, _: Any) -> None:
+            nonlocal hwnd
+            try:
+                title = self._win32gui.GetWindowText(h)
+                if needle in title.lower() and self._win32gui.IsWindowVisible(h):
+                    hwnd = h
+            except Exception:
+                pass
+
+        self._win32gui.EnumWindows(enum_cb, None)
+        return hwnd
+
+
+class ReplayCaptureBackend(CaptureBackend):
+    """
+    Recorded client-area frames instead of the live window.
+
+    ``source`` is a video file, a directory of images (played in name order)
+    or a single image. Frames follow the wall clock at ``speed`` x the
+    recording rate (``fps`` for images, the file's own rate for video), so
+    the scanners see the session as they would live, or faster. The client
+    area sits at (0, 0) and is the frame size; after the last frame the
+    window "closes" unless ``loop``.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self, source: str, fps: float = 10.0, speed: float = 1.0, loop: bool = True
+    ) -> None:
+        self.source = source
+        self.speed = max(speed, 1e-6)
+        self.loop = loop
+        self.frames_served = 0
+        self._lock = threading.Lock()
+        self._start: Optional[float] = None
+        self._images: Optional[List[np.ndarray]] = None
+        self._video: Optional[cv2.VideoCapture] = None
+        self._decoded = 0  # ile klatek wideo zdekodowano od początku pliku
+        self._frame: Optional[np.ndarray] = None
+        self._frame_index = -1
+
+        if os.path.isdir(source):
+            paths = sorted(
+                p for p in glob.glob(os.path.join(source, "*"))
+                if p.lower().endswith(_IMAGE_EXT)
+            )
+            self._images = [cv2.imread(p) for p in paths]
+        elif source.lower().endswith(_IMAGE_EXT):
+            self._images = [cv2.imread(source)]
+        else:
+            self._video = cv2.VideoCapture(source)
+            if not self._video.isOpened():
+                raise ValueError(f"Cannot open replay source {source!r}")
+            fps = self._video.get(cv2.CAP_PROP_FPS) or fps
+        if self._images is not None:
+            if not self._images or any(img is None for img in self._images):
+                raise ValueError(f"Cannot read replay images from {source!r}")
+            self.frame_count = len(self._images)
+        else:
+            self.frame_count = int(self._video.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.fps = fps
+
+    @property
+    def frame_index(self) -> int:
+        """Index of the frame last handed out (-1 before the first)."""
+        return self._frame_index
+
+    def client_rect(self) -> Optional[ClientRect]:
+        with self._lock:
+            frame = self._current()
+            if frame is None:
+                return None
+            height, width = frame.shape[:2]
+            return ClientRect(0, 0, width, height)
+
+    def grab(self, region: Dict[str, int]) -> np.ndarray:
+        with self._lock:
+            frame = self._current()
+            if frame is None:
+                raise RuntimeError("Replay finished")
+            self.frames_served += 1
+        top, left = max(0, region["top"]), max(0, region["left"])
+        return frame[
+            top:region["top"] + region["height"], left:region["left"] + region["width"]
+        ]
+
+    def restart(self) -> None:
+        with self._lock:
+            self._start = None
+
+    def close(self) -> None:
+        if self._video is not None:
+            self._video.release()
+
+    def _current(self) -> Optional[np.ndarray]:
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        index = int((now - self._start) * self.fps * self.speed)
+        if self.frame_count > 0 and index >= self.frame_count:
+            if not self.loop:
+                return None
+            index %= self.frame_count
+        if index != self._frame_index:
+            self._frame = self._load(index)
+            self._frame_index = index
+        return self._frame
+
+    def _load(self, index: int) -> Optional[np.ndarray]:
+        if self._images is not None:
+            return self._images[index]
+        video = self._video
+        if index < self._decoded - 1:  # pętla – od początku pliku
+            video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._decoded = 0
+        # pominięte klatki tylko przesuwamy (grab), dekodujemy ostatnią
+        while self._decoded <= index:
+            if not video.grab():
+                return self._frame
+            self._decoded += 1
+        ok, frame = video.retrieve()
+        return frame if ok else self._frame
+
+
+def create_capture_backend(config: Dict[str, Any], title_substr: str) -> CaptureBackend:
+    """Backend from the ``capture`` config section (``window`` or ``replay``)."""
+    backend = config.get("backend", "window")
+    if backend == "window":
+        return WindowCaptureBackend(title_substr)
+    if backend == "replay":
+        return ReplayCaptureBackend(
+            config["replay_path"],
+            fps=config.get("replay_fps", 10.0),
+            speed=config.get("replay_speed", 1.0),
+            loop=config.get("replay_loop", True),
+        )
+    raise ValueError(f"Unknown capture backend {backend!r}")
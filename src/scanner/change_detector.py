@@ -0,0 +1,48 @@
+from typing import Optional
+
+import numpy as np
+
+from src.scanner.digit_reader import binarize_coords
+
+
+class FrameChangeDetector:
+    """
+    Tells whether the text in a capture region changed since the last good read.
+
+    Frames are compared as binarized text masks (the same white-text mask the
+    digit reader uses), so the game world moving behind the semi-transparent
+    compass does not count as a change – only pixels of the digits do.
+    Antialiased edges still flicker one pixel at a time, so only flipped
+    pixels with a flipped 4-neighbour are counted: a new digit flips whole
+    strokes, background noise flips isolated pixels.
+    """
+
+    def __init__(self, min_changed_px: int = 3) -> None:
+        self.min_changed_px = min_changed_px
+        self._reference: Optional[np.ndarray] = None
+        self._pending: Optional[np.ndarray] = None
+
+    def changed(self, roi_bgr: np.ndarray) -> bool:
+        mask = binarize_coords(roi_bgr)
+        self._pending = mask
+        reference = self._reference
+        if reference is None or reference.shape != mask.shape:
+            return True
+        return clustered_flips(mask != reference) >= self.min_changed_px
+
+    def accept(self) -> None:
+        """Make the frame last passed to ``changed`` the reference (after a read)."""
+        if self._pending is not None:
+            self._reference = self._pending
+
+    def reset(self) -> None:
+        self._reference = None
+
+
+def clustered_flips(diff: np.ndarray) -> int:
+    neighbour = np.zeros_like(diff)
+    neighbour[:, 1:] |= diff[:, :-1]
+    neighbour[:, :-1] |= diff[:, 1:]
+    neighbour[1:] |= diff[:-1]
+    neighbour[:-1] |= diff[1:]
+    return int(np.count_nonzero(diff & neighbour))
@@ -0,0 +1,126 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from src.models.deed_model import DeedModel
+from src.scanner.change_detector import clustered_flips
+from src.utils.image_utils import nonzero_runs
+
+_HASH_SIDE = 32  # DCT liczone na miniaturze 32x32
+_HASH_BITS = 8  # ...z której bierzemy 8x8 najniższych częstotliwości
+_INK_DIFF = 48  # różnica jasności piksela uznawana za zmianę tekstu (szum ~±4)
+
+
+def perceptual_hash(roi_bgr: np.ndarray) -> int:
+    """64-bit DCT hash: low-frequency coefficients above/below their median."""
+    gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (_HASH_SIDE, _HASH_SIDE), interpolation=cv2.INTER_AREA)
+    low = cv2.dct(small.astype(np.float32))[:_HASH_BITS, :_HASH_BITS].flatten()
+    bits = low > np.median(low[1:])  # składowa stała nie wchodzi do mediany
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def text_mask(roi_bgr: np.ndarray) -> np.ndarray:
+    """Light panel text as a bool mask (Otsu split from the dark background)."""
+    gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
+    _, mask = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return mask.astype(bool)
+
+
+class _Entry(NamedTuple):
+    deed: DeedModel
+    gray: np.ndarray
+    volatile_rows: Optional[Tuple[int, int]]  # wiersz "Time left" – pomijany
+
+
+class DeedScanCache:
+    """
+    Recent deed scans keyed by a perceptual hash of the panel ROI.
+
+    A scan whose hash is within ``max_distance`` bits of a cached one is
+    confirmed pixel by pixel: apart from the "Time left" line (the only line
+    that ticks) fewer than ``min_changed_px`` clustered pixels may differ in
+    brightness by more than ``_INK_DIFF`` – the hash alone cannot tell
+    "Depth: 501 m" from "Depth: 502 m".
+    A hit needs no OCR: ``expire_monotonic`` is an absolute deadline, so the
+    cached deed already shows the current time left.
+
+    Only complete parses are stored, so pressing the hotkey again after a
+    bad read always runs OCR.
+    """
+
+    def __init__(
+        self, max_entries: int = 16, max_distance: int = 6, min_changed_px: int = 3
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.max_distance = max_distance
+        self.min_changed_px = min_changed_px
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def lookup(self, roi_bgr: np.ndarray) -> Optional[DeedModel]:
+        key = perceptual_hash(roi_bgr)
+        gray: Optional[np.ndarray] = None
+        with self._lock:
+            for cached_key, entry in reversed(self._entries.items()):
+                if bin(key ^ cached_key).count("1") > self.max_distance:
+                    continue
+                if gray is None:
+                    gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
+                if self._same_text(gray, entry):
+                    self._entries.move_to_end(cached_key)
+                    self.hits += 1
+                    return entry.deed.model_copy()
+            self.misses += 1
+            return None
+
+    def store(self, roi_bgr: np.ndarray, deed: DeedModel, text: str) -> None:
+        """Cache ``deed`` read from ``roi_bgr``; ``text`` is the raw OCR output."""
+        key = perceptual_hash(roi_bgr)
+        gray = cv2.cvtColor(roi_bgr, cv2.COLOR_BGR2GRAY)
+        rows = _time_left_rows(text_mask(roi_bgr), text)
+        entry = _Entry(deed.model_copy(), gray, rows)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _same_text(self, gray: np.ndarray, entry: _Entry) -> bool:
+        if gray.shape != entry.gray.shape:
+            return False
+        diff = cv2.absdiff(gray, entry.gray) > _INK_DIFF
+        if entry.volatile_rows is not None:
+            top, bottom = entry.volatile_rows
+            diff[top:bottom] = False
+        return clustered_flips(diff) < self.min_changed_px
+
+
+def _time_left_rows(mask: np.ndarray, text: str) -> Optional[Tuple[int, int]]:
+    """
+    Rows of the "Time left" line: the n-th band of text rows in the mask is
+    the n-th OCR line (before the parser merges a wrapped Position), when
+    both counts agree – otherwise None and the whole panel must match.
+    """
+    lines: List[str] = [ln.strip() for ln in text.split("\n") if ln.strip()]
+    index = next(
+        (i for i, ln in enumerate(lines) if ln.lower().startswith("time")), None
+    )
+    bands = nonzero_runs(mask.sum(axis=1))
+    if index is None or len(bands) != len(lines):
+        return None
+    top, bottom = bands[index]
+    return max(0, top - 1), bottom + 1
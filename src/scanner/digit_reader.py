@@ -0,0 +1,207 @@
+import os
+from typing import List, NamedTuple, Optional
+
+import cv2
+import numpy as np
+
+from src.utils.image_utils import nonzero_runs
+
+# wymiary wektora cechy jednej cyfry (piksele w skali 1x)
+GLYPH_W = 12
+GLYPH_H = 13
+_MIN_GLYPH_W = 3    # węższy kawałek po rozcięciu nie jest cyfrą
+_MIN_GLYPH_INK = 4  # mniejsze plamki to szum, nie cyfra
+
+
+class CoordsReading(NamedTuple):
+    lon: int
+    lat: int
+    score: float  # najsłabsze dopasowanie cyfry (korelacja 0..1)
+
+
+def binarize_coords(bgr: np.ndarray) -> np.ndarray:
+    """White, low-saturation text of the compass ROI as a uint8 0/1 mask (1x scale)."""
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    return cv2.inRange(hsv, (0, 0, 150), (179, 70, 255)) // 255
+
+
+def _split_touching(glyph: np.ndarray) -> List[np.ndarray]:
+    """Cut a run wider than one digit at its thinnest column (antialiased pairs)."""
+    w = glyph.shape[1]
+    if w <= GLYPH_W - 2 or w < 2 * _MIN_GLYPH_W:
+        return [glyph]
+    ink = glyph[:, _MIN_GLYPH_W : w - _MIN_GLYPH_W].sum(axis=0)
+    cut = _MIN_GLYPH_W + int(np.argmin(ink))
+    return _split_touching(glyph[:, :cut]) + _split_touching(glyph[:, cut + 1 :])
+
+
+class DigitReader:
+    """
+    Reads the compass Lon/Lat numbers by template matching instead of OCR.
+
+    The ROI is binarized at native scale and split into the two text rows;
+    the "Lon:"/"Lat:" labels are skipped using the width measured on
+    ``assets/coords_template.png``, and the remaining columns are cut into
+    glyphs at empty columns. All glyphs of a read are compared with the digit
+    atlas in one matrix product (normalized correlation).
+
+    The template has no digits, so the atlas is learned: every confident
+    Tesseract read passed to ``learn`` adds its glyphs to the running mean of
+    each digit. ``read`` returns None until all ten digits have
+    ``min_samples`` samples, or when any glyph scores below ``min_score`` /
+    ``min_margin`` – the caller falls back to OCR. Once the atlas is ready it
+    only learns reads whose digits it already ranks first, so a wrong OCR
+    read cannot pull a digit's mean towards another digit.
+
+    The atlas is kept in ``atlas_path``: written when it becomes ready,
+    every ``save_every`` learned reads and on ``save()`` (scanner stop).
+    """
+
+    def __init__(
+        self,
+        template_path: str = "assets/coords_template.png",
+        atlas_path: Optional[str] = None,
+        min_score: float = 0.85,
+        min_margin: float = 0.05,
+        min_samples: int = 3,
+        save_every: int = 50,
+    ) -> None:
+        self.atlas_path = atlas_path
+        self.save_every = max(1, save_every)
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.min_samples = min_samples
+        self.label_width = self._measure_label(template_path)
+
+        size = GLYPH_W * GLYPH_H
+        self.sums = np.zeros((10, size), np.float64)
+        self.counts = np.zeros(10, np.int64)
+        self._atlas = np.zeros((10, size), np.float32)  # znormalizowane wzorce
+        self._unsaved = 0  # odczyty nauczone od ostatniego zapisu
+        if atlas_path and os.path.exists(atlas_path):
+            self._load(atlas_path)
+
+    @staticmethod
+    def _measure_label(template_path: str) -> int:
+        """Width from the left edge of "L" to the end of the widest label."""
+        template = cv2.imread(template_path, cv2.IMREAD_UNCHANGED)
+        if template is None:
+            print(f"[DigitReader] Missing template {template_path}, assuming 35 px")
+            return 35
+        ink = template[:, :, 3] > 60 if template.shape[2] == 4 else (
+            binarize_coords(template[:, :, :3]) > 0
+        )
+        columns = np.flatnonzero(ink.any(axis=0))
+        return int(columns[-1] - columns[0] + 1)
+
+    # --- atlas ------------------------------------------------------------
+
+    @property
+    def ready(self) -> bool:
+        return bool((self.counts >= self.min_samples).all())
+
+    def _rebuild(self) -> None:
+        means = self.sums / np.maximum(self.counts, 1)[:, None]
+        norms = np.linalg.norm(means, axis=1, keepdims=True)
+        self._atlas = (means / np.maximum(norms, 1e-9)).astype(np.float32)
+
+    def _load(self, path: str) -> None:
+        try:
+            with np.load(path) as data:
+                if data["sums"].shape == self.sums.shape:
+                    self.sums = data["sums"].astype(np.float64)
+                    self.counts = data["counts"].astype(np.int64)
+                    self._rebuild()
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[DigitReader] Ignoring atlas {path}: {e}")
+
+    def save(self) -> None:
+        """Write the atlas to ``atlas_path`` if it changed since the last save."""
+        if not self.atlas_path or not self._unsaved:
+            return
+        os.makedirs(os.path.dirname(self.atlas_path) or ".", exist_ok=True)
+        tmp = self.atlas_path + ".tmp.npz"
+        np.savez(tmp, sums=self.sums, counts=self.counts)
+        os.replace(tmp, self.atlas_path)
+        self._unsaved = 0
+
+    def learn(self, roi_bgr: np.ndarray, lon: int, lat: int) -> bool:
+        """Add glyphs of a read known to be ``lon``/``lat``; False if they don't fit."""
+        rows = self._glyph_rows(roi_bgr)
+        expected = (str(lon), str(lat))
+        if rows is None or [len(r) for r in rows] != [len(s) for s in expected]:
+            return False
+        glyphs = np.concatenate(rows)
+        digits = np.frombuffer("".join(expected).encode(), np.uint8) - ord("0")
+        was_ready = self.ready
+        if was_ready and not np.array_equal((glyphs @ self._atlas.T).argmax(1), digits):
+            return False
+        np.add.at(self.sums, digits, glyphs)
+        np.add.at(self.counts, digits, 1)
+        self._rebuild()
+        self._unsaved += 1
+        if (self.ready and not was_ready) or self._unsaved >= self.save_every:
+            self.save()
+        return True
+
+    # --- reading ----------------------------------------------------------
+
+    def read(self, roi_bgr: np.ndarray) -> Optional[CoordsReading]:
+        """Lon/Lat of the ROI, or None when the atlas is not sure."""
+        if not self.ready:
+            return None
+        rows = self._glyph_rows(roi_bgr)
+        if rows is None or not all(len(row) for row in rows):
+            return None
+        glyphs = np.concatenate(rows)
+        scores = glyphs @ self._atlas.T  # (cyfry, 10) – jedna operacja na odczyt
+        top2 = np.partition(scores, 8, axis=1)[:, 8:]
+        best, second = top2.max(axis=1), top2.min(axis=1)
+        if best.min() < self.min_score or (best - second).min() < self.min_margin:
+            return None
+        digits = scores.argmax(axis=1)
+        split = len(rows[0])
+        lon = int("".join(map(str, digits[:split].tolist())))
+        lat = int("".join(map(str, digits[split:].tolist())))
+        return CoordsReading(lon, lat, float(best.min()))
+
+    def _glyph_rows(self, roi_bgr: np.ndarray) -> Optional[List[np.ndarray]]:
+        """Normalized glyph vectors of the Lon and Lat rows, or None."""
+        mask = binarize_coords(roi_bgr)
+        bands = [
+            b for b in nonzero_runs(mask.sum(axis=1)) if b[1] - b[0] >= GLYPH_H // 2
+        ]
+        if len(bands) != 2:
+            return None
+        rows = []
+        for top, bottom in bands:
+            band = mask[top:bottom]
+            columns = np.flatnonzero(band.any(axis=0))
+            start = columns[0] + self.label_width  # tuż za dwukropkiem etykiety
+            glyphs = []
+            for x0, x1 in nonzero_runs(band[:, start:].sum(axis=0)):
+                for glyph in _split_touching(band[:, start + x0 : start + x1]):
+                    if glyph.sum() < _MIN_GLYPH_INK:
+                        continue
+                    vector = self._vector(glyph)
+                    if vector is None:
+                        return None
+                    glyphs.append(vector)
+            rows.append(np.array(glyphs, np.float32).reshape(-1, GLYPH_W * GLYPH_H))
+        return rows
+
+    @staticmethod
+    def _vector(glyph: np.ndarray) -> Optional[np.ndarray]:
+        h, w = glyph.shape
+        if w > GLYPH_W:
+            return None  # sklejone cyfry – niech zdecyduje OCR
+        if h != GLYPH_H:
+            glyph = cv2.resize(
+                glyph.astype(np.float32), (w, GLYPH_H), interpolation=cv2.INTER_AREA
+            )
+        canvas = np.zeros((GLYPH_H, GLYPH_W), np.float32)
+        left = (GLYPH_W - w) // 2
+        canvas[:, left : left + w] = glyph
+        canvas -= canvas.mean()
+        norm = np.linalg.norm(canvas)
+        return (canvas / norm).ravel() if norm > 0 else None
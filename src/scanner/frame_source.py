@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.scanner.capture import CaptureBackend, ClientRect
+
+# Położenie ROI na ekranie (słownik w stylu mss) wyliczane z obszaru klienta
+Locator = Callable[[ClientRect], Dict[str, int]]
+
+
+class RoiHandle:
+    """A consumer's registered region; ``read`` returns its current pixels."""
+
+    def __init__(
+        self,
+        source: "FrameSource",
+        name: str,
+        locate: Locator,
+        max_age: float,
+        continuous: bool,
+    ) -> None:
+        self.source = source
+        self.name = name
+        self.locate = locate
+        self.max_age = max_age
+        self.continuous = continuous
+        self.frame_ts = -1.0  # czas pobrania klatki, z której był ostatni odczyt
+
+    def read(self) -> Optional[np.ndarray]:
+        """BGR view of the region (do not modify); None while there is no window."""
+        return self.source.read(self)
+
+    def unregister(self) -> None:
+        self.source.unregister(self)
+
+
+class FrameSource:
+    """
+    One screen grab shared by every consumer of a capture backend.
+
+    Consumers register the regions they need (deed panel, compass coords,
+    radar ...). A read is served as a view into the last grabbed frame when
+    that frame covers the region, is at most ``max_age`` old and is newer
+    than the one this consumer read last time. Otherwise the source grabs
+    the region together with the ``continuous`` (polled) regions whose
+    bounding box stays within ``merge_ratio`` x their summed area, so the
+    next poll of those reuses it; far-apart regions (a top-left panel and a
+    bottom-right compass) are not merged into a whole-screen grab.
+
+    Grabs are serialized: consumers asking at once get one grab between
+    them, and the grab rate is that of the fastest consumer.
+    """
+
+    def __init__(self, capture: CaptureBackend, merge_ratio: float = 2.0) -> None:
+        self.capture = capture
+        self.merge_ratio = merge_ratio
+        self.grabs = 0
+        self.reads = 0
+        self.shared_reads = 0  # odczyty obsłużone z już pobranej klatki
+        self.pixels_grabbed = 0
+        self._handles: List[RoiHandle] = []
+        self._frame: Optional[np.ndarray] = None
+        self._frame_region: Optional[Dict[str, int]] = None
+        self._frame_ts = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "grabs": self.grabs,
+            "reads": self.reads,
+            "shared_reads": self.shared_reads,
+            "pixels_grabbed": self.pixels_grabbed,
+        }
+
+    def register(
+        self,
+        name: str,
+        locate: Locator,
+        max_age: float = 0.0,
+        continuous: bool = True,
+    ) -> RoiHandle:
+        handle = RoiHandle(self, name, locate, max_age, continuous)
+        with self._lock:
+            self._handles.append(handle)
+        return handle
+
+    def unregister(self, handle: RoiHandle) -> None:
+        with self._lock:
+            if handle in self._handles:
+                self._handles.remove(handle)
+
+    def read(self, handle: RoiHandle) -> Optional[np.ndarray]:
+        with self._lock:
+            client = self.capture.client_rect()
+            if client is None:
+                self._frame = None
+                return None
+            region = handle.locate(client)
+            self.reads += 1
+            now = time.monotonic()
+            frame_region = self._frame_region
+            if (
+                self._frame is None
+                or frame_region is None
+                or now - self._frame_ts > handle.max_age
+                or self._frame_ts <= handle.frame_ts
+                or not _contains(frame_region, region)
+            ):
+                frame_region = self._grab_region(client, handle, region)
+                self._frame = self.capture.grab(frame_region)
+                self._frame_region = frame_region
+                self._frame_ts = now
+                self.grabs += 1
+                self.pixels_grabbed += _area(frame_region)
+            else:
+                self.shared_reads += 1
+            handle.frame_ts = self._frame_ts
+            x = region["left"] - frame_region["left"]
+            y = region["top"] - frame_region["top"]
+            return self._frame[y:y + region["height"], x:x + region["width"]]
+
+    def _grab_region(
+        self, client: ClientRect, handle: RoiHandle, region: Dict[str, int]
+    ) -> Dict[str, int]:
+        """``region`` grown by the polled regions that are cheap to take along."""
+        merged, area = region, _area(region)
+        for other in self._handles:
+            if other is handle or not other.continuous:
+                continue
+            extra = other.locate(client)
+            union = _union([merged, extra])
+            if _area(union) <= self.merge_ratio * (area + _area(extra)):
+                merged, area = union, area + _area(extra)
+        return merged
+
+
+def _contains(outer: Dict[str, int], inner: Dict[str, int]) -> bool:
+    return (
+        outer["left"] <= inner["left"]
+        and outer["top"] <= inner["top"]
+        and inner["left"] + inner["width"] <= outer["left"] + outer["width"]
+        and inner["top"] + inner["height"] <= outer["top"] + outer["height"]
+    )
+
+
+def _area(region: Dict[str, int]) -> int:
+    return region["width"] * region["height"]
+
+
+def _union(regions: List[Dict[str, int]]) -> Dict[str, int]:
+    left = min(r["left"] for r in regions)
+    top = min(r["top"] for r in regions)
+    right = max(r["left"] + r["width"] for r in regions)
+    bottom = max(r["top"] + r["height"] for r in regions)
+    return {"left": left, "top": top, "width": right - left, "height": bottom - top}
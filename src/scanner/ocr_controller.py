@@ -1,15 +1,31 @@
 # python
 import os
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Optional, Sequence, Tuple, Any
 
 import cv2
 import numpy as np
 
 from src.models.deed_model import DeedModel
-from src.scanner.ocr_core import DEFAULT_INNER, ocr_text_block, preprocess_deed
-from src.scanner.parser import parse_deed_text
+from src.scanner.capture import CaptureBackend
+from src.scanner.deed_cache import DeedScanCache
+from src.scanner.ocr_core import (
+    DEFAULT_INNER,
+    PROFILE_BLOCK_ALT,
+    PROFILE_DEED,
+    ocr_text_block,
+    preprocess_deed,
+)
+from src.scanner.ocr_engine import OcrProfile
+from src.scanner.parser import DEED_FIELDS, deed_field_count, parse_deed_text
 from src.scanner.screen_capture import capture_corner_crop
 
+# Profile OCR panelu deedu, w kolejności preferencji przy remisie
+DEED_PROFILES: Tuple[OcrProfile, ...] = (PROFILE_DEED, PROFILE_BLOCK_ALT)
+
+
+def _deed_score(text: str) -> int:
+    return deed_field_count(parse_deed_text(text))
+
 
 def extract_deed_from_image(
     corner_image_bgr: np.ndarray[Any, Any],
@@ -21,9 +37,15 @@ def extract_deed_from_image(
     ),
     debug: bool = False,
     save_dir: Optional[str] = None,
+    profiles: Sequence[OcrProfile] = DEED_PROFILES,
+    cache: Optional[DeedScanCache] = None,
 ) -> DeedModel:
     """
     Przyjmuje obraz rogu okna (BGR), wycina wewnętrzny prostokąt, robi OCR i parsuje pola.
+
+    Profile OCR idą równolegle; wygrywa ten, który wypełni najwięcej pól deedu,
+    a pierwszy kompletny odczyt kończy skan bez czekania na resztę.
+    Z ``cache`` ponowny skan tego samego panelu nie uruchamia OCR wcale.
     """
     x, y, w, h = inner_rect
     H, W = corner_image_bgr.shape[:2]
@@ -34,9 +56,16 @@ def extract_deed_from_image(
     y2 = max(1, min(H, y + h))
     roi = corner_image_bgr[y1:y2, x1:x2]
 
+    if cache is not None and (cached := cache.lookup(roi)) is not None:
+        return cached
+
     gray = preprocess_deed(roi)
-    text = ocr_text_block(gray)
+    text = ocr_text_block(
+        gray, profiles, score=_deed_score, target=len(DEED_FIELDS)
+    )
     parsed = parse_deed_text(text)
+    if cache is not None and deed_field_count(parsed) == len(DEED_FIELDS):
+        cache.store(roi, parsed, text)
 
     if save_dir:
         os.makedirs(save_dir, exist_ok=True)
@@ -66,11 +95,21 @@ def extract_deed_from_window(
     ),
     debug: bool = False,
     save_dir: Optional[str] = None,
+    profiles: Sequence[OcrProfile] = DEED_PROFILES,
+    cache: Optional[DeedScanCache] = None,
+    capture: Optional[CaptureBackend] = None,
 ) -> DeedModel:
     """
     Przechwytuje róg okna gry i wywołuje ścieżkę ekstrakcji.
     """
-    corner = capture_corner_crop(offset_x=offset_x, offset_y=offset_y)
+    corner = capture_corner_crop(
+        offset_x=offset_x, offset_y=offset_y, backend=capture
+    )
     return extract_deed_from_image(
-        corner, inner_rect=inner_rect, debug=debug, save_dir=save_dir
+        corner,
+        inner_rect=inner_rect,
+        debug=debug,
+        save_dir=save_dir,
+        profiles=profiles,
+        cache=cache,
     )
@@ -1,16 +1,18 @@
 # python
 import re
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, Dict, Optional, Sequence
 
 import cv2
 import numpy as np
-import pytesseract
+
+from src.scanner.ocr_engine import OcrProfile, get_ocr_pool
 
 # Wewnętrzny prostokąt (sekcja pól) wewnątrz wycinka rogu okna
 DEFAULT_INNER = dict(x=20, y=110, w=410, h=180)
 
 # Konfiguracje OCR
-CFG_BLOCK = "-l eng --oem 1 --psm 6"
+CFG_DEED = "-l eng --oem 1 --psm 6"
 CFG_BLOCK_ALT = "-l eng --oem 1 --psm 4"
 
 # Regexy
@@ -77,29 +79,58 @@ def preprocess_coords(bgr: np.ndarray) -> np.ndarray:
     lab = cv2.merge([L, a, b])
     bgr_eq = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
 
-    thr2 = _bin_from_white_mask(bgr_eq)
-
-    # podgląd (opcjonalnie)
-    cv2.imshow("pre2", thr2)
-    cv2.waitKey(1)
-    return thr2
+    return _bin_from_white_mask(bgr_eq)
 
 
 CFG_BLOCK = "-l eng --oem 1 --psm 6 -c tessedit_char_whitelist=0123456789:,LatLon "
 
+# Te same ustawienia dla silników z puli (parsowane raz, nie przy każdym wywołaniu)
+PROFILE_BLOCK = OcrProfile.from_cli(CFG_BLOCK)
+PROFILE_BLOCK_ALT = OcrProfile.from_cli(CFG_BLOCK_ALT)
+PROFILE_DEED = OcrProfile.from_cli(CFG_DEED)
 
-def ocr_text_block(gray: np.ndarray) -> str:
-    """
-    OCR całego bloku; wybiera dłuższy wynik z dwóch profili (PSM 6 i 4).
-    """
-    t1 = pytesseract.image_to_string(gray, config=CFG_BLOCK).strip()
-    t2 = pytesseract.image_to_string(gray, config=CFG_BLOCK_ALT).strip()
-    text = t1 if len(t1) >= len(t2) else t2
 
-    # for wrong, correct in COMMON_FIX.items():
-    #     text = text.replace(wrong, correct)
+def ocr_text_block(
+    gray: np.ndarray,
+    profiles: Sequence[OcrProfile] = (PROFILE_BLOCK, PROFILE_BLOCK_ALT),
+    score: Callable[[str], int] = len,
+    target: Optional[int] = None,
+) -> str:
+    """
+    OCR całego bloku wszystkimi profilami naraz (pula silników); zwraca wynik
+    z najwyższym ``score`` (domyślnie: najdłuższy, remis – wcześniejszy).
 
-    # Normalizacja spacji/tabów (zachowujemy podziały linii)
-    text = re.sub(r"[ \t]+", " ", text)
+    Gdy któryś wynik osiągnie ``target``, zwraca go od razu: profile jeszcze
+    nie rozpoczęte są anulowane, trwający odczyt kończy się w tle.
+    """
+    pool = get_ocr_pool()
+    pending = {pool.submit(gray, profile): i for i, profile in enumerate(profiles)}
+    best: Optional[tuple] = None  # (score, -indeks profilu, tekst)
+    error: Optional[Exception] = None
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                order = pending.pop(future)
+                try:
+                    text = future.result()
+                except Exception as e:
+                    print(f"[OCR] Profil {profiles[order].to_cli()!r}: {e}")
+                    error = e
+                    continue
+                # Normalizacja spacji/tabów (zachowujemy podziały linii)
+                text = re.sub(r"[ \t]+", " ", text.strip())
+                candidate = (score(text), -order, text)
+                if best is None or candidate > best:
+                    best = candidate
+            if best is not None and target is not None and best[0] >= target:
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+    if best is None:
+        raise error or ValueError("No OCR profiles given")
+
+    text = best[2]
     print("OCR text:", text)
     return text
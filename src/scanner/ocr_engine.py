@@ -0,0 +1,218 @@
+import abc
+import queue
+import shlex
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:  # wiązanie do libtesseract w procesie – opcjonalne
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+class OcrProfile(NamedTuple):
+    """Tesseract settings of one OCR pass (the subset of CLI flags we use)."""
+    lang: str = "eng"
+    oem: int = 1
+    psm: int = 6
+    variables: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_cli(cls, config: str) -> "OcrProfile":
+        """Parse a pytesseract config like ``-l eng --oem 1 --psm 6 -c key=value``."""
+        lang, oem, psm, variables = "eng", 1, 6, []
+        args = shlex.split(config)
+        for i, arg in enumerate(args[:-1]):
+            value = args[i + 1]
+            if arg == "-l":
+                lang = value
+            elif arg == "--oem":
+                oem = int(value)
+            elif arg == "--psm":
+                psm = int(value)
+            elif arg == "-c" and "=" in value:
+                key, _, val = value.partition("=")
+                variables.append((key, val))
+        return cls(lang, oem, psm, tuple(variables))
+
+    def to_cli(self) -> str:
+        flags = [f"-l {self.lang}", f"--oem {self.oem}", f"--psm {self.psm}"]
+        flags += [f"-c {key}={shlex.quote(value)}" for key, value in self.variables]
+        return " ".join(flags)
+
+
+class OcrEngine(abc.ABC):
+    """One OCR worker; used by a single thread at a time (the pool guarantees it)."""
+
+    name = "base"
+
+    @abc.abstractmethod
+    def image_to_string(self, image: np.ndarray, profile: OcrProfile) -> str:
+        """Text recognised in ``image`` with the settings of ``profile``."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook, nothing to free here
+        pass
+
+
+class TesserocrEngine(OcrEngine):
+    """
+    libtesseract in-process through tesserocr.
+
+    The language model is loaded once per (lang, oem) and kept; page
+    segmentation and variables are switched per call. Images go in as raw
+    pixel buffers (SetImageBytes) – no temp files, no subprocess.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self) -> None:
+        if tesserocr is None:
+            raise RuntimeError("tesserocr is not installed")
+        self._apis: Dict[Tuple[str, int], "tesserocr.PyTessBaseAPI"] = {}
+
+    def _api(self, profile: OcrProfile) -> "tesserocr.PyTessBaseAPI":
+        key = (profile.lang, profile.oem)
+        api = self._apis.get(key)
+        if api is None:
+            api = self._apis[key] = tesserocr.PyTessBaseAPI(
+                lang=profile.lang, oem=tesserocr.OEM(profile.oem)
+            )
+        return api
+
+    def image_to_string(self, image: np.ndarray, profile: OcrProfile) -> str:
+        api = self._api(profile)
+        api.SetPageSegMode(tesserocr.PSM(profile.psm))
+        api.ClearAdaptiveClassifier()
+        # zmienne z poprzedniego profilu nie mogą przeciekać do następnego
+        api.SetVariable("tessedit_char_whitelist", "")
+        for key, value in profile.variables:
+            api.SetVariable(key, value)
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        bpp = 1 if image.ndim == 2 else image.shape[2]
+        api.SetImageBytes(image.tobytes(), width, height, bpp, width * bpp)
+        return api.GetUTF8Text()
+
+    def close(self) -> None:
+        for api in self._apis.values():
+            api.End()
+        self._apis.clear()
+
+
+class PytesseractEngine(OcrEngine):
+    """Fallback: tesseract CLI via pytesseract (temp file + process per call)."""
+
+    name = "pytesseract"
+
+    def __init__(self) -> None:
+        import pytesseract
+
+        self._pytesseract = pytesseract
+
+    def image_to_string(self, image: np.ndarray, profile: OcrProfile) -> str:
+        return self._pytesseract.image_to_string(image, config=profile.to_cli())
+
+
+def create_engine(backend: str = "auto") -> OcrEngine:
+    """``tesserocr``, ``pytesseract`` or ``auto`` (tesserocr when installed)."""
+    if backend == "tesserocr" or (backend == "auto" and tesserocr is not None):
+        return TesserocrEngine()
+    if backend in ("auto", "pytesseract"):
+        return PytesseractEngine()
+    raise ValueError(f"Unknown OCR backend {backend!r}")
+
+
+class OcrEnginePool:
+    """
+    Fixed set of long-lived OCR engines shared by the scanner threads.
+
+    Engines are created lazily up to ``size`` and handed out one per caller;
+    a caller that finds them all busy waits for one to come back. ``submit``
+    runs a call on one of ``size`` pool threads, so several profiles of the
+    same image can be read at once.
+    """
+
+    def __init__(self, size: int = 2, backend: str = "auto") -> None:
+        self.size = max(1, size)
+        self.backend = backend
+        self._idle: "queue.LifoQueue[OcrEngine]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @contextmanager
+    def engine(self) -> Iterator[OcrEngine]:
+        engine = self._acquire()
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
+
+    def _acquire(self) -> OcrEngine:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return create_engine(self.backend)
+                except Exception:
+                    self._created -= 1
+                    raise
+        return self._idle.get()
+
+    def image_to_string(self, image: np.ndarray, profile: OcrProfile) -> str:
+        with self.engine() as engine:
+            return engine.image_to_string(image, profile)
+
+    def submit(self, image: np.ndarray, profile: OcrProfile) -> "Future[str]":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.size, thread_name_prefix="ocr"
+                )
+            executor = self._executor
+        return executor.submit(self.image_to_string, image, profile)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self._created = 0
+
+
+_default_pool: Optional[OcrEnginePool] = None
+_default_lock = threading.Lock()
+
+
+def configure_ocr(size: int = 2, backend: str = "auto") -> OcrEnginePool:
+    """Replace the process-wide pool used by ``ocr_core`` (called at start-up)."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+        _default_pool = OcrEnginePool(size, backend)
+        return _default_pool
+
+
+def get_ocr_pool() -> OcrEnginePool:
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = OcrEnginePool()
+        return _default_pool
@@ -13,6 +13,23 @@ from src.scanner.ocr_core import (
     RE_TIME,
 )
 
+# Pola DeedModel wypełniane z tekstu panelu (bez "raw")
+DEED_FIELDS = (
+    "depth_m",
+    "size_label",
+    "size_points",
+    "resource",
+    "planet",
+    "x",
+    "y",
+    "expire_monotonic",
+)
+
+
+def deed_field_count(deed: DeedModel) -> int:
+    """Number of panel fields the parse filled in (``len(DEED_FIELDS)`` = full)."""
+    return sum(getattr(deed, field) is not None for field in DEED_FIELDS)
+
 
 def _merge_position_lines(lines: List[str]) -> List[str]:
     """
@@ -1,45 +1,33 @@
 import re
 import threading
 import time
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-import mss
 import numpy as np
-import win32gui
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, Qt
 
 from src.app.signal_bus import SignalBus
+from src.scanner.capture import CaptureBackend, ClientRect, WindowCaptureBackend
+from src.scanner.change_detector import FrameChangeDetector
+from src.scanner.digit_reader import DigitReader
+from src.scanner.frame_source import FrameSource, RoiHandle
 from src.scanner.ocr_core import ocr_text_block, preprocess_coords
+from src.scanner.poll_scheduler import AdaptivePollScheduler
 
 DEFAULT_COMPASS_W = 30
 DEFAULT_COMPASS_H = 30
+# Pole "Lon/Lat" wewnątrz wycinka kompasu (x, y, w, h)
+DEFAULT_COORDS_RECT = (55, 372, 110, 47)
+_STATS_LOG_SEC = 60.0  # co ile wypisać liczniki klatek/odczytów
 
 _RE_LONLAT = re.compile(r"Lon:\s*(\d{1,6})\s*[\r\n]+Lat:\s*(\d{1,6})", re.IGNORECASE)
 
 
-def _find_game_hwnd(title_substr: str) -> Optional[int]:
-    hwnd = None
-    def enum_cb(h, _):
-        nonlocal hwnd
-        try:
-            title = win32gui.GetWindowText(h)
-            if title_substr.lower() in title.lower() and win32gui.IsWindowVisible(h):
-                hwnd = h
-        except Exception:
-            pass
-    win32gui.EnumWindows(enum_cb, None)
-    return hwnd
-
-
 def _build_compass_region(
-    hwnd: int, w: int, h: int, pad_right: int = 8, pad_bottom: int = 10
+    client: ClientRect, w: int, h: int, pad_right: int = 8, pad_bottom: int = 10
 ) -> dict:
-    left, top, right, bottom = win32gui.GetClientRect(hwnd)
-    client_w = right - left
-    client_h = bottom - top
-    screen_x, screen_y = win32gui.ClientToScreen(hwnd, (0, 0))
-    screen_right = screen_x + client_w
-    screen_bottom = screen_y + client_h
+    screen_right = client.left + client.width
+    screen_bottom = client.top + client.height
     mon_left = max(0, screen_right - pad_right - w)
     mon_top = max(0, screen_bottom - pad_bottom - h)
     return {"left": mon_left, "top": mon_top, "width": w, "height": h}
@@ -51,13 +39,45 @@ class PlayerScanner(QObject):
         bus: SignalBus,
         title_substr: str = "Entropia Universe Client",
         compass_size: Tuple[int, int] = (DEFAULT_COMPASS_W, DEFAULT_COMPASS_H),
-        poll_interval: float = 1.0
+        poll_interval: float = 1.0,
+        digit_reader: Optional[DigitReader] = None,
+        ocr_fallback_interval: float = 0.5,
+        change_detector: Optional[FrameChangeDetector] = None,
+        scheduler: Optional[AdaptivePollScheduler] = None,
+        capture: Optional[CaptureBackend] = None,
+        frames: Optional[FrameSource] = None,
+        coords_rect: Tuple[int, int, int, int] = DEFAULT_COORDS_RECT,
     ) -> None:
         super().__init__()
         self.bus = bus
         self.title_substr = title_substr
+        # okno gry na żywo albo nagranie (replay) – skaner nie widzi różnicy
+        self.capture = capture
+        # wspólne źródło klatek; bez niego skaner ma własne nad ``capture``
+        self.frames = frames
+        self.coords_rect = coords_rect
+        self._coords_roi: Optional[RoiHandle] = None
         self.compass_w, self.compass_h = compass_size
         self.poll_interval = poll_interval
+        # szybki odczyt wzorcami cyfr; Tesseract tylko gdy atlas nie jest pewny
+        self.digit_reader = digit_reader
+        self.ocr_fallback_interval = ocr_fallback_interval
+        self._last_ocr = 0.0
+        # niezmieniony wycinek = ta sama pozycja, bez OCR i bez ponownej emisji
+        self.change_detector = change_detector or FrameChangeDetector()
+        self.last_position: Optional[Tuple[int, int]] = None
+        self.frames_captured = 0
+        self.frames_skipped = 0
+        self.template_reads = 0
+        self.ocr_reads = 0
+        # szybko w ruchu, coraz rzadziej w miejscu; skan deedu / claim budzi od razu
+        self.scheduler = scheduler or AdaptivePollScheduler(
+            poll_interval, poll_interval
+        )
+        wake = Qt.ConnectionType.DirectConnection  # wake() działa z każdego wątku
+        self.bus.scan_requested.connect(self.scheduler.wake, wake)
+        self.bus.resource_claimed.connect(self.scheduler.wake, wake)
+        self.bus.resource_depleted.connect(self.scheduler.wake, wake)
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
 
@@ -72,36 +92,113 @@ class PlayerScanner(QObject):
 
     def stop(self) -> None:
         self._stop.set()
+        self.scheduler.wake()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "frames_captured": self.frames_captured,
+            "frames_skipped": self.frames_skipped,
+            "template_reads": self.template_reads,
+            "ocr_reads": self.ocr_reads,
+        }
+
+    def _log_stats(self) -> None:
+        captured = max(self.frames_captured, 1)
+        print(
+            f"[PlayerScanner] {self.frames_captured} frames, {self.frames_skipped} "
+            f"unchanged ({100 * self.frames_skipped / captured:.0f}%), "
+            f"{self.template_reads} template reads, {self.ocr_reads} OCR runs, "
+            f"{self.scheduler.wakeups} wake-ups; intervals "
+            f"{self.scheduler.format_histogram()}"
+        )
 
     def _worker(self) -> None:
-        with mss.mss() as sct:
-            while not self._stop.is_set():
-                try:
-                    hwnd = _find_game_hwnd(self.title_substr)
-                    if not hwnd:
-                        time.sleep(self.poll_interval)
-                        continue
-
-                    region = _build_compass_region(hwnd, self.compass_w, self.compass_h)
-                    shot = sct.grab(region)
-                    img = np.array(shot)[:, :, :3]
-
-                    # crop coords area
-                    x, y, w, h = 55, 372, 110, 47
-                    roi = img[y:y + h, x:x + w]
-
-                    gray = preprocess_coords(roi)
-                    text = ocr_text_block(gray)
-
-                    m = _RE_LONLAT.search(text)
-                    if m:
-                        try:
-                            lon = int(m.group(1))
-                            lat = int(m.group(2))
-                            self.bus.player_position_parsed.emit(lon, lat)
-                        except ValueError:
-                            pass
-                except Exception:
-                    pass
-
-                time.sleep(self.poll_interval)
+        next_log = time.monotonic() + _STATS_LOG_SEC
+        last_error = ""
+        if self._coords_roi is None:
+            if self.frames is None:
+                capture = self.capture or WindowCaptureBackend(self.title_substr)
+                self.frames = FrameSource(capture)
+            # pobieramy tylko pole współrzędnych, nie cały kompas
+            self._coords_roi = self.frames.register(
+                "compass coords", self._locate_coords, max_age=self.poll_interval
+            )
+        while not self._stop.is_set():
+            if time.monotonic() >= next_log:
+                self._log_stats()
+                next_log += _STATS_LOG_SEC
+            moved = False
+            try:
+                roi = self._coords_roi.read()
+                if roi is None:
+                    self.change_detector.reset()
+                    self.scheduler.feedback(False)
+                    self.scheduler.wait()
+                    continue
+
+                moved = self._process(roi)
+                last_error = ""
+            except Exception as e:
+                # ten sam błąd w każdym cyklu wypisujemy tylko raz
+                error = f"{type(e).__name__}: {e}"
+                if error != last_error:
+                    print(f"[PlayerScanner] Error: {error}")
+                    last_error = error
+
+            self.scheduler.feedback(moved)
+            self.scheduler.wait()
+        self._log_stats()
+        if self.digit_reader is not None:
+            self.digit_reader.save()  # atlas z odczytów od ostatniego zapisu
+
+    def _locate_coords(self, client: ClientRect) -> Dict[str, int]:
+        compass = _build_compass_region(client, self.compass_w, self.compass_h)
+        x, y, w, h = self.coords_rect
+        return {
+            "left": compass["left"] + x,
+            "top": compass["top"] + y,
+            "width": w,
+            "height": h,
+        }
+
+    def _process(self, roi: np.ndarray) -> bool:
+        """Read the ROI if its text changed; True when the position moved."""
+        self.frames_captured += 1
+        if not self.change_detector.changed(roi):
+            self.frames_skipped += 1
+            return False
+        coords = self._read_coords(roi)
+        if coords is None:
+            return False  # wzorzec zostaje stary – następna klatka spróbuje ponownie
+        self.change_detector.accept()
+        if coords == self.last_position:
+            return False  # zmiana w tle ROI, pozycja ta sama – nic do wysłania
+        self.last_position = coords
+        self.bus.player_position_parsed.emit(*coords)
+        return True
+
+    def _read_coords(self, roi: np.ndarray) -> Optional[Tuple[int, int]]:
+        if self.digit_reader is not None:
+            reading = self.digit_reader.read(roi)
+            if reading is not None:
+                self.template_reads += 1
+                return reading.lon, reading.lat
+
+        # OCR najwyżej raz na ocr_fallback_interval, niezależnie od tempa odpytywania
+        now = time.monotonic()
+        if now - self._last_ocr < self.ocr_fallback_interval:
+            return None
+        self._last_ocr = now
+        self.ocr_reads += 1
+
+        gray = preprocess_coords(roi)
+        text = ocr_text_block(gray)
+        m = _RE_LONLAT.search(text)
+        if not m:
+            return None
+        lon, lat = int(m.group(1)), int(m.group(2))
+        if self.digit_reader is not None:
+            # odczyt Tesseracta uczy atlas, o ile liczba cyfr zgadza się z segmentacją
+            self.digit_reader.learn(roi, lon, lat)
+        return lon, lat
@@ -0,0 +1,70 @@
+import math
+import threading
+import time
+from typing import List, Tuple
+
+
+class AdaptivePollScheduler:
+    """
+    Capture cadence for a scanner loop.
+
+    While the scanned value keeps changing the loop runs at ``min_interval``;
+    every poll without a change multiplies the interval by ``backoff`` up to
+    ``max_interval``. ``wake`` (e.g. a hotkey scan or a chat event, from any
+    thread) ends the current wait at once and drops back to the floor.
+
+    Each wait is counted in a histogram of power-of-two buckets starting at
+    ``min_interval`` (woken waits by the time actually slept) so the cadence
+    can be checked afterwards.
+    """
+
+    def __init__(
+        self, min_interval: float, max_interval: float, backoff: float = 2.0
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = max(1.0, backoff)
+        self.interval = min_interval
+        self.wakeups = 0
+        self._wake_event = threading.Event()
+        buckets = math.ceil(math.log2(self.max_interval / self.min_interval)) + 1
+        # kubełek i: czas oczekiwania <= min_interval * 2**i
+        self._histogram = [0] * (buckets + 1)
+
+    def feedback(self, changed: bool) -> None:
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+    def wait(self) -> bool:
+        """Sleep for the current interval; True if ``wake`` cut it short."""
+        t0 = time.monotonic()
+        woken = self._wake_event.wait(self.interval)
+        self._wake_event.clear()
+        # pełny sen liczymy nominalnie (narzut wątku nie przesuwa kubełka)
+        self._count(time.monotonic() - t0 if woken else self.interval)
+        if woken:
+            self.wakeups += 1
+            self.interval = self.min_interval
+        return woken
+
+    def wake(self) -> None:
+        self._wake_event.set()
+
+    def _count(self, waited: float) -> None:
+        ratio = waited / self.min_interval
+        bucket = 0 if ratio <= 1.0 else math.ceil(math.log2(ratio) - 1e-9)
+        self._histogram[min(bucket, len(self._histogram) - 1)] += 1
+
+    def histogram(self) -> List[Tuple[float, int]]:
+        """(bucket upper bound in seconds, waits) pairs; the last bucket is open."""
+        return [
+            (self.min_interval * 2**i, n) for i, n in enumerate(self._histogram)
+        ]
+
+    def format_histogram(self) -> str:
+        rows = self.histogram()
+        parts = [f"<={bound:g}s:{n}" for bound, n in rows[:-1]]
+        parts.append(f">{rows[-2][0]:g}s:{rows[-1][1]}")
+        return " ".join(parts)
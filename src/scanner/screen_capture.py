@@ -1,50 +1,49 @@
 # python
+import threading
 from typing import Dict, Optional, Any
 
-import mss
 import numpy as np
-import win32gui
+
+from src.scanner.capture import CaptureBackend, ClientRect, WindowCaptureBackend
 
 WINDOW_TITLE_SUBSTR = "Entropia Universe Client"
 CROP_W, CROP_H = 445, 445  # rozmiar wycinka z lewego-górnego rogu okna gry
+NO_WINDOW_MSG = "Nie znaleziono okna gry (upewnij się, że jest uruchomione i widoczne)."
 
+_default_backend: Optional[CaptureBackend] = None
+_default_lock = threading.Lock()
 
-def _find_game_hwnd() -> Optional[int]:
-    hwnd = None
-
-    def enum_cb(h: Any, _: Any) -> Any:
-        nonlocal hwnd
-        title = win32gui.GetWindowText(h)
-        if WINDOW_TITLE_SUBSTR.lower() in title.lower() and win32gui.IsWindowVisible(h):
-            hwnd = h
 
-    win32gui.EnumWindows(enum_cb, None)
-    return hwnd
+def default_capture_backend() -> CaptureBackend:
+    """Live window backend shared by callers that do not pass their own."""
+    global _default_backend
+    with _default_lock:
+        if _default_backend is None:
+            _default_backend = WindowCaptureBackend(WINDOW_TITLE_SUBSTR)
+        return _default_backend
 
 
-def build_capture_region(hwnd: int, offset_x: int, offset_y: int) -> Dict[str, int]:
-    left, top, right, bottom = win32gui.GetClientRect(hwnd)
-    screen_x, screen_y = win32gui.ClientToScreen(hwnd, (0, 0))
+def build_capture_region(
+    client: ClientRect, offset_x: int, offset_y: int
+) -> Dict[str, int]:
     return {
-        "left": screen_x + offset_x,
-        "top": screen_y + offset_y,
-        "width": min(CROP_W, max(0, right - offset_x)),
-        "height": min(CROP_H, max(0, bottom - offset_y)),
+        "left": client.left + offset_x,
+        "top": client.top + offset_y,
+        "width": min(CROP_W, max(0, client.width - offset_x)),
+        "height": min(CROP_H, max(0, client.height - offset_y)),
     }
 
 
-def capture_corner_crop(offset_x: int, offset_y: int) -> np.ndarray[Any, Any]:
+def capture_corner_crop(
+    offset_x: int, offset_y: int, backend: Optional[CaptureBackend] = None
+) -> np.ndarray[Any, Any]:
     """
     Zwraca obraz BGR (CROP_W x CROP_H) z lewego górnego rogu klienta okna gry.
     """
-    hwnd = _find_game_hwnd()
-    if not hwnd:
-        raise RuntimeError(
-            "Nie znaleziono okna gry (upewnij się, że jest uruchomione i widoczne)."
-        )
-
-    region = build_capture_region(hwnd, offset_x, offset_y)
-    with mss.mss() as sct:
-        shot = sct.grab(region)
-        # BGRA -> BGR
-        return np.array(shot)[:, :, :3]
+    backend = backend or default_capture_backend()
+    client = backend.client_rect()
+    if client is None:
+        raise RuntimeError(NO_WINDOW_MSG)
+
+    region = build_capture_region(client, offset_x, offset_y)
+    return backend.grab(region)
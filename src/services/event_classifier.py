@@ -0,0 +1,246 @@
+import re
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.models.chat_event_model import SystemEvent
+
+# pola, które wzorzec może wyciągnąć grupą nazwaną
+FIELDS = ("resource", "amount", "value")
+
+# "YYYY-MM-DD HH:MM:SS [Channel] [Sender] " – opcjonalny, działa też na samej treści
+_LINE_PREFIX = (
+    r"(?:\d{4}-\d\d-\d\d \d\d:\d\d:\d\d \[[^\]]*\] \[[^\]]*\] )?"
+)
+# linia systemowa ma stały prefiks: znacznik czasu (19 znaków) + " [System] [] "
+_SYSTEM_TAG = " [System] [] "
+_SYSTEM_TAG_AT = 19
+_SYSTEM_TEXT_AT = _SYSTEM_TAG_AT + len(_SYSTEM_TAG)
+
+# (event type, pattern, ignore case) – dopasowywane od początku treści wiadomości
+DEFAULT_PATTERNS: List[Tuple[str, str, bool]] = [
+    ("resource_claimed",
+     r"You have claimed a resource!\s*\(?(?P<resource>[^()]*?)\)?\s*$", False),
+    ("resource_depleted", r"(?:This )?resource is depleted", True),
+    ("loot",
+     r"You received (?P<resource>.+?) x \((?P<amount>[\d.]+)\)"
+     r"(?: Value: (?P<value>[\d.]+) PED)?", False),
+    ("enhancer_broken",
+     r"Your enhancer (?P<resource>.+?) on your .+? broke\."
+     r".*?You received (?P<value>[\d.]+) PED Shrapnel", False),
+    ("skill_gain",
+     r"You have gained (?P<amount>[\d.]+) experience in your (?P<resource>.+?) skill",
+     False),
+    ("attribute_gain",
+     r"You have gained (?P<amount>[\d.]+) "
+     r"(?P<resource>Agility|Intelligence|Psyche|Stamina|Strength)\b", False),
+    ("skill_rank", r"You have gained a new rank in (?P<resource>.+?)!", False),
+    ("tier_up",
+     r"Your (?P<resource>.+?) has reached tier (?P<amount>[\d.]+)", False),
+    ("damage_dealt", r"You inflicted (?P<amount>[\d.]+) points of damage", False),
+    ("damage_dealt",
+     r"Critical hit - Additional damage! "
+     r"You inflicted (?P<amount>[\d.]+) points of damage", False),
+    ("damage_taken", r"You took (?P<amount>[\d.]+) points of damage", False),
+    ("healed", r"You healed yourself (?P<amount>[\d.]+) points", False),
+    ("mission_completed", r"Mission completed \((?P<resource>.+?)\)", False),
+    ("global",
+     r".+? (?:killed a creature|found a deposit|constructed an item) "
+     r"\((?P<resource>.+?)\) with a value of (?P<value>[\d.]+) PED", False),
+]
+
+
+class _Rule(NamedTuple):
+    event_type: str
+    regex: "re.Pattern[str]"
+    fields: Tuple[int, int, int]  # numery grup resource/amount/value, 0 = brak
+    event: Optional[SystemEvent]  # gotowy wynik wzorca bez pól
+
+
+class _Compiled(NamedTuple):
+    # trie stałych prefiksów wszystkich wzorców (od początku treści wiadomości);
+    # każdy prefiks kończy pusta grupa, więc lastindex mówi, który pasował
+    trie: "re.Pattern[str]"
+    # lastindex (0 = żaden prefiks) -> reguły do sprawdzenia, w kolejności rejestracji
+    candidates: Tuple[Tuple[_Rule, ...], ...]
+
+
+_LINE_PREFIX_RE = re.compile(_LINE_PREFIX)
+_make_event = SystemEvent._make
+
+
+class EventClassifier:
+    """
+    Table-driven classifier of chat system lines.
+
+    Registered patterns are compiled into one dispatch automaton: a regex
+    trie of their literal prefixes ("You received ", "You have gained ", ...).
+    One ``match`` of it on the message text picks the few patterns that can
+    apply, so per-line cost does not grow with the number of registered
+    patterns; the winning pattern then yields the fields (resource, amount,
+    PED value). Candidates are tried in registration order; first match wins.
+
+    The log-line prefix of a System line is cut at its fixed length; the
+    prefix regex only runs for other lines.
+    """
+
+    def __init__(self) -> None:
+        self._patterns: List[Tuple[str, str, bool]] = []
+        self._lock = threading.Lock()
+        self._compiled: Optional[_Compiled] = None
+
+    @classmethod
+    def default(cls) -> "EventClassifier":
+        classifier = cls()
+        for event_type, pattern, ignore_case in DEFAULT_PATTERNS:
+            classifier.register(event_type, pattern, ignore_case=ignore_case)
+        return classifier
+
+    def register(
+        self, event_type: str, pattern: str, ignore_case: bool = False
+    ) -> None:
+        """
+        Add a pattern for ``event_type``, matched at the start of the message text.
+
+        Named groups ``resource``, ``amount`` and ``value`` are extracted;
+        any other group name raises ValueError, a bad pattern re.error.
+        """
+        # błąd składni zgłaszamy przy rejestracji, nie przy pierwszej linii
+        unknown = set(re.compile(pattern).groupindex) - set(FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s) {sorted(unknown)} in pattern for {event_type!r}; "
+                f"allowed: {', '.join(FIELDS)}"
+            )
+        with self._lock:
+            self._patterns.append((event_type, pattern, ignore_case))
+            self._compiled = None
+
+    @property
+    def patterns(self) -> List[Tuple[str, str, bool]]:
+        return list(self._patterns)
+
+    def _compile(self) -> _Compiled:
+        with self._lock:
+            if self._compiled is not None:
+                return self._compiled
+            rules: List[Tuple[str, _Rule]] = []
+            for event_type, pattern, ignore_case in self._patterns:
+                regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+                fields = tuple(regex.groupindex.get(field, 0) for field in FIELDS)
+                # wzorzec bez rozróżniania wielkości liter sprawdzany zawsze
+                prefix = "" if ignore_case else _literal_prefix(pattern)
+                event = None if any(fields) else SystemEvent(event_type)
+                rules.append((prefix, _Rule(event_type, regex, fields, event)))
+            prefixes = sorted({prefix for prefix, _ in rules} - {""})
+            trie = re.compile(f"(?:{_trie_regex(prefixes)})?")
+            candidates: List[Tuple[_Rule, ...]] = [()] * (trie.groups + 1)
+            for key in [""] + prefixes:
+                index = trie.match(key).lastindex or 0 if key else 0
+                candidates[index] = tuple(
+                    rule for prefix, rule in rules if key.startswith(prefix)
+                )
+            self._compiled = _Compiled(trie, tuple(candidates))
+            return self._compiled
+
+    def classify(self, text: str) -> Optional[SystemEvent]:
+        """SystemEvent for a raw line (with or without log prefix), or None."""
+        compiled = self._compiled or self._compile()
+        # zwykła linia System: prefiks po stałej długości, regex tylko dla reszty
+        if text.startswith(_SYSTEM_TAG, _SYSTEM_TAG_AT):
+            pos = _SYSTEM_TEXT_AT
+        else:
+            pos = _LINE_PREFIX_RE.match(text).end()
+        message = text[pos:]
+        for rule in compiled.candidates[compiled.trie.match(message).lastindex or 0]:
+            m = rule.regex.match(message)
+            if m is None:
+                continue
+            if rule.event is not None:
+                return rule.event
+            resource, amount, value = rule.fields
+            return _make_event((
+                rule.event_type,
+                ((m.group(resource) or "").strip() or None) if resource else None,
+                _number(m.group(amount)) if amount else None,
+                _number(m.group(value)) if value else None,
+            ))
+        return None
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Literal text every match of ``pattern`` starts with ("" if none)."""
+    prefix: List[str] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            nxt = pattern[i + 1 : i + 2]
+            if not nxt or nxt.isalnum():  # \d, \s, \b, odwołania...
+                break
+            char, step = nxt, 2
+        elif char in ".^$*+?{}[]|()":
+            break
+        else:
+            step = 1
+        if pattern[i + step : i + step + 1] in ("*", "?", "{"):
+            break  # znak z kwantyfikatorem nie jest pewny
+        prefix.append(char)
+        i += step
+    if "|" in pattern and not _top_level_single_branch(pattern):
+        return ""
+    return "".join(prefix)
+
+
+def _top_level_single_branch(pattern: str) -> bool:
+    depth = 0
+    escaped = in_class = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return False
+    return True
+
+
+def _trie_regex(prefixes: List[str]) -> str:
+    """
+    Regex matching the longest of ``prefixes`` that the text starts with; an
+    empty group closes every prefix, so ``lastindex`` tells which one matched.
+    """
+    if not prefixes:
+        return "(?!)"
+    trie: Dict[str, dict] = {}
+    for prefix in prefixes:
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[""] = {}  # koniec prefiksu
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child) for char, child in node.items() if char
+        ]
+        if not branches:
+            return "()"
+        body = "(?:" + "|".join(branches) + ")" if len(branches) > 1 else branches[0]
+        # najpierw dłuższy prefiks, do końca krótszego wracamy tylko przy porażce
+        return f"(?:{body}|())" if "" in node else body
+
+    return build(trie)
+
+
+def _number(text: Optional[str]) -> Optional[float]:
+    try:
+        return float(text) if text else None
+    except ValueError:
+        return None
@@ -1,9 +1,17 @@
-from typing import List, Dict, Any
+import heapq
+import math
+import time
+from array import array
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from PyQt6.QtCore import QObject, QPointF, QTimer
 
 from src.app.signal_bus import SignalBus
-from src.map.map_utils import lonlat_to_scene
-from src.models.deed_model import DeedModel
+from src.map.map_utils import get_planet_geometry
+from src.models.deed_model import DeedModel, DeedTicks
+from src.utils.spatial_index import GridIndex
+
+NEAR_PX = 10.0  # skany bliżej niż to (manhattan) aktualizują istniejący marker
+_LABEL_EPS = 0.001  # budzimy się tuż po zmianie pełnej sekundy TTL
 
 
 class MarkerData:
@@ -14,57 +22,184 @@ class MarkerData:
         self.deed = deed
 
 
+class _DeadlineQueue:
+    """Min-heap of (deadline, marker_id, deed); stale entries are dropped lazily."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, str, DeedModel]] = []
+        self._seq = 0
+
+    def push(self, deadline: float, marker_id: str, deed: DeedModel) -> None:
+        heapq.heappush(self._heap, (deadline, self._seq, marker_id, deed))
+        self._seq += 1
+
+    def pop_due(self, now: float) -> List[Tuple[str, DeedModel]]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, marker_id, deed = heapq.heappop(self._heap)
+            due.append((marker_id, deed))
+        return due
+
+    def next_deadline(
+        self, is_live: Callable[[str, DeedModel], bool]
+    ) -> Optional[float]:
+        while self._heap and not is_live(self._heap[0][2], self._heap[0][3]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+
 class DeedMarkerService(QObject):
+    """
+    Deed markers on the map.
+
+    Expiry is driven by a min-heap on ``expire_monotonic`` and a single-shot timer
+    armed for the earliest deadline, so an idle service costs nothing. Label
+    refreshes use a second heap keyed on the moment each marker's shown TTL
+    changes (rounded up to ``deeds.label_resolution_sec``); every refresh emits
+    one ``deed_markers_ticked`` batch.
+    """
+
     def __init__(self, bus: SignalBus, config: Dict[str, Any]):
         super().__init__()
         self.bus = bus
         self.config = config
-        self.deed_markers: List[MarkerData] = []
+        self.deed_markers: Dict[str, MarkerData] = {}
+        self.marker_index: GridIndex[str] = GridIndex(cell_size=32.0)
         self.player_pos: QPointF = QPointF(0, 0)
+        self.depletion_max_dist_px = float(config["deeds"]["depletion_max_dist_px"])
+        self.label_resolution_sec = max(1, int(config["deeds"]["label_resolution_sec"]))
+        self._next_marker_no = 0
+
+        self._expiry = _DeadlineQueue()
+        self._labels = _DeadlineQueue()
+        self._shown_ttl: Dict[str, int] = {}  # ostatnio wysłana wartość etykiety
+        self._expiry_timer = QTimer(self)
+        self._expiry_timer.setSingleShot(True)
+        self._expiry_timer.timeout.connect(self._on_expiry_due)
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.timeout.connect(self._on_labels_due)
 
         self.bus.deed_found.connect(self._on_scan_result)
         self.bus.player_position_changed.connect(self._on_player_position_changed)
         self.bus.resource_depleted.connect(self.remove_nearest_deed)
+        self.bus.planet_changed.connect(self._on_planet_changed)
 
     def _on_scan_result(self, deed: DeedModel) -> None:
         lon, lat = deed.x, deed.y
         if lon is None or lat is None:
             return
 
-        x, y = lonlat_to_scene(lon, lat, self.config)
+        x, y = get_planet_geometry(self.config).lonlat_to_scene(lon, lat)
         pos = QPointF(x, y)
         ttl_sec = deed.ttl_sec or 0
-        NEAR_PX = 10.0
 
         # Aktualizacja istniejącego markera
-        for marker in self.deed_markers:
+        for marker_id in self.marker_index.query_radius(x, y, NEAR_PX):
+            marker = self.deed_markers[marker_id]
             if (marker.pos - pos).manhattanLength() <= NEAR_PX:
                 if ttl_sec > (marker.deed.ttl_sec or 0):
                     marker.deed = deed
+                    self._schedule(marker)
                 self.bus.deed_marker_updated.emit(
                     marker.marker_id, pos.x(), pos.y(), marker.radius, marker.deed
                 )
                 return
 
         # Dodanie nowego markera
-        marker_id = f"{lon}-{lat}-{len(self.deed_markers)}"
+        marker_id = f"{lon}-{lat}-{self._next_marker_no}"
+        self._next_marker_no += 1
         radius_px = 0.2
         new_marker = MarkerData(marker_id, pos, radius_px, deed)
-        self.deed_markers.append(new_marker)
+        self.deed_markers[marker_id] = new_marker
+        self.marker_index.insert(marker_id, x, y)
         self.bus.deed_marker_added.emit(marker_id, pos.x(), pos.y(), radius_px, deed)
+        self._schedule(new_marker)
+
+    def _on_planet_changed(self, planet: str) -> None:
+        # pozycje markerów dotyczą poprzedniej mapy
+        for marker_id in self.deed_markers:
+            self.bus.deed_marker_removed.emit(marker_id)
+        self.deed_markers = {}
+        self.marker_index.clear()
+        self._expiry.clear()
+        self._labels.clear()
+        self._shown_ttl.clear()
+        self._expiry_timer.stop()
+        self._label_timer.stop()
 
     def _on_player_position_changed(self, pos: QPointF) -> None:
         self.player_pos = pos
 
-    def tick_deeds(self) -> None:
-        alive = []
-        for marker in self.deed_markers:
-            if (marker.deed.ttl_sec or 0) <= 0:
-                self.bus.deed_marker_removed.emit(marker.marker_id)
+    def _is_live(self, marker_id: str, deed: DeedModel) -> bool:
+        marker = self.deed_markers.get(marker_id)
+        return marker is not None and marker.deed is deed
+
+    def _schedule(self, marker: MarkerData) -> None:
+        now = time.monotonic()
+        expire = marker.deed.expire_monotonic
+        # deed bez TTL znika od razu, jak przy dawnym cyklicznym sprawdzaniu
+        deadline = expire if expire is not None else now
+        self._expiry.push(deadline, marker.marker_id, marker.deed)
+        self._push_label(marker.marker_id, marker.deed, now)
+        self._arm(self._expiry, self._expiry_timer, now)
+        self._arm(self._labels, self._label_timer, now)
+
+    def _shown_value(self, ttl_sec: int) -> int:
+        step = self.label_resolution_sec
+        return -(-ttl_sec // step) * step
+
+    def _push_label(self, marker_id: str, deed: DeedModel, now: float) -> None:
+        expire = deed.expire_monotonic
+        if expire is None:
+            return
+        ttl = int(expire - now)
+        # etykieta zmieni się, gdy int(expire - t) spadnie poniżej `threshold`
+        threshold = self._shown_value(ttl) - self.label_resolution_sec + 1
+        if ttl <= 0 or threshold <= 0:
+            return  # następną zmianą jest już samo wygaśnięcie
+        self._labels.push(expire - threshold + _LABEL_EPS, marker_id, deed)
+
+    def _arm(self, queue: _DeadlineQueue, timer: QTimer, now: float) -> None:
+        deadline = queue.next_deadline(self._is_live)
+        if deadline is None:
+            timer.stop()
+            return
+        timer.start(max(0, math.ceil((deadline - now) * 1000)))
+
+    def _on_expiry_due(self) -> None:
+        now = time.monotonic()
+        for marker_id, deed in self._expiry.pop_due(now):
+            if self._is_live(marker_id, deed):
+                self._remove_marker(marker_id)
+        self._arm(self._expiry, self._expiry_timer, now)
+
+    def _on_labels_due(self) -> None:
+        now = time.monotonic()
+        ticks = DeedTicks([], array("i"))
+        for marker_id, deed in self._labels.pop_due(now):
+            if not self._is_live(marker_id, deed) or deed.expire_monotonic is None:
                 continue
-            self.bus.deed_marker_tick.emit(marker.marker_id, marker.deed.ttl_sec)
-            alive.append(marker)
-        self.deed_markers = alive
+            ttl = int(deed.expire_monotonic - now)
+            if ttl > 0:
+                shown = self._shown_value(ttl)
+                if self._shown_ttl.get(marker_id) != shown:
+                    self._shown_ttl[marker_id] = shown
+                    ticks.marker_ids.append(marker_id)
+                    ticks.ttl_sec.append(shown)
+            self._push_label(marker_id, deed, now)
+        if ticks.marker_ids:
+            self.bus.deed_markers_ticked.emit(ticks)
+        self._arm(self._labels, self._label_timer, now)
+
+    def _remove_marker(self, marker_id: str) -> None:
+        del self.deed_markers[marker_id]
+        self.marker_index.remove(marker_id)
+        self._shown_ttl.pop(marker_id, None)
+        self.bus.deed_marker_removed.emit(marker_id)
 
     def _on_resource_depleted(self) -> None:
         if self.player_pos is None:
@@ -76,11 +211,14 @@ class DeedMarkerService(QObject):
         if not self.deed_markers or self.player_pos is None:
             return
 
-        nearest = min(
-            self.deed_markers,
-            key=lambda mk: (mk.pos - self.player_pos).manhattanLength(),
-            default=None
+        nearest = self.marker_index.nearest(
+            self.player_pos.x(),
+            self.player_pos.y(),
+            k=1,
+            max_dist=self.depletion_max_dist_px,
         )
         if nearest:
-            self.bus.deed_marker_removed.emit(nearest.marker_id)
-            self.deed_markers.remove(nearest)
+            self._remove_marker(nearest[0][1])
+        else:
+            print("[DeedMarkerService] No deed near the player, skipping removal")
+
@@ -0,0 +1,231 @@
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+from src.app.signal_bus import SignalBus
+from src.models.chat_event_model import SystemEvent
+from src.models.deed_model import DeedModel
+from src.models.mining_stats_model import MiningStatsSnapshot, RunStats
+
+# rodzaje zdarzeń w kolumnie "kind"
+DEED, CLAIM, DEPLETED, LOOT = range(4)
+_MIN_RATE_SPAN = 60.0  # tempo /h z krótszego okresu byłoby tylko szumem
+_COMPACT_MIN = 4096  # usuwamy przeterminowany początek bufora dopiero od tylu wierszy
+
+
+class _Aggregates:
+    """Running sums of one span; ``add(..., sign=-1)`` takes an event back out."""
+
+    def __init__(self) -> None:
+        self.counts = array("q", [0] * 4)
+        self.loot_ped = 0.0
+        self.claims_by_resource = array("q")
+        self.size_sum_by_depth = array("d")
+        self.deeds_by_depth = array("q")
+
+    def add(
+        self, kind: int, resource: int, depth_bin: int, size: float, value: float,
+        sign: int = 1,
+    ) -> None:
+        self.counts[kind] += sign
+        if kind == CLAIM and resource >= 0:
+            if resource >= len(self.claims_by_resource):
+                self.claims_by_resource.extend(
+                    [0] * (resource + 1 - len(self.claims_by_resource))
+                )
+            self.claims_by_resource[resource] += sign
+        elif kind == DEED and depth_bin >= 0:
+            if depth_bin >= len(self.deeds_by_depth):
+                grow = depth_bin + 1 - len(self.deeds_by_depth)
+                self.deeds_by_depth.extend([0] * grow)
+                self.size_sum_by_depth.extend([0.0] * grow)
+            self.deeds_by_depth[depth_bin] += sign
+            self.size_sum_by_depth[depth_bin] += sign * size
+        elif kind == LOOT:
+            self.loot_ped += sign * value
+
+
+class _EventColumns:
+    """Columnar event log of the rolling window (array.array per field)."""
+
+    def __init__(self) -> None:
+        self.ts = array("d")
+        self.kind = array("b")
+        self.resource = array("h")   # id z MiningStatsService._resources, -1 = brak
+        self.depth_bin = array("h")  # -1 = brak głębokości/rozmiaru
+        self.size = array("d")
+        self.value = array("d")
+        self.head = 0  # pierwszy wiersz wciąż w oknie
+
+    def append(
+        self, ts: float, kind: int, resource: int, depth_bin: int, size: float,
+        value: float,
+    ) -> None:
+        self.ts.append(ts)
+        self.kind.append(kind)
+        self.resource.append(resource)
+        self.depth_bin.append(depth_bin)
+        self.size.append(size)
+        self.value.append(value)
+
+    def compact(self) -> None:
+        # amortyzowane O(1): kasujemy prefiks, gdy stanowi ponad połowę bufora
+        if self.head < _COMPACT_MIN or self.head * 2 < len(self.ts):
+            return
+        for column in (
+            self.ts, self.kind, self.resource, self.depth_bin, self.size, self.value
+        ):
+            del column[: self.head]
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.ts) - self.head
+
+
+class MiningStatsService(QObject):
+    """
+    Live mining run statistics.
+
+    Every event (new deed, claim, depletion, loot) is appended to compact
+    array.array columns and added to two sets of running sums: the whole
+    session and a rolling window. Events leaving the window are subtracted
+    as the window's head moves, so each event costs O(1) no matter how long
+    the session runs; only the window's rows are kept in memory. A timer
+    publishes a ``MiningStatsSnapshot`` on ``mining_stats_updated``.
+
+    A drop is counted as a new deed (``deed_marker_added``, so re-scanning a
+    marked deed does not count twice); claims per drop = claims / deeds.
+    Claims, depletions and loot come from ``system_events_classified``;
+    batches replayed by the chat-log backfill are skipped, since they would
+    be stamped with the current time.
+    """
+
+    def __init__(self, bus: SignalBus, config: Dict[str, Any]):
+        super().__init__()
+        self.bus = bus
+        cfg = config.get("mining_stats", {})
+        self.window_sec = float(cfg.get("window_min", 60)) * 60.0
+        self.depth_bin_m = max(1, int(cfg.get("depth_bin_m", 100)))
+
+        self.started = time.monotonic()
+        self.session = _Aggregates()
+        self.window = _Aggregates()
+        self.columns = _EventColumns()
+        self.events = 0
+        self._resources: Dict[str, int] = {}
+        self._resource_names: List[str] = []
+
+        self.bus.deed_marker_added.connect(self._on_deed_added)
+        self.bus.system_events_classified.connect(self._on_system_events)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(cfg.get("refresh_ms", 1000)))
+        self._timer.timeout.connect(self._publish)
+        self._timer.start()
+
+    # --- events ----------------------------------------------------------
+
+    def _on_deed_added(
+        self, marker_id: str, x: float, y: float, radius: float, deed: DeedModel
+    ) -> None:
+        depth_bin, size = -1, 0.0
+        if deed is not None and None not in (deed.depth_m, deed.size_points):
+            depth_bin = min(deed.depth_m // self.depth_bin_m, 32767)
+            size = float(deed.size_points)
+        self.record(DEED, depth_bin=depth_bin, size=size)
+
+    def _on_system_events(self, events: List[SystemEvent], replayed: bool) -> None:
+        if replayed:
+            return  # backfill – czas zdarzenia to nie "teraz"
+        for event in events:
+            if event.event_type == "resource_claimed":
+                self.record(CLAIM, resource=self._resource_id(event.resource or ""))
+            elif event.event_type == "resource_depleted":
+                self.record(DEPLETED)
+            elif event.event_type == "loot" and event.value:
+                self.record(LOOT, value=event.value)
+
+    def _resource_id(self, name: str) -> int:
+        if not name:
+            return -1
+        rid = self._resources.get(name)
+        if rid is None:
+            rid = self._resources[name] = len(self._resource_names)
+            self._resource_names.append(name)
+        return rid
+
+    def record(
+        self,
+        kind: int,
+        resource: int = -1,
+        depth_bin: int = -1,
+        size: float = 0.0,
+        value: float = 0.0,
+        now: Optional[float] = None,
+    ) -> None:
+        """Add one event; O(1) amortized, including window expiry."""
+        now = time.monotonic() if now is None else now
+        self.columns.append(now, kind, resource, depth_bin, size, value)
+        self.session.add(kind, resource, depth_bin, size, value)
+        self.window.add(kind, resource, depth_bin, size, value)
+        self.events += 1
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        c = self.columns
+        cutoff = now - self.window_sec
+        head, end = c.head, len(c.ts)
+        while head < end and c.ts[head] < cutoff:
+            self.window.add(
+                c.kind[head], c.resource[head], c.depth_bin[head], c.size[head],
+                c.value[head], sign=-1,
+            )
+            head += 1
+        if head != c.head:
+            c.head = head
+            c.compact()
+
+    # --- snapshots -------------------------------------------------------
+
+    def snapshot(self, now: Optional[float] = None) -> MiningStatsSnapshot:
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        elapsed = max(now - self.started, 0.0)
+        return MiningStatsSnapshot(
+            session=self._stats(self.session, elapsed),
+            window=self._stats(self.window, min(elapsed, self.window_sec)),
+            window_sec=self.window_sec,
+            events=self.events,
+        )
+
+    def _stats(self, agg: _Aggregates, span_sec: float) -> RunStats:
+        deeds, claims = agg.counts[DEED], agg.counts[CLAIM]
+        mix = sorted(
+            (
+                (self._resource_names[rid], n)
+                for rid, n in enumerate(agg.claims_by_resource) if n > 0
+            ),
+            key=lambda item: -item[1],
+        )
+        by_depth = [
+            (bin_no * self.depth_bin_m, agg.size_sum_by_depth[bin_no] / n, n)
+            for bin_no, n in enumerate(agg.deeds_by_depth) if n > 0
+        ]
+        return RunStats(
+            span_sec=span_sec,
+            deeds=deeds,
+            claims=claims,
+            depleted=agg.counts[DEPLETED],
+            loot_ped=round(agg.loot_ped, 4),
+            claims_per_drop=claims / deeds if deeds else 0.0,
+            deeds_per_hour=deeds * 3600.0 / max(span_sec, _MIN_RATE_SPAN),
+            resource_mix=mix,
+            size_by_depth=by_depth,
+        )
+
+    def _publish(self) -> None:
+        # tempo/h i okno zmieniają się też bez nowych zdarzeń – publikujemy co tick
+        if self.events:
+            self.bus.mining_stats_updated.emit(self.snapshot())
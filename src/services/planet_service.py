@@ -0,0 +1,47 @@
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QObject
+
+from src.app.signal_bus import SignalBus
+from src.models.deed_model import DeedModel
+
+
+class PlanetService(QObject):
+    """Owns the current planet (config["map"]["planet"]) and announces switches."""
+
+    def __init__(self, bus: SignalBus, config: Dict[str, Any]) -> None:
+        super().__init__()
+        self.bus = bus
+        self.config = config
+
+        # Must be connected before DeedMarkerService so a deed from another planet
+        # switches the map before its marker is placed.
+        self.bus.deed_found.connect(self._on_deed_found)
+
+    @property
+    def current(self) -> str:
+        return str(self.config["map"]["planet"])
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Match a planet name case-insensitively against config["planets"]."""
+        wanted = name.strip().lower()
+        for planet in self.config["planets"]:
+            if planet.lower() == wanted:
+                return str(planet)
+        return None
+
+    def switch_planet(self, name: str) -> bool:
+        """Make ``name`` the current planet; returns False if it is unknown."""
+        planet = self.resolve(name)
+        if planet is None:
+            print(f"[PlanetService] Unknown planet: {name}")
+            return False
+        if planet == self.current:
+            return True
+        self.config["map"]["planet"] = planet
+        self.bus.planet_changed.emit(planet)
+        return True
+
+    def _on_deed_found(self, deed: DeedModel) -> None:
+        if deed.planet and self.resolve(deed.planet) not in (None, self.current):
+            self.switch_planet(deed.planet)
@@ -4,7 +4,7 @@ from typing import Dict, Any
 from PyQt6.QtCore import QPointF, QRectF
 
 from src.app.signal_bus import SignalBus
-from src.map.map_utils import lonlat_to_scene, coord_to_pixel_radius
+from src.map.map_utils import get_planet_geometry
 
 
 class PlayerPositionService:
@@ -27,8 +27,11 @@ class PlayerPositionService:
 
     def update_position(self, lon: int, lat: int) -> None:
         print("Updating player position")
-        x, y = lonlat_to_scene(lon, lat, self.config)
+        geometry = get_planet_geometry(self.config)
+        x, y = geometry.lonlat_to_scene(lon, lat)
         self.player_position = QPointF(x, y)
-        radius = coord_to_pixel_radius(self.config)
+        radius = geometry.coord_to_pixel_radius(
+            self.config["player"]["radius_coord"]
+        )
         self.player_position_rect = QRectF(x - radius, y - radius, 2 * radius, 2 * radius)
         self.bus.player_position_changed.emit(self.player_position, self.player_position_rect)
@@ -1,19 +1,40 @@
-import time
+from typing import List, Optional
 from PyQt6.QtCore import QObject
 from src.app.signal_bus import SignalBus
+from src.models.chat_event_model import SystemEvent
+from src.services.event_classifier import EventClassifier
 
 class SystemEventManager(QObject):
     """Filter raw system messages and emit high-level events."""
 
-    def __init__(self, bus: SignalBus) -> None:
+    def __init__(
+        self, bus: SignalBus, classifier: Optional[EventClassifier] = None
+    ) -> None:
         super().__init__()
         self.bus = bus
-        self.bus.system_event.connect(self._on_system)
+        self.classifier = classifier or EventClassifier.default()
+        self.bus.system_events.connect(self._on_system_batch)
 
-    def _on_system(self, text: str) -> None:
-        if "resource is depleted" in text.lower():
+    def register(
+        self, event_type: str, pattern: str, ignore_case: bool = False
+    ) -> None:
+        """Classify lines matching ``pattern`` as ``event_type``."""
+        self.classifier.register(event_type, pattern, ignore_case=ignore_case)
+
+    def classify(self, text: str) -> Optional[SystemEvent]:
+        """Pure function of the line – also used off the GUI thread for storage."""
+        return self.classifier.classify(text)
+
+    def _on_system_batch(self, lines: List[str], replayed: bool = False) -> None:
+        events = []
+        for text in lines:
+            event = self.classifier.classify(text)
+            if event is None:
+                continue
+            events.append(event)
+            if event.event_type == "resource_depleted":
                 self.bus.resource_depleted.emit(text)
-        if "You have claime a resource!" in text.lower():
-            # Extract resource name
-            resource_name = text.split("You have claime a resource! ")[-1].strip()
-            self.bus.resource_claimed.emit(resource_name)
+            elif event.event_type == "resource_claimed":
+                self.bus.resource_claimed.emit(event.resource or "")
+        if events:
+            self.bus.system_events_classified.emit(events, replayed)
@@ -1,15 +1,23 @@
 # python
 import threading
 import time
-import keyboard
+from typing import Dict, Optional, Sequence, Tuple
 
-from typing import Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.app.signal_bus import SignalBus
 from src.models.deed_model import DeedModel
-from src.scanner.ocr_controller import extract_deed_from_window
+from src.scanner.capture import CaptureBackend, ClientRect
+from src.scanner.deed_cache import DeedScanCache
+from src.scanner.frame_source import FrameSource, RoiHandle
+from src.scanner.ocr_controller import DEED_PROFILES, extract_deed_from_image
 from src.scanner.ocr_core import DEFAULT_INNER
+from src.scanner.ocr_engine import OcrProfile
+from src.scanner.screen_capture import (
+    NO_WINDOW_MSG,
+    build_capture_region,
+    default_capture_backend,
+)
 
 
 class HotkeyScannerListener(QObject):
@@ -24,6 +32,10 @@ class HotkeyScannerListener(QObject):
         save_dir: Optional[str] = None,
         hotkey: str = "f8",
         cooldown_sec: float = 0.5,
+        ocr_profiles: Sequence[OcrProfile] = DEED_PROFILES,
+        scan_cache: Optional[DeedScanCache] = None,
+        capture: Optional[CaptureBackend] = None,
+        frames: Optional[FrameSource] = None,
     ) -> None:
         super().__init__()
         self.bus = bus
@@ -39,6 +51,12 @@ class HotkeyScannerListener(QObject):
         self.save_dir = save_dir
         self.hotkey = hotkey
         self.cooldown_sec = cooldown_sec
+        self.ocr_profiles = tuple(ocr_profiles)
+        self.scan_cache = scan_cache
+        self.capture = capture  # None = okno gry na żywo
+        # wspólne źródło klatek; bez niego skaner ma własne nad ``capture``
+        self.frames = frames
+        self._panel: Optional[RoiHandle] = None
         self._thread: Optional[threading.Thread] = None
         self._stop: threading.Event = threading.Event()
 
@@ -54,7 +72,52 @@ class HotkeyScannerListener(QObject):
     def stop(self) -> None:
         self._stop.set()
 
+    def scan(self) -> Optional[DeedModel]:
+        """One deed scan, as on a hotkey press; emits deed_found on success."""
+        self.bus.scan_requested.emit()
+        try:
+            corner = self._deed_panel().read()
+            if corner is None:
+                raise RuntimeError(NO_WINDOW_MSG)
+            deed: DeedModel = extract_deed_from_image(
+                corner,
+                inner_rect=self.inner_rect,
+                debug=self.debug,
+                save_dir=self.save_dir,
+                profiles=self.ocr_profiles,
+                cache=self.scan_cache,
+            )
+            if self.scan_cache is not None:
+                stats = self.scan_cache.stats
+                print(
+                    f"[scanner] cache: {stats['hits']} hits, "
+                    f"{stats['misses']} misses"
+                )
+            try:
+                self.bus.deed_found.emit(deed)
+            except Exception as e:
+                print(f"[scanner] Błąd emisji sygnału: {e}")
+            return deed
+        except Exception as e:
+            print(f"[scanner] Błąd skanowania: {e}")
+            return None
+
+    def _deed_panel(self) -> RoiHandle:
+        if self._panel is None:
+            if self.frames is None:
+                self.frames = FrameSource(self.capture or default_capture_backend())
+            # skan na żądanie: zawsze świeża klatka, nie dokładany do odpytywania
+            self._panel = self.frames.register(
+                "deed panel", self._locate_panel, max_age=0.0, continuous=False
+            )
+        return self._panel
+
+    def _locate_panel(self, client: ClientRect) -> Dict[str, int]:
+        return build_capture_region(client, self.offset_x, self.offset_y)
+
     def _worker(self) -> None:
+        import keyboard  # hak klawiatury tylko dla nasłuchu na żywo
+
         print(
             f"[scanner] Naciśnij {self.hotkey.upper()} aby zeskanować (cooldown {self.cooldown_sec}s)."
         )
@@ -64,20 +127,7 @@ class HotkeyScannerListener(QObject):
                 if keyboard.is_pressed(self.hotkey):
                     now = time.time()
                     if now - last_ts >= self.cooldown_sec:
-                        try:
-                            deed: DeedModel = extract_deed_from_window(
-                                offset_x=self.offset_x,
-                                offset_y=self.offset_y,
-                                inner_rect=self.inner_rect,
-                                debug=self.debug,
-                                save_dir=self.save_dir,
-                            )
-                            try:
-                                self.bus.deed_found.emit(deed)
-                            except Exception as e:
-                                print(f"[scanner] Błąd emisji sygnału: {e}")
-                        except Exception as e:
-                            print(f"[scanner] Błąd skanowania: {e}")
+                        self.scan()
                         last_ts = now
                     time.sleep(0.05)
                 else:
@@ -87,4 +137,4 @@ class HotkeyScannerListener(QObject):
                 break
             except Exception as e:
                 print(f"[scanner] nieoczekiwany błąd pętli: {e}")
-                time.sleep(0.5)
\ No newline at end of file
+                time.sleep(0.5)
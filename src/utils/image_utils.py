@@ -0,0 +1,10 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+def nonzero_runs(profile: np.ndarray) -> List[Tuple[int, int]]:
+    """[start, stop) ranges where the 1-D ``profile`` is non-zero."""
+    edges = np.concatenate(([0], profile > 0, [0])).astype(np.int8)
+    on = np.flatnonzero(np.diff(edges))
+    return list(zip(on[::2].tolist(), on[1::2].tolist(), strict=True))
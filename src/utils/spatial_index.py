@@ -0,0 +1,161 @@
+import heapq
+import itertools
+import math
+from typing import (
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+Cell = Tuple[int, int]
+
+
+class GridIndex(Generic[K]):
+    """
+    Uniform-grid spatial hash over 2D points (scene pixels).
+
+    Insert/remove are O(1); radius and k-nearest queries only visit the cells
+    around the query point, so their cost depends on local density, not on the
+    total number of points.
+    """
+
+    def __init__(self, cell_size: float = 32.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Dict[K, Tuple[float, float]]] = {}
+        self._points: Dict[K, Tuple[float, float]] = {}
+        # zakres zajętych komórek – ogranicza przeszukiwanie pierścieni w nearest()
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._points
+
+    def _cell(self, x: float, y: float) -> Cell:
+        size = self.cell_size
+        return int(math.floor(x / size)), int(math.floor(y / size))
+
+    def position(self, key: K) -> Optional[Tuple[float, float]]:
+        return self._points.get(key)
+
+    def insert(self, key: K, x: float, y: float) -> None:
+        """Add ``key`` at (x, y); an existing key is moved."""
+        if key in self._points:
+            self.remove(key)
+        cell = self._cell(x, y)
+        self._cells.setdefault(cell, {})[key] = (x, y)
+        self._points[key] = (x, y)
+        if self._bounds is None:
+            self._bounds = (cell[0], cell[1], cell[0], cell[1])
+        else:
+            x0, y0, x1, y1 = self._bounds
+            self._bounds = (
+                min(x0, cell[0]),
+                min(y0, cell[1]),
+                max(x1, cell[0]),
+                max(y1, cell[1]),
+            )
+
+    def remove(self, key: K) -> bool:
+        pos = self._points.pop(key, None)
+        if pos is None:
+            return False
+        cell = self._cell(*pos)
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+        if not self._points:
+            self._bounds = None
+        return True
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._points.clear()
+        self._bounds = None
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[K]:
+        """Keys within Euclidean ``radius`` of (x, y), in no particular order."""
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        r2 = radius * radius
+        found: List[K] = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key, (px, py) in bucket.items():
+                    if (px - x) ** 2 + (py - y) ** 2 <= r2:
+                        found.append(key)
+        return found
+
+    def nearest(
+        self, x: float, y: float, k: int = 1, max_dist: float = math.inf
+    ) -> List[Tuple[float, K]]:
+        """Up to ``k`` (distance, key) pairs closest to (x, y), nearest first."""
+        if k <= 0 or self._bounds is None:
+            return []
+        cx, cy = self._cell(x, y)
+        bx0, by0, bx1, by1 = self._bounds
+        max_ring = max(cx - bx0, bx1 - cx, cy - by0, by1 - cy, 0)
+
+        best: List[Tuple[float, int, K]] = []  # max-heap po -dist
+        order = itertools.count()
+        for ring in range(max_ring + 1):
+            # nieprzeszukane punkty (pierścienie >= ring) są dalej niż ten próg
+            lower_bound = (ring - 1) * self.cell_size if ring else 0.0
+            if lower_bound > max_dist:
+                break
+            if len(best) == k and -best[0][0] <= lower_bound:
+                break
+            self._scan_ring(cx, cy, ring, x, y, k, max_dist, best, order)
+        return [(-d, key) for d, _, key in sorted(best, reverse=True)]
+
+    def _scan_ring(
+        self,
+        cx: int,
+        cy: int,
+        ring: int,
+        x: float,
+        y: float,
+        k: int,
+        max_dist: float,
+        best: List[Tuple[float, int, K]],
+        order: Iterator[int],
+    ) -> None:
+        """Push the points of one ring of cells into the ``k``-best heap."""
+        for cell in self._ring_cells(cx, cy, ring):
+            bucket = self._cells.get(cell)
+            if not bucket:
+                continue
+            for key, (px, py) in bucket.items():
+                dist = math.hypot(px - x, py - y)
+                if dist > max_dist:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-dist, next(order), key))
+                elif dist < -best[0][0]:
+                    heapq.heapreplace(best, (-dist, next(order), key))
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> List[Cell]:
+        if ring == 0:
+            return [(cx, cy)]
+        cells = []
+        for dx in range(-ring, ring + 1):
+            cells.append((cx + dx, cy - ring))
+            cells.append((cx + dx, cy + ring))
+        for dy in range(-ring + 1, ring):
+            cells.append((cx - ring, cy + dy))
+            cells.append((cx + ring, cy + dy))
+        return cells